@@ -0,0 +1,382 @@
+"""Deterministic local stand-ins for the AWS and Google speech, translation and TTS clients.
+
+The fakes implement just the client calls the translators make, with latencies drawn from seeded
+log-normal distributions, and are placed in the `CLIENT_POOL` under the keys the translators look
+up. The real translator code therefore runs unchanged, without network access or cloud accounts.
+
+Speech recognition is simulated with energy-based endpointing: an utterance ends after
+`endpoint_seconds` of silence and is reported as a final transcript of generated words, roughly
+as many as a speaker says in that time. Utterance end times are measured on the wall clock from
+the first audio received, as a live service would see them, so latencies stay meaningful when a
+recording is replayed faster than real time. Endpointing itself runs on the audio time.
+"""
+
+import asyncio
+import math
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import cycle
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional
+
+from amazon_transcribe.model import Alternative, Result, Transcript, TranscriptEvent
+
+from sound_inputs.voice_activity_gate import EnergyVoiceActivityDetector
+from translators.client_pool import CLIENT_POOL
+
+WORDS_PER_SECOND = 2.5  # Speaking rate of the generated transcripts
+SPEECH_SECONDS_PER_CHAR = 0.06  # Duration of the synthesized speech per character of text
+CORPUS = (
+    'the quick brown fox jumps over the lazy dog while the audience listens to the talk about '
+    'live translation of speech into many languages at the same time'
+)
+
+
+@dataclass
+class LatencyModel:
+    """Log-normal latency distribution given by its median and the standard deviation of its logarithm."""
+
+    median: float = 0.0
+    spread: float = 0.0
+    seed: int = 0
+    _random: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._random = random.Random(self.seed)
+
+    @classmethod
+    def parse(cls, spec: str, seed: int = 0) -> 'LatencyModel':
+        """Parses `median` or `median:spread`, in seconds."""
+        median, _, spread = spec.partition(':')
+        return cls(float(median), float(spread or 0.0), seed)
+
+    def sample(self) -> float:
+        if self.median <= 0:
+            return 0.0
+        if self.spread <= 0:
+            return self.median
+        return self.median * math.exp(self._random.gauss(0.0, self.spread))
+
+
+@dataclass
+class ProviderLatencies:
+    """Latencies of the simulated services."""
+
+    stt: LatencyModel = field(default_factory=LatencyModel)  # From the end of an utterance to its final transcript
+    translate: LatencyModel = field(default_factory=LatencyModel)
+    tts_first_byte: LatencyModel = field(default_factory=LatencyModel)
+
+
+def synthesized_speech(text: str, sample_rate: int) -> bytes:
+    """Silent 16-bit mono PCM as long as the text would take to speak."""
+    return b'\x00\x00' * int(len(text) * SPEECH_SECONDS_PER_CHAR * sample_rate)
+
+
+def translated_text(text: str, language: str) -> str:
+    return f'{text} [{language}]'
+
+
+class FakeRecognizer:
+    """Finds utterances in the streamed audio and reports them as final transcripts after the STT latency."""
+
+    def __init__(
+        self,
+        latency: LatencyModel,
+        on_final: Callable[[str, float, float], None],
+        threshold_dbfs: float = -45.0,
+        endpoint_seconds: float = 0.5,
+    ):
+        """Initializes the FakeRecognizer instance.
+
+        Args:
+            latency (LatencyModel): Delay between the end of an utterance and its final transcript.
+            on_final (Callable[[str, float, float], None]): Receives transcript, start and end seconds.
+            threshold_dbfs (float): Level from which audio counts as speech.
+            endpoint_seconds (float): Silence that ends an utterance.
+        """
+        self._latency = latency
+        self._on_final = on_final
+        self._detector = EnergyVoiceActivityDetector(threshold_dbfs)
+        self._endpoint_seconds = endpoint_seconds
+        self._words = cycle(CORPUS.split())
+        self._stream_started_at: Optional[float] = None
+        self._audio_seconds = 0.0  # Audio received so far
+        self._last_speech_end = 0.0  # Audio time of the end of the last speech chunk
+        self._utterance_start: Optional[float] = None  # Wall-clock offsets from the first audio received
+        self._utterance_end = 0.0
+        self._speech_seconds = 0.0
+        self.pending = 0  # Utterances whose transcript has not been reported yet
+        self.utterances = 0
+
+    def feed(self, chunk: bytes, chunk_seconds: float) -> None:
+        now = time.perf_counter()
+        if self._stream_started_at is None:
+            self._stream_started_at = now
+        self._audio_seconds += chunk_seconds
+
+        if self._detector.is_speech(chunk):
+            if self._utterance_start is None:
+                self._utterance_start = now - self._stream_started_at
+                self._speech_seconds = 0.0
+            self._utterance_end = now - self._stream_started_at
+            self._last_speech_end = self._audio_seconds
+            self._speech_seconds += chunk_seconds
+        elif (
+            self._utterance_start is not None and self._audio_seconds - self._last_speech_end >= self._endpoint_seconds
+        ):
+            self._finish_utterance()
+
+    def flush(self) -> None:
+        """Reports an utterance that is still open, e.g. at the end of the stream."""
+        if self._utterance_start is not None:
+            self._finish_utterance()
+
+    def _finish_utterance(self) -> None:
+        assert self._utterance_start is not None
+        words = [next(self._words) for _ in range(max(1, round(self._speech_seconds * WORDS_PER_SECOND)))]
+        transcript = ' '.join(words).capitalize() + '.'
+        start, end = self._utterance_start, self._utterance_end
+        self._utterance_start = None
+        self.pending += 1
+        self.utterances += 1
+        asyncio.get_running_loop().call_later(self._latency.sample(), self._report, transcript, start, end)
+
+    def _report(self, transcript: str, start: float, end: float) -> None:
+        self.pending -= 1
+        self._on_final(transcript, start, end)
+
+
+class _EventStream:
+    """Async iterator over the events a fake streaming call produces, closed with `close()`."""
+
+    def __init__(self, recognizer_pending: Callable[[], int]):
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._pending = recognizer_pending
+        self._closing = False
+
+    def put(self, event: Any) -> None:
+        self._queue.put_nowait(event)
+        self._close_if_done()
+
+    def close(self) -> None:
+        self._closing = True
+        self._close_if_done()
+
+    def _close_if_done(self) -> None:
+        if self._closing and self._pending() == 0:
+            self._queue.put_nowait(None)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __anext__(self) -> Any:
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+# --- AWS ---
+
+
+class FakeTranscribeStreamingClient:
+    """Stands in for `amazon_transcribe.client.TranscribeStreamingClient`."""
+
+    def __init__(self, latencies: ProviderLatencies):
+        self._latencies = latencies
+        self.recognizers: List[FakeRecognizer] = []
+
+    async def start_stream_transcription(
+        self, *, media_sample_rate_hz: int, number_of_channels: int = 1, **_kwargs: Any
+    ) -> SimpleNamespace:
+        stream = _FakeTranscriptionStream(self._latencies.stt, media_sample_rate_hz * number_of_channels * 2)
+        self.recognizers.append(stream.recognizer)
+        return SimpleNamespace(input_stream=stream, output_stream=stream.events)
+
+
+class _FakeTranscriptionStream:
+    def __init__(self, latency: LatencyModel, bytes_per_second: int):
+        self.recognizer = FakeRecognizer(latency, self._report)
+        self.events = _EventStream(lambda: self.recognizer.pending)
+        self._bytes_per_second = bytes_per_second
+
+    async def send_audio_event(self, audio_chunk: bytes) -> None:
+        self.recognizer.feed(audio_chunk, len(audio_chunk) / self._bytes_per_second)
+
+    async def end_stream(self) -> None:
+        self.recognizer.flush()
+        self.events.close()
+
+    def _report(self, transcript: str, start: float, end: float) -> None:
+        alternative = Alternative(transcript=transcript, items=[], entities=None)
+        result = Result(
+            result_id=str(self.recognizer.utterances),
+            start_time=start,
+            end_time=end,
+            is_partial=False,
+            alternatives=[alternative],
+            channel_id='ch_0',
+        )
+        self.events.put(TranscriptEvent(transcript=Transcript(results=[result])))
+
+
+class FakeAWSTranslate:
+    """Stands in for the boto3 Translate client; blocks like the real call does."""
+
+    def __init__(self, latencies: ProviderLatencies):
+        self._latencies = latencies
+
+    def translate_text(self, Text: str, SourceLanguageCode: str, TargetLanguageCode: str) -> dict:
+        time.sleep(self._latencies.translate.sample())
+        return {'TranslatedText': translated_text(Text, TargetLanguageCode)}
+
+
+class _FakeAudioBody:
+    def __init__(self, audio: bytes):
+        self._audio = audio
+
+    def iter_chunks(self, chunk_size: int) -> Iterable[bytes]:
+        for offset in range(0, len(self._audio), chunk_size):
+            yield self._audio[offset : offset + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+
+class FakePolly:
+    """Stands in for the boto3 Polly client; blocks like the real call does."""
+
+    def __init__(self, latencies: ProviderLatencies, voice_ids: Iterable[str] = ()):
+        self._latencies = latencies
+        self._voice_ids = list(voice_ids)
+
+    def synthesize_speech(self, Text: str, SampleRate: str, **_kwargs: Any) -> dict:
+        time.sleep(self._latencies.tts_first_byte.sample())
+        return {'AudioStream': _FakeAudioBody(synthesized_speech(Text, int(SampleRate)))}
+
+    def describe_voices(self, **_kwargs: Any) -> dict:
+        return {'Voices': [{'Id': voice_id} for voice_id in self._voice_ids]}
+
+
+def install_aws_fakes(region: str, latencies: ProviderLatencies, voice_ids: Iterable[str] = ()) -> SimpleNamespace:
+    """Pools fake AWS clients under the keys `AWSTranslator` looks up; call before creating the translator."""
+    credentials = (os.environ.get('AWS_PROFILE'), os.environ.get('AWS_ACCESS_KEY_ID'))
+    fakes = SimpleNamespace(
+        transcribe=FakeTranscribeStreamingClient(latencies),
+        translate=FakeAWSTranslate(latencies),
+        polly=FakePolly(latencies, voice_ids),
+    )
+    CLIENT_POOL.get(('aws', 'transcribe', region, credentials), lambda: fakes.transcribe)
+    CLIENT_POOL.get(('aws', 'polly', region, credentials), lambda: fakes.polly)
+    CLIENT_POOL.get(('aws', 'translate', region, credentials), lambda: fakes.translate)
+    return fakes
+
+
+# --- Google ---
+
+
+class FakeSpeechAsyncClient:
+    """Stands in for `google.cloud.speech_v2.SpeechAsyncClient`."""
+
+    def __init__(self, latencies: ProviderLatencies):
+        self._latencies = latencies
+        self.recognizers: List[FakeRecognizer] = []
+        self._consumers: List[asyncio.Task[None]] = []
+
+    async def streaming_recognize(self, requests: AsyncIterator[Any]) -> _EventStream:
+        stream = _FakeRecognitionStream(self._latencies.stt)
+        self.recognizers.append(stream.recognizer)
+        self._consumers.append(asyncio.create_task(stream.consume(requests)))
+        return stream.events
+
+
+class _FakeRecognitionStream:
+    def __init__(self, latency: LatencyModel):
+        self.recognizer = FakeRecognizer(latency, self._report)
+        self.events = _EventStream(lambda: self.recognizer.pending)
+
+    async def consume(self, requests: AsyncIterator[Any]) -> None:
+        bytes_per_second = 0
+        async for request in requests:
+            if 'streaming_config' in request:
+                decoding = request.streaming_config.config.explicit_decoding_config
+                bytes_per_second = decoding.sample_rate_hertz * decoding.audio_channel_count * 2
+            elif request.audio:
+                self.recognizer.feed(request.audio, len(request.audio) / bytes_per_second)
+        self.recognizer.flush()
+        self.events.close()
+
+    def _report(self, transcript: str, start: float, end: float) -> None:
+        alternative = SimpleNamespace(transcript=transcript)
+        result = SimpleNamespace(
+            alternatives=[alternative], is_final=True, stability=0.0, result_end_offset=timedelta(seconds=end)
+        )
+        self.events.put(SimpleNamespace(results=[result]))
+
+
+class FakeGoogleTranslate:
+    """Stands in for `google.cloud.translate.TranslationServiceAsyncClient`."""
+
+    def __init__(self, latencies: ProviderLatencies):
+        self._latencies = latencies
+
+    async def translate_text(
+        self, *, contents: List[str], target_language_code: str, **_kwargs: Any
+    ) -> SimpleNamespace:
+        await asyncio.sleep(self._latencies.translate.sample())
+        translations = [
+            SimpleNamespace(translated_text=translated_text(text, target_language_code)) for text in contents
+        ]
+        return SimpleNamespace(translations=translations)
+
+
+class FakeGoogleTextToSpeech:
+    """Stands in for `google.cloud.texttospeech.TextToSpeechAsyncClient`."""
+
+    def __init__(self, latencies: ProviderLatencies, voice_ids: Iterable[str] = ()):
+        self._latencies = latencies
+        self._voice_ids = list(voice_ids)
+
+    async def synthesize_speech(self, *, input: Any, audio_config: Any, **_kwargs: Any) -> SimpleNamespace:
+        await asyncio.sleep(self._latencies.tts_first_byte.sample())
+        return SimpleNamespace(audio_content=synthesized_speech(input.text, audio_config.sample_rate_hertz))
+
+    async def streaming_synthesize(self, requests: AsyncIterator[Any]) -> AsyncIterator[SimpleNamespace]:
+        sample_rate = 24000
+        text = ''
+        async for request in requests:
+            if 'streaming_config' in request:
+                sample_rate = request.streaming_config.streaming_audio_config.sample_rate_hertz
+            else:
+                text += request.input.text
+        return self._stream_audio(synthesized_speech(text, sample_rate))
+
+    async def list_voices(self, **_kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(voices=[SimpleNamespace(name=voice_id) for voice_id in self._voice_ids])
+
+    async def _stream_audio(self, audio: bytes, chunk_size: int = 4800) -> AsyncIterator[SimpleNamespace]:
+        await asyncio.sleep(self._latencies.tts_first_byte.sample())
+        for offset in range(0, len(audio), chunk_size):
+            yield SimpleNamespace(audio_content=audio[offset : offset + chunk_size])
+
+
+def install_google_fakes(
+    region: str, latencies: ProviderLatencies, loop: asyncio.AbstractEventLoop, voice_ids: Iterable[str] = ()
+) -> SimpleNamespace:
+    """Pools fake Google clients for the loop under the keys `GoogleTranslator` looks up.
+
+    Call after creating the translator, which sets `GOOGLE_APPLICATION_CREDENTIALS`, and before starting it.
+    """
+    credentials = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
+    fakes = SimpleNamespace(
+        speech=FakeSpeechAsyncClient(latencies),
+        translate=FakeGoogleTranslate(latencies),
+        texttospeech=FakeGoogleTextToSpeech(latencies, voice_ids),
+    )
+    CLIENT_POOL.get(('google', 'speech', region, credentials), lambda: fakes.speech, loop)
+    CLIENT_POOL.get(('google', 'translate', credentials), lambda: fakes.translate, loop)
+    CLIENT_POOL.get(('google', 'texttospeech', credentials), lambda: fakes.texttospeech, loop)
+    return fakes
@@ -0,0 +1,114 @@
+"""Measures the frames per second the pymumble sound output buffers, encodes and packetizes.
+
+A burst of synthesized speech is handed to `SoundOutput.add_sound` in chunks of the size the
+Mumble output reads from the TTS stream, and the packets are then built back to back, without the
+real-time pacing of the sender thread and without a network. The Opus encoder can be replaced by a
+stand-in that returns a fixed payload, which leaves the cost of buffering and packet building.
+
+Run from the repository root, e.g.:
+
+    python -m benchmarks.mumble_frames --seconds 300 --encoder null
+"""
+
+import argparse
+import logging
+import math
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional, Sequence
+
+from pymumble_py3.constants import PYMUMBLE_AUDIO_PER_PACKET, PYMUMBLE_BANDWIDTH, PYMUMBLE_SAMPLERATE
+from pymumble_py3.soundoutput import SoundOutput
+
+from constants import CHUNK_LEN
+
+
+@dataclass
+class FramesResult:
+    audio_seconds: float
+    frames: int
+    add_seconds: float  # Time spent in add_sound
+    send_seconds: float  # Time spent building and handing over the packets
+
+    @property
+    def frames_per_second(self) -> float:
+        total = self.add_seconds + self.send_seconds
+        return self.frames / total if total else 0.0
+
+
+class _Connection:
+    """Stands in for the Mumble object; the packets are counted instead of sent."""
+
+    def __init__(self):
+        self.Log = logging.getLogger('PyMumble')
+        self.udp_active = False
+        self.positional = None
+        self.packets = 0
+
+    def send_voice(self, packet: bytes) -> None:
+        self.packets += 1
+
+
+class _NullEncoder:
+    """Returns a payload of the size of a 20 ms Opus frame at the default bandwidth, without encoding."""
+
+    bitrate = 0
+    payload = bytes(120)
+
+    def encode(self, pcm, frame_size: int) -> bytes:
+        return self.payload
+
+
+def synthetic_speech(seconds: float) -> bytes:
+    """A 16-bit mono tone; the content only matters to the real encoder."""
+    samples = int(seconds * PYMUMBLE_SAMPLERATE)
+    period = [int(8000 * math.sin(2 * math.pi * i / 80)) for i in range(80)]
+    tone = b''.join(value.to_bytes(2, 'little', signed=True) for value in period)
+    return (tone * (samples // 80 + 1))[: samples * 2]
+
+
+def measure(seconds: float, chunk_bytes: int = CHUNK_LEN, encoder: str = 'opus') -> FramesResult:
+    """Adds `seconds` of speech in chunks, then builds every packet of it."""
+    connection = _Connection()
+    sound_output = SoundOutput(connection, PYMUMBLE_AUDIO_PER_PACKET, PYMUMBLE_BANDWIDTH)
+    sound_output.set_default_codec(SimpleNamespace(opus=True))
+    if encoder == 'null':
+        sound_output.encoder = _NullEncoder()
+    pcm = synthetic_speech(seconds)
+
+    started_at = time.perf_counter()
+    for pos in range(0, len(pcm), chunk_bytes):
+        sound_output.add_sound(pcm[pos : pos + chunk_bytes])
+    add_seconds = time.perf_counter() - started_at
+
+    deadline = time.monotonic()
+    started_at = time.perf_counter()
+    while sound_output.has_audio():
+        sound_output.send_packet(deadline)
+        deadline += PYMUMBLE_AUDIO_PER_PACKET
+    send_seconds = time.perf_counter() - started_at
+
+    return FramesResult(seconds, connection.packets, add_seconds, send_seconds)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> FramesResult:
+    parser = argparse.ArgumentParser(description='Measures the frames per second of the pymumble sound output.')
+    parser.add_argument('--seconds', type=float, default=300.0, help='Length of the speech burst')
+    parser.add_argument('--chunk-bytes', type=int, default=CHUNK_LEN, help='Bytes per add_sound call')
+    parser.add_argument('--encoder', choices=('opus', 'null'), default='opus', help='null skips the Opus encoding')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs; the fastest one is reported')
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.seconds, args.chunk_bytes, args.encoder) for _ in range(max(1, args.repeat))]
+    result = max(runs, key=lambda run: run.frames_per_second)
+    print(
+        f'{result.frames} frames ({result.audio_seconds:.0f} s audio, {args.encoder} encoder): '
+        f'add {result.add_seconds * 1000:.0f} ms, send {result.send_seconds * 1000:.0f} ms, '
+        f'{result.frames_per_second:.0f} frames/s'
+    )
+    return result
+
+
+if __name__ == '__main__':
+    main()
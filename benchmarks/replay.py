@@ -0,0 +1,316 @@
+"""Replays a recording through the translation pipeline against local provider stand-ins.
+
+The recording is streamed by a `FileInput` into the real `AWSTranslator` or `GoogleTranslator`,
+whose cloud clients are replaced by the deterministic fakes of `fake_providers`, and the speech is
+consumed by `RecordingOutput`s. The report lists the latency percentiles of every pipeline stage,
+taken from the utterance traces, and the CPU time of the process, so changes to the translation
+pipeline, the translators and the outputs can be compared on any machine.
+
+Run from the repository root, e.g.:
+
+    PYTHONPATH=src python -m benchmarks.replay talk.wav --provider google --languages en-US fr-FR
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import tempfile
+import time
+import wave
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from benchmarks.fake_providers import (
+    FakeRecognizer,
+    LatencyModel,
+    ProviderLatencies,
+    install_aws_fakes,
+    install_google_fakes,
+)
+from config.model.config_models import (
+    AWSSettings,
+    GoogleSettings,
+    InputSettings,
+    LanguageSettings,
+    MumbleSettings,
+    OutputSettings,
+    QueueSettings,
+    SpeakerSettings,
+)
+from sound_inputs.file_input import FileInput
+from sound_outputs.recording_output import RecordingOutput
+from translation import SoundOutput, Translation, Translator
+from translators.aws_translator import AWSTranslator
+from translators.client_pool import CLIENT_POOL
+from translators.google_translator import GoogleTranslator
+from utils.utterance_trace import UtteranceTrace, UtteranceTracer
+
+LOGGER = logging.getLogger(__name__)
+
+STAGES = ('stt', 'translate', 'tts_first_byte', 'end_to_end', 'playback')
+DRAIN_TIMEOUT_SECONDS = 60.0  # Longest wait for the queued sentences after the recording ended
+TRAILING_SILENCE_SECONDS = 1.0  # Lets the endpointing finalize the last utterance
+OUTPUT_SAMPLE_RATE = 16000
+
+
+@dataclass
+class ReplayOptions:
+    recording: str
+    provider: str = 'aws'
+    languages: List[str] = field(default_factory=lambda: ['en-US', 'fr-FR'])
+    speed: float = 1.0  # Relative to real time; 0 replays as fast as possible
+    latencies: ProviderLatencies = field(default_factory=ProviderLatencies)
+    queue_settings: QueueSettings = field(default_factory=QueueSettings)
+    realtime_playback: bool = True
+    record_dir: Optional[str] = None
+
+
+@dataclass
+class Percentiles:
+    count: int = 0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+    @classmethod
+    def of(cls, values: Sequence[float]) -> 'Percentiles':
+        if not values:
+            return cls()
+        ordered = sorted(values)
+
+        def rank(q: float) -> float:
+            return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+        return cls(len(ordered), rank(0.5), rank(0.9), rank(0.99), ordered[-1])
+
+
+@dataclass
+class ReplayReport:
+    provider: str
+    languages: List[str]
+    audio_seconds: float
+    wall_seconds: float
+    cpu_seconds: float
+    utterances: int
+    stages: Dict[str, Percentiles]
+    sentences: Dict[str, Dict[str, int]]  # Per language: sentences by how they ended, e.g. played or dropped
+
+    @property
+    def cpu_utilization(self) -> float:
+        """CPU time per wall-clock time; above 1.0, more than one core was busy."""
+        return self.cpu_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f'{self.provider} replay of {self.audio_seconds:.1f} s audio into {", ".join(self.languages)}: '
+            f'{self.utterances} utterances in {self.wall_seconds:.1f} s, '
+            f'CPU {self.cpu_seconds:.2f} s ({self.cpu_utilization * 100:.0f} %)',
+            f'{"stage":<16}{"count":>7}{"p50 ms":>10}{"p90 ms":>10}{"p99 ms":>10}{"max ms":>10}',
+        ]
+        for stage, p in self.stages.items():
+            lines.append(
+                f'{stage:<16}{p.count:>7}{p.p50 * 1000:>10.0f}{p.p90 * 1000:>10.0f}{p.p99 * 1000:>10.0f}'
+                f'{p.max * 1000:>10.0f}'
+            )
+        for language, statuses in self.sentences.items():
+            lines.append(f'{language}: ' + ', '.join(f'{count} {status}' for status, count in sorted(statuses.items())))
+        return '\n'.join(lines)
+
+
+async def replay(options: ReplayOptions) -> ReplayReport:
+    """Replays the recording through the pipeline with fake providers and reports the stage latencies."""
+    CLIENT_POOL.clear()
+    input_settings = InputSettings(None, None, OUTPUT_SAMPLE_RATE, 1)
+    sound_input = FileInput(options.recording, input_settings, options.speed, TRAILING_SILENCE_SECONDS, hold_open=True)
+    input_settings = replace(
+        input_settings, input_sample_rate=sound_input.sample_rate, input_channels=sound_input.channels
+    )
+    output_settings = OutputSettings(
+        None, OUTPUT_SAMPLE_RATE, 1024, SpeakerSettings(None, None), MumbleSettings('', 0, {})
+    )
+    target_languages = {language: LanguageSettings(f'Voice-{language}', False) for language in options.languages}
+    voice_ids = [settings.voice_id for settings in target_languages.values()]
+    tracer = UtteranceTracer('replay', history=1_000_000)
+
+    translator: Translator
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if options.provider == 'aws':
+            fakes = install_aws_fakes('eu-central-1', options.latencies, voice_ids)
+            aws_settings = AWSSettings('eu-central-1', 'de-DE', False, target_languages)
+            translator = AWSTranslator(
+                aws_settings, input_settings, output_settings, queue_settings=options.queue_settings, tracer=tracer
+            )
+            recognizers = fakes.transcribe.recognizers
+        elif options.provider == 'google':
+            # The translator reads the project of the credentials file.
+            credentials_path = Path(temp_dir) / 'credentials.json'
+            credentials_path.write_text(json.dumps({'project_id': 'replay-benchmark'}))
+            google_settings = GoogleSettings(str(credentials_path), 'de-DE', False, target_languages)
+            translator = GoogleTranslator(
+                google_settings, input_settings, output_settings, queue_settings=options.queue_settings, tracer=tracer
+            )
+            fakes = install_google_fakes(
+                google_settings.region, options.latencies, asyncio.get_running_loop(), voice_ids
+            )
+            recognizers = fakes.speech.recognizers
+        else:
+            raise ValueError(f'Unsupported provider: {options.provider}')
+
+        outputs: Dict[str, SoundOutput] = {
+            language: RecordingOutput(
+                output_settings,
+                str(Path(options.record_dir) / f'{language}.wav') if options.record_dir else None,
+                options.realtime_playback,
+            )
+            for language in options.languages
+        }
+        translation = Translation(translator, sound_input, outputs)
+
+        cpu_started_at = time.process_time()
+        started_at = time.perf_counter()
+        run_task = asyncio.create_task(translation.run_async())
+        await sound_input.finished.wait()
+        await _wait_until_drained(translator, recognizers, tracer)
+        await translation.stop_async()
+        await run_task
+        wall_seconds = time.perf_counter() - started_at
+        cpu_seconds = time.process_time() - cpu_started_at
+
+    return ReplayReport(
+        options.provider,
+        options.languages,
+        sound_input.duration_seconds or 0.0,
+        wall_seconds,
+        cpu_seconds,
+        sum(recognizer.utterances for recognizer in recognizers),
+        _stage_percentiles(tracer.traces),
+        _sentence_statuses(tracer.traces),
+    )
+
+
+async def _wait_until_drained(translator: Translator, recognizers: List[FakeRecognizer], tracer: UtteranceTracer):
+    """Waits until every utterance was recognized and every queued sentence has ended."""
+    deadline = time.perf_counter() + DRAIN_TIMEOUT_SECONDS
+    while time.perf_counter() < deadline:
+        utterances = sum(recognizer.utterances for recognizer in recognizers)
+        recognized = all(recognizer.pending == 0 for recognizer in recognizers)
+        if recognized and len(tracer.traces) >= utterances and _queues_idle(translator):
+            return
+        await asyncio.sleep(0.05)
+    LOGGER.warning(f'Pipeline did not drain within {DRAIN_TIMEOUT_SECONDS:.0f} s; reporting what completed.')
+
+
+def _queues_idle(translator: Translator) -> bool:
+    queues = translator.metrics().get('queues', {})
+    return all(stats['queue_depth'] == 0 and stats['in_flight'] == 0 for stats in queues.values())
+
+
+def _stage_percentiles(traces: List[UtteranceTrace]) -> Dict[str, Percentiles]:
+    values: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    for trace in traces:
+        if trace.audio_captured is not None:
+            values['stt'].append(trace.final_transcript - trace.audio_captured)
+        for language, language_trace in trace.languages.items():
+            stages = {
+                'translate': (trace.final_transcript, language_trace.translation_returned),
+                'tts_first_byte': (language_trace.translation_returned, language_trace.tts_first_byte),
+                'playback': (language_trace.playback_start, language_trace.playback_end),
+            }
+            for stage, (start, end) in stages.items():
+                if start is not None and end is not None:
+                    values[stage].append(end - start)
+            latency = trace.latency(language)
+            if latency is not None:
+                values['end_to_end'].append(latency)
+    return {stage: Percentiles.of(stage_values) for stage, stage_values in values.items()}
+
+
+def _sentence_statuses(traces: List[UtteranceTrace]) -> Dict[str, Dict[str, int]]:
+    statuses: Dict[str, Dict[str, int]] = {}
+    for trace in traces:
+        for language, language_trace in trace.languages.items():
+            language_statuses = statuses.setdefault(language, {})
+            language_statuses[language_trace.status] = language_statuses.get(language_trace.status, 0) + 1
+    return statuses
+
+
+def write_synthetic_recording(path: str, seconds: float, sample_rate: int = 16000, seed: int = 0) -> None:
+    """Writes a mono WAV of tone bursts of 1.5 to 4 seconds separated by pauses of 0.6 to 1.5 seconds."""
+    rng = random.Random(seed)
+    period = sample_rate // 200
+    # One period of a 200 Hz triangle wave at about -12 dBFS
+    tone_period = b''.join(
+        int(8000 * (1 - abs(4 * i / period - 2))).to_bytes(2, 'little', signed=True) for i in range(period)
+    )
+    frames = bytearray()
+    total_frames = int(seconds * sample_rate)
+    while len(frames) < total_frames * 2:
+        burst = int(rng.uniform(1.5, 4.0) * sample_rate) // period
+        pause = int(rng.uniform(0.6, 1.5) * sample_rate)
+        frames += tone_period * burst + b'\x00\x00' * pause
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(bytes(frames[: total_frames * 2]))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> ReplayReport:
+    parser = argparse.ArgumentParser(description='Replays a recording through the pipeline with fake providers.')
+    parser.add_argument('recording', nargs='?', help='16-bit PCM WAV file; a synthetic recording is used if omitted')
+    parser.add_argument('--synthetic-seconds', type=float, default=60.0, help='Length of the synthetic recording')
+    parser.add_argument('--provider', choices=('aws', 'google'), default='aws')
+    parser.add_argument('--languages', nargs='+', default=['en-US', 'fr-FR'])
+    parser.add_argument('--speed', type=float, default=1.0, help='Replay speed; 0 replays as fast as possible')
+    parser.add_argument('--stt-latency', default='0.3:0.3', help='Median[:log-spread] seconds, e.g. 0.3:0.3')
+    parser.add_argument('--translate-latency', default='0.15:0.3')
+    parser.add_argument('--tts-latency', default='0.2:0.3', help='Time to the first synthesized audio')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--pipeline-depth', type=int, default=QueueSettings.pipeline_depth)
+    parser.add_argument('--max-queue-size', type=int, default=QueueSettings.max_queue_size)
+    parser.add_argument('--fast-playback', action='store_true', help='Do not pace playback in real time')
+    parser.add_argument('--record-dir', help='Directory the synthesized speech is written to, per language')
+    parser.add_argument('--json', help='File the report is written to as JSON')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    latencies = ProviderLatencies(
+        LatencyModel.parse(args.stt_latency, args.seed),
+        LatencyModel.parse(args.translate_latency, args.seed + 1),
+        LatencyModel.parse(args.tts_latency, args.seed + 2),
+    )
+    queue_settings = QueueSettings(max_queue_size=args.max_queue_size, pipeline_depth=args.pipeline_depth)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        recording = args.recording
+        if recording is None:
+            recording = str(Path(temp_dir) / 'synthetic.wav')
+            write_synthetic_recording(recording, args.synthetic_seconds, seed=args.seed)
+        options = ReplayOptions(
+            recording,
+            args.provider,
+            args.languages,
+            args.speed,
+            latencies,
+            queue_settings,
+            not args.fast_playback,
+            args.record_dir,
+        )
+        report = asyncio.run(replay(options))
+
+    print(report.format())
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps({**asdict(report), 'cpu_utilization': report.cpu_utilization}, indent=2), encoding='utf-8'
+        )
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import socket
+import threading
+import time
+
+from .constants import *
+
+
+class AudioSender(threading.Thread):
+    """
+    Thread sending the audio packets of a SoundOutput at a steady cadence.
+    Packets are due at fixed deadlines on the monotonic clock, one audio_per_packet apart,
+    independently of the control messages treated by the main Mumble thread.
+    """
+
+    def __init__(self, sound_output):
+        threading.Thread.__init__(self, name='PyMumbleAudioSender', daemon=True)
+        self.sound_output = sound_output
+        self.Log = sound_output.Log
+
+        self.wakeup = threading.Event()  # set when audio is added or the sender must stop
+        self.stopped = False
+
+        # packets sent, packets sent later than PYMUMBLE_AUDIO_LATE_TOLERANCE after their deadline,
+        # resyncs of the deadlines after a stall, and the largest and latest delay after a deadline in sec
+        self.stats = {'packets': 0, 'late': 0, 'resync': 0, 'max_drift': 0.0, 'last_drift': 0.0}
+
+    def notify(self):
+        """Wake the sender up, new audio is available"""
+        if not self.wakeup.is_set():  # setting the event takes its lock, checking it does not
+            self.wakeup.set()
+
+    def stop(self):
+        self.stopped = True
+        self.wakeup.set()
+
+    def run(self):
+        deadline = None  # when the next packet is due, on the monotonic clock
+
+        while not self.stopped:
+            self.wakeup.clear()
+            if not self.sound_output.has_audio():  # idle until some audio is added
+                deadline = None
+                self.wakeup.wait()
+                continue
+
+            now = time.monotonic()
+            if deadline is None:  # start of a new sequence of packets
+                deadline = now
+            elif deadline > now:
+                time.sleep(deadline - now)
+                now = time.monotonic()
+
+            audio_per_packet = self.sound_output.audio_per_packet
+            self.record_drift(now - deadline)
+            if now - deadline > PYMUMBLE_AUDIO_MAX_DRIFT_PACKETS * audio_per_packet:  # stalled, no catch-up burst
+                self.stats['resync'] += 1
+                deadline = now
+
+            try:
+                self.sound_output.send_packet(deadline)
+            except socket.error as e:  # the Mumble thread notices the disconnection
+                self.Log.debug('audio packet not sent: %s', e)
+            deadline += audio_per_packet
+
+    def record_drift(self, drift):
+        self.stats['packets'] += 1
+        self.stats['last_drift'] = drift
+        if drift > self.stats['max_drift']:
+            self.stats['max_drift'] = drift
+        if drift > PYMUMBLE_AUDIO_LATE_TOLERANCE:
+            self.stats['late'] += 1
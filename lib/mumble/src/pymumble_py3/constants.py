@@ -11,8 +11,11 @@ PYMUMBLE_VERSION = '1.6.1'
 PYMUMBLE_CONNECTION_RETRY_INTERVAL = 10  # in sec
 PYMUMBLE_AUDIO_PER_PACKET = float(20) / 1000  # size of one audio packet in sec
 PYMUMBLE_BANDWIDTH = 50 * 1000  # total outgoing bitrate in bit/seconds
+PYMUMBLE_AUDIO_BUFFER_SIZE = 10  # initial size of the outgoing audio buffer in sec, it grows with longer bursts
 PYMUMBLE_LOOP_RATE = 0.01  # pause done between two iteration of the main loop of the mumble thread, in sec
-# should be small enough to manage the audio output, so smaller than PYMUMBLE_AUDIO_PER_PACKET
+# the audio is sent by its own thread, so the loop rate only bounds the delay of the queued commands
+PYMUMBLE_AUDIO_LATE_TOLERANCE = float(5) / 1000  # an audio packet sent later than that after its deadline is late, in sec
+PYMUMBLE_AUDIO_MAX_DRIFT_PACKETS = 2  # the packet cadence restarts after a stall longer than that many packets
 
 # ============================================================================
 # Constants
@@ -23,12 +26,16 @@ PYMUMBLE_OS_STRING = 'PyMumble %s' % PYMUMBLE_VERSION
 PYMUMBLE_OS_VERSION_STRING = 'Python %s - %s %s' % (sys.version, platform.system(), platform.release())
 
 PYMUMBLE_PING_DELAY = 10  # interval between 2 pings in sec
+PYMUMBLE_UDP_PING_DELAY = 5  # interval between 2 UDP pings in sec
+PYMUMBLE_UDP_TIMEOUT = 12  # voice falls back to the TCP tunnel when nothing was received over UDP for that long, in sec
+PYMUMBLE_UDP_RESYNC_DELAY = 5  # minimum interval between 2 crypto resync requests, in sec
 
 PYMUMBLE_SAMPLERATE = 16000  # in hz
 
 PYMUMBLE_SEQUENCE_DURATION = float(10) / 1000  # in sec
 PYMUMBLE_SEQUENCE_RESET_INTERVAL = 5  # in sec
 PYMUMBLE_READ_BUFFER_SIZE = 4096  # how much bytes to read at a time from the control socket, in bytes
+PYMUMBLE_UDP_BUFFER_SIZE = 2048  # maximum size of a UDP voice packet, in bytes
 
 # client connection state
 PYMUMBLE_CONN_STATE_NOT_CONNECTED = 0
@@ -2,19 +2,41 @@
 OCB2 crypto, broadly following the implementation from Mumble
 """
 
+import os
 import struct
 import time
-from math import ceil
 from typing import Tuple
 
-from Crypto.Cipher import AES
-from Crypto.Random import get_random_bytes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 AES_BLOCK_SIZE = 128 // 8  # Number of bytes in a block
 AES_KEY_SIZE_BITS = 128
 AES_KEY_SIZE_BYTES = AES_KEY_SIZE_BITS // 8
-SHIFTBITS = 63  # Shift size for S2 operation
-MAX64 = (1 << 64) - 1  # Maximum value of uint64
+AES_BLOCK_BITS = AES_BLOCK_SIZE * 8
+SHIFTBITS = AES_BLOCK_BITS - 1  # Shift size of the carry bit in the S2 operation
+MAX128 = (1 << AES_BLOCK_BITS) - 1  # Maximum value of a block as uint128
+
+
+def get_random_bytes(n: int) -> bytes:
+    return os.urandom(n)
+
+
+class AesEcb:
+    """
+    AES-ECB block cipher with the `encrypt`/`decrypt` interface used by the `ocb_*` functions.
+    Input must be a multiple of AES_BLOCK_SIZE.
+    """
+
+    def __init__(self, key: bytes):
+        cipher = Cipher(algorithms.AES(key), modes.ECB())
+        self._encryptor = cipher.encryptor()
+        self._decryptor = cipher.decryptor()
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._encryptor.update(data)
+
+    def decrypt(self, data: bytes) -> bytes:
+        return self._decryptor.update(data)
 
 
 class EncryptFailedException(Exception):
@@ -47,7 +69,7 @@ class CryptStateOCB2:
     """
 
     _raw_key: bytes  # AES key; access through `raw_key` property
-    _aes: object  # pycrypto AES cipher object, replaced when `raw_key` is changed
+    _aes: AesEcb  # AES-ECB cipher object, replaced when `raw_key` is changed
     _encrypt_iv: bytearray  # IV for encryption, access through `encrypt_iv` property
     _decrypt_iv: bytearray  # IV for decryption, access through `decrypt_iv` property
     decrypt_history: bytearray  # History of previous decrypt_iv values
@@ -65,9 +87,9 @@ class CryptStateOCB2:
         self.tLastGood = 0
 
         self._raw_key = get_random_bytes(AES_KEY_SIZE_BYTES)
-        self._encrypt_iv = get_random_bytes(AES_BLOCK_SIZE)
-        self._decrypt_iv = get_random_bytes(AES_BLOCK_SIZE)
-        self._aes = None
+        self._encrypt_iv = bytearray(get_random_bytes(AES_BLOCK_SIZE))
+        self._decrypt_iv = bytearray(get_random_bytes(AES_BLOCK_SIZE))
+        self._aes = AesEcb(self._raw_key)
         self.decrypt_history = bytearray(0x100)
 
     @property
@@ -79,7 +101,7 @@ class CryptStateOCB2:
         if len(rkey) != AES_KEY_SIZE_BYTES:
             raise Exception('raw_key has wrong length')
         self._raw_key = bytes(rkey)
-        self._aes = AES.new(key=self.raw_key, mode=AES.MODE_ECB)
+        self._aes = AesEcb(self.raw_key)
 
     @property
     def encrypt_iv(self) -> bytearray:
@@ -232,7 +254,7 @@ class CryptStateOCB2:
 
 
 def ocb_encrypt(
-    aes: object,
+    aes: AesEcb,
     plain: bytes,
     nonce: bytes,
     *,
@@ -242,6 +264,9 @@ def ocb_encrypt(
     Encrypt a message.
     This should be called from CryptStateOCB2.encrypt() and not independently.
 
+    The offsets of all full blocks are computed up front, so the full blocks are
+    encrypted with a single AES-ECB call and XORed as one integer.
+
     Args:
         aes: AES-ECB cipher object
         plain: The plaintext bytes to be encrypted
@@ -253,45 +278,38 @@ def ocb_encrypt(
     Raises:
         EncryptFailedException if `source` would result in a vulnerable packet
     """
-    delta = aes.encrypt(nonce)
-    checksum = bytes(AES_BLOCK_SIZE)
-    plain_block = b''
-
-    pos = 0
-    encrypted = bytearray(ceil(len(plain) / AES_BLOCK_SIZE) * AES_BLOCK_SIZE)
-    while len(plain) - pos > AES_BLOCK_SIZE:
-        plain_block = plain[pos : pos + AES_BLOCK_SIZE]
-        delta = S2(delta)
-        encrypted_block = xor(delta, aes.encrypt(xor(delta, plain_block)))
-        checksum = xor(checksum, plain_block)
-
-        encrypted[pos : pos + AES_BLOCK_SIZE] = encrypted_block
-        pos += AES_BLOCK_SIZE
+    nb_blocks = max(0, (len(plain) - 1) // AES_BLOCK_SIZE)  # full blocks, the last block is always handled apart
+    pos = nb_blocks * AES_BLOCK_SIZE
+    offsets, delta = ocb_offsets(to_int(aes.encrypt(nonce)), nb_blocks)
 
     # Counter-cryptanalysis described in section 9 of https://eprint.iacr.org/2019/311
-    # For an attack, the second to last block (i.e. the last iteration of this loop)
+    # For an attack, the second to last block (i.e. the last full block)
     # must be all 0 except for the last byte (which may be 0 - 128).
-    if not insecure and bytes(plain_block[:-1]) == bytes(AES_BLOCK_SIZE - 1):
+    if not insecure and nb_blocks and plain[pos - AES_BLOCK_SIZE : pos - 1] == bytes(AES_BLOCK_SIZE - 1):
         raise EncryptFailedException('Insecure input block: ' + 'see section 9 of https://eprint.iacr.org/2019/311')
 
-    len_remaining = len(plain) - pos
-    delta = S2(delta)
-    pad_in = struct.pack('>QQ', 0, len_remaining * 8)
-    pad = aes.encrypt(xor(pad_in, delta))
-    plain_block = plain[pos:] + pad[len_remaining - AES_BLOCK_SIZE :]
+    encrypted = bytearray(len(plain))
+    checksum = 0
+    if nb_blocks:
+        full = to_int(plain[:pos])
+        encrypted_full = to_int(aes.encrypt(to_bytes(full ^ offsets, pos))) ^ offsets
+        encrypted[:pos] = to_bytes(encrypted_full, pos)
+        checksum = fold_blocks(full, nb_blocks)
 
-    checksum = xor(checksum, plain_block)
-    encrypted_block = xor(pad, plain_block)
-    encrypted[pos:] = encrypted_block
+    len_remaining = len(plain) - pos
+    pad = aes.encrypt(to_bytes(delta ^ (len_remaining * 8), AES_BLOCK_SIZE))
+    plain_block = to_int(plain[pos:] + pad[len_remaining:])
+    checksum ^= plain_block
+    encrypted[pos:] = to_bytes(plain_block ^ to_int(pad), AES_BLOCK_SIZE)[:len_remaining]
 
-    delta = xor(delta, S2(delta))
-    tag = aes.encrypt(xor(delta, checksum))
+    delta ^= S2_int(delta)
+    tag = aes.encrypt(to_bytes(delta ^ checksum, AES_BLOCK_SIZE))
 
-    return encrypted, tag
+    return bytes(encrypted), tag
 
 
 def ocb_decrypt(
-    aes: object,
+    aes: AesEcb,
     encrypted: bytes,
     nonce: bytes,
     len_plain: int,
@@ -302,6 +320,8 @@ def ocb_decrypt(
     Decrypt a message.
     This should be called from CryptStateOCB2.decrypt() and not independently.
 
+    The full blocks are decrypted with a single AES-ECB call, like in `ocb_encrypt`.
+
     Args:
         aes: AES-ECB cipher object
         encrypted: The ciphertext bytes to be decrypted
@@ -317,29 +337,23 @@ def ocb_decrypt(
             - packet is out of order or duplicate
             - packet was could have been tampered with
     """
-    delta = aes.encrypt(nonce)
-    checksum = bytes(AES_BLOCK_SIZE)
-    plain = bytearray(len_plain)
-
-    pos = 0
-    while len_plain - pos > AES_BLOCK_SIZE:
-        encrypted_block = encrypted[pos : pos + AES_BLOCK_SIZE]
-        delta = S2(delta)
-        tmp = aes.decrypt(xor(delta, encrypted_block))
-        plain_block = xor(delta, tmp)
-        checksum = xor(checksum, plain_block)
+    nb_blocks = max(0, (len_plain - 1) // AES_BLOCK_SIZE)
+    pos = nb_blocks * AES_BLOCK_SIZE
+    offsets, delta = ocb_offsets(to_int(aes.encrypt(nonce)), nb_blocks)
 
-        plain[pos : pos + AES_BLOCK_SIZE] = plain_block
-        pos += AES_BLOCK_SIZE
+    plain = bytearray(len_plain)
+    checksum = 0
+    if nb_blocks:
+        full = to_int(aes.decrypt(to_bytes(to_int(encrypted[:pos]) ^ offsets, pos))) ^ offsets
+        plain[:pos] = to_bytes(full, pos)
+        checksum = fold_blocks(full, nb_blocks)
 
     len_remaining = len_plain - pos
-    delta = S2(delta)
-    pad_in = struct.pack('>QQ', 0, len_remaining * 8)
-    pad = aes.encrypt(xor(pad_in, delta))
-    encrypted_zeropad = encrypted[pos:] + bytes(AES_BLOCK_SIZE - len_remaining)
-    plain_block = xor(encrypted_zeropad, pad)
+    pad = aes.encrypt(to_bytes(delta ^ (len_remaining * 8), AES_BLOCK_SIZE))
+    encrypted_zeropad = encrypted[pos:len_plain] + bytes(AES_BLOCK_SIZE - len_remaining)
+    plain_block = to_bytes(to_int(encrypted_zeropad) ^ to_int(pad), AES_BLOCK_SIZE)
 
-    checksum = xor(checksum, plain_block)
+    checksum ^= to_int(plain_block)
     plain[pos:] = plain_block[:len_remaining]
 
     # Counter-cryptanalysis described in section 9 of https://eprint.iacr.org/2019/311
@@ -347,12 +361,40 @@ def ocb_decrypt(
     # With a bit of luck (or many packets), smaller values than 128 (i.e. non-full blocks) are also
     # feasible, so we check `plain_block` instead of `plain`.
     # Since our `len` only ever modifies the last byte, we simply check all remaining ones.
-    if not insecure and plain_block[:-1] == delta[:-1]:
+    if not insecure and plain_block[:-1] == to_bytes(delta, AES_BLOCK_SIZE)[:-1]:
         raise DecryptFailedException('Possibly tampered/able block, discarding.')
 
-    delta = xor(delta, S2(delta))
-    tag = aes.encrypt(xor(delta, checksum))
-    return plain, tag
+    delta ^= S2_int(delta)
+    tag = aes.encrypt(to_bytes(delta ^ checksum, AES_BLOCK_SIZE))
+    return bytes(plain), tag
+
+
+def ocb_offsets(delta: int, nb_blocks: int) -> Tuple[int, int]:
+    """
+    Compute the offsets of the full blocks of a message
+
+    Args:
+        delta: The encrypted nonce
+        nb_blocks: The number of full blocks
+
+    Returns:
+        The offsets of all full blocks concatenated into one integer,
+        and the offset of the last block
+    """
+    offsets = 0
+    for _ in range(nb_blocks):
+        delta = S2_int(delta)
+        offsets = (offsets << AES_BLOCK_BITS) | delta
+    return offsets, S2_int(delta)
+
+
+def fold_blocks(blocks: int, nb_blocks: int) -> int:
+    """XOR all blocks of `blocks` together, halving the number of blocks at each step"""
+    while nb_blocks > 1:
+        half_bits = (nb_blocks // 2) * AES_BLOCK_BITS
+        blocks = (blocks >> half_bits) ^ (blocks & ((1 << half_bits) - 1))
+        nb_blocks -= nb_blocks // 2
+    return blocks
 
 
 def increment_iv(iv: bytearray, start: int = 0) -> bytearray:
@@ -371,12 +413,21 @@ def decrement_iv(iv: bytearray, start: int = 0) -> bytearray:
     return iv
 
 
+def to_int(data: bytes) -> int:
+    return int.from_bytes(data, 'big')
+
+
+def to_bytes(value: int, length: int) -> bytes:
+    return value.to_bytes(length, 'big')
+
+
 def xor(a: bytes, b: bytes) -> bytes:
-    return bytes(aa ^ bb for aa, bb in zip(a, b))
+    return to_bytes(to_int(a[: len(b)]) ^ to_int(b[: len(a)]), min(len(a), len(b)))
+
+
+def S2_int(block: int) -> int:
+    return ((block << 1) & MAX128) ^ (0x87 if block >> SHIFTBITS else 0)
 
 
 def S2(block: bytes) -> bytes:
-    ll, uu = struct.unpack('>QQ', block)
-    carry = ll >> 63
-    block = struct.pack('>QQ', ((ll << 1) | (uu >> 63)) & MAX64, ((uu << 1) ^ (carry * 0x87)) & MAX64)
-    return block
+    return to_bytes(S2_int(to_int(block)), AES_BLOCK_SIZE)
@@ -9,6 +9,7 @@ import time
 
 from . import blobs, callbacks, channels, commands, mumble_pb2, soundoutput, tools, users
 from .constants import *
+from .crypto import CryptStateOCB2, DecryptFailedException, EncryptFailedException
 from .errors import *
 
 
@@ -43,7 +44,6 @@ class Mumble(threading.Thread):
         stereo=enable stereo transmission
         debug=if True, send debugging messages (lot of...) to the stdout
         """
-        # TODO: use UDP audio
         threading.Thread.__init__(self)
 
         if tokens is None:
@@ -99,7 +99,10 @@ class Mumble(threading.Thread):
 
         self.connected = PYMUMBLE_CONN_STATE_NOT_CONNECTED
         self.control_socket = None
-        self.media_socket = None  # Not implemented - for UDP media
+        self.control_lock = threading.Lock()  # the control socket is written by the Mumble and the audio threads
+        self.media_socket = None  # UDP socket for the voice, opened once the server sent the crypto keys
+        self.crypt = None  # OCB2-AES state of the UDP voice channel
+        self.udp_lock = threading.Lock()  # guards the UDP socket and the encryption state
 
         self.bandwidth = PYMUMBLE_BANDWIDTH  # reset the outgoing bandwidth to it's default before connecting
         self.server_max_bandwidth = None
@@ -120,6 +123,7 @@ class Mumble(threading.Thread):
 
         self.receive_buffer = bytes()  # initialize the control connection input buffer
         self.ping_stats = {'last_rcv': 0, 'time_send': 0, 'nb': 0, 'avg': 40.0, 'var': 0.0}  # Set / reset ping stats
+        self.udp_stats = {'last_rcv': 0, 'last_resync': 0, 'resync': 0, 'nb': 0, 'avg': 0.0, 'var': 0.0}
 
     def run(self):
         """Connect to the server and start the loop in its thread.  Retry if requested"""
@@ -142,6 +146,8 @@ class Mumble(threading.Thread):
                 self.loop()
             except socket.error:
                 self.connected = PYMUMBLE_CONN_STATE_NOT_CONNECTED
+            self.sound_output.stop_sending()
+            self.close_udp()
 
             if not self.reconnect or not self.parent_thread.is_alive():
                 self.callbacks(PYMUMBLE_CLBK_DISCONNECTED)
@@ -211,14 +217,16 @@ class Mumble(threading.Thread):
         Main loop
         waiting for a message from the server for maximum self.loop_rate time
         take care of sending the ping
+        take care of checking the UDP voice channel, falling back to the TCP tunnel when it is down
         take care of sending the queued commands to the server
-        check on every iteration for outgoing sound
         check for disconnection
+        the outgoing sound is sent by the audio thread of the sound output
         """
         self.Log.debug('entering loop')
         self.exit = False
 
         last_ping = time.time()  # keep track of the last ping time
+        last_udp_ping = time.time()  # keep track of the last UDP ping time
 
         # loop as long as the connection and the parent thread are alive
         while (
@@ -230,18 +238,25 @@ class Mumble(threading.Thread):
                 self.ping()
                 last_ping = time.time()
 
+            if self.media_socket is not None and last_udp_ping + PYMUMBLE_UDP_PING_DELAY <= time.time():
+                self.check_udp()
+                self.udp_ping()
+                last_udp_ping = time.time()
+
             if self.connected == PYMUMBLE_CONN_STATE_CONNECTED:
                 while self.commands.is_cmd():
                     self.treat_command(
                         self.commands.pop_cmd()
                     )  # send the commands coming from the application to the server
 
-                self.sound_output.send_audio()  # send outgoing audio if available
-
+            sockets = [self.control_socket] if self.media_socket is None else [self.control_socket, self.media_socket]
             (rlist, wlist, xlist) = select.select(
-                [self.control_socket], [], [self.control_socket], self.loop_rate
+                sockets, [], [self.control_socket], self.loop_rate
             )  # wait for a socket activity
 
+            if self.media_socket is not None and self.media_socket in rlist:  # voice or ping received over UDP
+                self.read_media_messages()
+
             if self.control_socket in rlist:  # something to be read on the control socket
                 self.read_control_messages()
             elif self.control_socket in xlist:  # socket was closed
@@ -255,6 +270,14 @@ class Mumble(threading.Thread):
         ping.tcp_ping_avg = self.ping_stats['avg']
         ping.tcp_ping_var = self.ping_stats['var']
         ping.tcp_packets = self.ping_stats['nb']
+        if self.crypt is not None:
+            ping.good = self.crypt.uiGood
+            ping.late = self.crypt.uiLate
+            ping.lost = self.crypt.uiLost
+            ping.resync = self.udp_stats['resync']
+            ping.udp_ping_avg = self.udp_stats['avg']
+            ping.udp_ping_var = self.udp_stats['var']
+            ping.udp_packets = self.udp_stats['nb']
 
         self.Log.debug('sending: ping: %s', ping)
         self.send_message(PYMUMBLE_MSG_TYPES_PING, ping)
@@ -281,23 +304,149 @@ class Mumble(threading.Thread):
         self.ping_stats['avg'] = new_avg
         self.ping_stats['nb'] += 1
 
+    def setup_udp(self, key, client_nonce, server_nonce):
+        """Open the UDP voice channel with the keys of a CryptSetup message, and check it with a first ping"""
+        crypt = CryptStateOCB2()
+        crypt.set_key(key, client_nonce, server_nonce)
+
+        try:
+            server_info = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_DGRAM)
+            media_socket = socket.socket(server_info[0][0], socket.SOCK_DGRAM)
+            media_socket.setblocking(False)
+            media_socket.connect(server_info[0][4])
+        except socket.error as e:
+            self.Log.warning('UDP socket could not be opened, voice stays on the TCP tunnel: %s', e)
+            return
+
+        self.close_udp()
+        with self.udp_lock:
+            self.crypt = crypt
+            self.media_socket = media_socket
+        self.udp_ping()
+
+    def close_udp(self):
+        """Close the UDP voice channel, voice goes through the TCP tunnel"""
+        self.set_udp_active(False)
+        with self.udp_lock:
+            if self.media_socket is not None:
+                self.media_socket.close()
+            self.media_socket = None
+            self.crypt = None
+
+    def set_udp_active(self, active):
+        """Switch the voice between UDP and the TCP tunnel"""
+        if active == self.udp_active:
+            return
+        self.udp_active = active
+        if active:
+            self.Log.debug('UDP voice channel is working, sending voice over UDP')
+        else:
+            self.Log.debug('UDP voice channel is down, sending voice through the TCP tunnel')
+        self.sound_output.set_bandwidth(self.bandwidth)  # the protocol overhead depends on the transport
+
+    def check_udp(self):
+        """Fall back to the TCP tunnel when nothing was received over UDP for too long"""
+        last_rcv = self.udp_stats['last_rcv']
+        if self.udp_active and time.time() > last_rcv + PYMUMBLE_UDP_TIMEOUT:
+            self.Log.warning('No UDP packet received for %i sec, falling back to the TCP tunnel', PYMUMBLE_UDP_TIMEOUT)
+            self.set_udp_active(False)
+
+    def udp_ping(self):
+        """Send a ping over UDP, the server echoes it back"""
+        timestamp = tools.VarInt(int(time.time() * 1000)).encode()
+        self.send_udp(struct.pack('!B', PYMUMBLE_AUDIO_TYPE_PING << 5) + timestamp)
+
+    def send_udp(self, packet):
+        """Encrypt and send a voice or ping packet over UDP.  Return False if it could not be sent"""
+        with self.udp_lock:
+            if self.media_socket is None:
+                return False
+            try:
+                self.media_socket.send(self.crypt.encrypt(packet))
+                return True
+            except EncryptFailedException as e:
+                self.Log.debug('UDP packet not encrypted: %s', e)
+                return False
+            except socket.error as e:
+                error = e
+        self.Log.debug('UDP packet not sent: %s', error)
+        self.set_udp_active(False)
+        return False
+
+    def send_voice(self, packet):
+        """Send a voice packet over UDP when it is working, through the TCP tunnel otherwise"""
+        if self.udp_active and self.send_udp(packet):
+            return
+        self.send_control(struct.pack('!HL', PYMUMBLE_MSG_TYPES_UDPTUNNEL, len(packet)) + packet)
+
+    def read_media_messages(self):
+        """Read and decrypt the packets coming from the server over UDP"""
+        try:
+            packet = self.media_socket.recv(PYMUMBLE_UDP_BUFFER_SIZE)
+        except BlockingIOError:
+            return
+        except socket.error as e:  # e.g. the server does not listen to UDP
+            self.Log.debug('UDP packet not received: %s', e)
+            self.set_udp_active(False)
+            return
+
+        try:
+            message = bytes(self.crypt.decrypt(packet, len(packet) - 4))
+        except DecryptFailedException as e:
+            self.Log.debug('UDP packet not decrypted: %s', e)
+            self.request_crypt_resync()
+            return
+
+        self.udp_stats['last_rcv'] = time.time()
+        self.set_udp_active(True)
+
+        if len(message) > 0 and (message[0] >> 5) == PYMUMBLE_AUDIO_TYPE_PING:
+            self.udp_ping_response(message)
+        else:
+            self.sound_received(message)
+
+    def udp_ping_response(self, message):
+        timestamp = tools.VarInt()
+        timestamp.decode(message[1:])
+        ping = int(time.time() * 1000) - timestamp.value
+        nb = self.udp_stats['nb']
+        old_avg = self.udp_stats['avg']
+        new_avg = ((old_avg * nb) + ping) / (nb + 1)
+        if nb > 0:
+            self.udp_stats['var'] += pow(old_avg - new_avg, 2) + (1 / nb) * pow(ping - new_avg, 2)
+        self.udp_stats['avg'] = new_avg
+        self.udp_stats['nb'] += 1
+
+    def request_crypt_resync(self):
+        """Ask the server for its current nonce when the packets cannot be decrypted anymore"""
+        if time.time() < self.udp_stats['last_resync'] + PYMUMBLE_UDP_RESYNC_DELAY:
+            return
+        self.udp_stats['last_resync'] = time.time()
+        self.udp_stats['resync'] += 1
+        self.Log.debug('requesting a crypto resync')
+        self.send_message(PYMUMBLE_MSG_TYPES_CRYPTSETUP, mumble_pb2.CryptSetup())
+
     def send_message(self, type, message):
         """Send a control message to the server"""
-        packet = struct.pack('!HL', type, message.ByteSize()) + message.SerializeToString()
-
-        while len(packet) > 0:
-            self.Log.debug('sending message')
-            sent = self.control_socket.send(packet)
-            if sent < 0:
-                raise socket.error('Server socket error')
-            packet = packet[sent:]
+        self.Log.debug('sending message')
+        self.send_control(struct.pack('!HL', type, message.ByteSize()) + message.SerializeToString())
+
+    def send_control(self, packet):
+        """Send a packet over the control socket, in one piece even when several threads send"""
+        with self.control_lock:
+            while len(packet) > 0:
+                sent = self.control_socket.send(packet)
+                if sent < 0:
+                    raise socket.error('Server socket error')
+                packet = packet[sent:]
 
     def read_control_messages(self):
         """Read control messages coming from the server"""
         # from tools import tohex  # for debugging
 
         try:
-            buffer = self.control_socket.recv(PYMUMBLE_READ_BUFFER_SIZE)
+            with self.control_lock:  # an SSL socket must not be read while the audio thread writes to it
+                buffer = self.control_socket.recv(PYMUMBLE_READ_BUFFER_SIZE)
             self.receive_buffer += buffer
         except socket.error:
             pass
@@ -361,6 +510,7 @@ class Mumble(threading.Thread):
 
             if self.connected == PYMUMBLE_CONN_STATE_AUTHENTICATING:
                 self.connected = PYMUMBLE_CONN_STATE_CONNECTED
+                self.sound_output.start_sending()
                 self.ready_lock.release()  # release the ready-lock
                 self.callbacks(PYMUMBLE_CLBK_CONNECTED)
 
@@ -427,6 +577,15 @@ class Mumble(threading.Thread):
             mess = mumble_pb2.CryptSetup()
             mess.ParseFromString(message)
             self.Log.debug('message: CryptSetup : %s', mess)
+            if mess.HasField('key') and mess.HasField('client_nonce') and mess.HasField('server_nonce'):
+                self.setup_udp(mess.key, mess.client_nonce, mess.server_nonce)
+            elif mess.HasField('server_nonce'):  # answer to a resync request
+                if self.crypt is not None:
+                    self.crypt.decrypt_iv = mess.server_nonce
+            elif self.crypt is not None:  # the server asks for the client nonce
+                answer = mumble_pb2.CryptSetup()
+                answer.client_nonce = bytes(self.crypt.encrypt_iv)
+                self.send_message(PYMUMBLE_MSG_TYPES_CRYPTSETUP, answer)
             self.ping()
 
         elif type == PYMUMBLE_MSG_TYPES_CONTEXTACTIONMODIFY:
@@ -706,9 +865,10 @@ class Mumble(threading.Thread):
             textvoicetarget.id = cmd.parameters['id']
             targets = []
             if cmd.parameters['id'] == 1:
-                voicetarget = mumble_pb2.VoiceTarget.Target()
-                voicetarget.channel_id = cmd.parameters['targets'][0]
-                targets.append(voicetarget)
+                for target in cmd.parameters['targets']:  # one packet is heard in all the channels
+                    voicetarget = mumble_pb2.VoiceTarget.Target()
+                    voicetarget.channel_id = target
+                    targets.append(voicetarget)
             else:
                 for target in cmd.parameters['targets']:
                     voicetarget = mumble_pb2.VoiceTarget.Target()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import threading
+
+
+class PcmBuffer:
+    """
+    Ring buffer of the PCM audio waiting to be sent.
+    The storage is preallocated and only grows when a burst of audio does not fit, so adding
+    and reading audio copies the bytes without allocating new objects.
+    """
+
+    def __init__(self, capacity):
+        """
+        capacity=initial size of the buffer in bytes
+        """
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+        self.read_pos = 0
+        self.size = 0  # bytes in the buffer, not read yet
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return self.size
+
+    def capacity(self):
+        return len(self.buffer)
+
+    def write(self, pcm):
+        """copy the pcm data at the end of the buffer"""
+        length = len(pcm)
+        with self.lock:
+            if length > len(self.buffer) - self.size:
+                self._grow(self.size + length)
+
+            capacity = len(self.buffer)
+            write_pos = (self.read_pos + self.size) % capacity
+            if write_pos + length <= capacity:
+                self.view[write_pos : write_pos + length] = pcm
+            else:  # wraps around the end of the buffer
+                first = capacity - write_pos
+                source = memoryview(pcm)
+                self.view[write_pos:] = source[:first]
+                self.view[: length - first] = source[first:]
+            self.size += length
+
+    def read_into(self, target):
+        """move up to len(target) bytes of the oldest audio into the target memoryview, return the number of bytes"""
+        with self.lock:
+            length = min(len(target), self.size)
+            capacity = len(self.buffer)
+            first = min(length, capacity - self.read_pos)
+            target[:first] = self.view[self.read_pos : self.read_pos + first]
+            if first < length:
+                target[first:length] = self.view[: length - first]
+            self.read_pos = (self.read_pos + length) % capacity
+            self.size -= length
+            return length
+
+    def clear(self):
+        with self.lock:
+            self.read_pos = 0
+            self.size = 0
+
+    def _grow(self, needed):
+        """reallocate the buffer with at least the needed capacity, the buffered audio starting at 0"""
+        capacity = max(needed, len(self.buffer) * 2)
+        buffer = bytearray(capacity)
+        first = min(self.size, len(self.buffer) - self.read_pos)
+        buffer[:first] = self.view[self.read_pos : self.read_pos + first]
+        buffer[first : self.size] = self.view[: self.size - first]
+
+        self.view.release()
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        self.read_pos = 0
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import ctypes
 import socket
 import struct
 import threading
-from time import time
 
 import opuslib
 
+from .audiosender import AudioSender
 from .constants import *
+from .pcmbuffer import PcmBuffer
 from .errors import CodecNotSupportedError
 from .messages import VoiceTarget
 from .tools import VarInt
@@ -17,6 +19,7 @@ class SoundOutput:
     """
     Class managing the sounds that must be sent to the server (best sent in a multiple of audio_per_packet samples)
     The buffering is the responsibility of the caller, any partial sound will be sent without delay
+    The packets are encoded and sent by an AudioSender thread, at a steady cadence
     """
 
     def __init__(
@@ -30,8 +33,16 @@ class SoundOutput:
 
         self.Log = self.mumble_object.Log
 
-        self.pcm = []
-        self.lock = threading.Lock()
+        self.channels = 1 if not stereo else 2
+        self.pcm = PcmBuffer(int(PYMUMBLE_AUDIO_BUFFER_SIZE * PYMUMBLE_SAMPLERATE * 2 * self.channels))
+        self.encoder_lock = threading.RLock()  # the encoder is used by the sender and configured by the Mumble thread
+
+        # reusable buffers, sized for the encoder frame: the frame given to the encoder, silence to pad the
+        # last frame and the audio packet being built
+        self.frame = None
+        self.frame_view = None
+        self.silence = None
+        self.packet = None
 
         self.codec = None  # codec currently requested by the server
         self.encoder = None  # codec instance currently used to encode
@@ -39,7 +50,6 @@ class SoundOutput:
             None  # size of an audio frame for the current codec (OPUS=audio_per_packet, CELT=0.01s)
         )
         self.opus_profile = opus_profile
-        self.channels = 1 if not stereo else 2
 
         self.set_audio_per_packet(audio_per_packet)
         self.set_bandwidth(bandwidth)
@@ -51,51 +61,59 @@ class SoundOutput:
         self.sequence_last_time = 0  # time of the last emitted packet
         self.sequence = 0  # current sequence
 
-    def send_audio(self):
-        """send the available audio to the server, taking care of the timing"""
-        if not self.encoder or len(self.pcm) == 0:  # no codec configured or no audio sent
-            return ()
+        self.destinations = []  # other connections the encoded packets are also sent to, replaced on change
+
+        self.sender = AudioSender(self)  # thread sending the audio, started once connected
+
+    def has_audio(self):
+        """return True if there is audio to send and a codec to encode it"""
+        return self.encoder is not None and self.pcm.size > 0
+
+    def start_sending(self):
+        """start the thread sending the audio, once the connection is established"""
+        if not self.sender.is_alive():
+            self.sender.start()
+
+    def stop_sending(self):
+        self.sender.stop()
+
+    def send_packet(self, current_time):
+        """encode and send one packet of the available audio, current_time being its deadline on the monotonic clock"""
+        if (
+            self.sequence_last_time + PYMUMBLE_SEQUENCE_RESET_INTERVAL <= current_time
+        ):  # waited enough, resetting sequence to 0
+            self.sequence = 0
+            self.sequence_start_time = current_time
+            self.sequence_last_time = current_time
+        elif (
+            self.sequence_last_time + (self.audio_per_packet * 2) <= current_time
+        ):  # give some slack (2*audio_per_frame) before interrupting a continuous sequence
+            # calculating sequence after a pause
+            self.sequence = int((current_time - self.sequence_start_time) / PYMUMBLE_SEQUENCE_DURATION)
+            self.sequence_last_time = self.sequence_start_time + (self.sequence * PYMUMBLE_SEQUENCE_DURATION)
+        else:  # continuous sound
+            self.sequence += int(self.audio_per_packet / PYMUMBLE_SEQUENCE_DURATION)
+            self.sequence_last_time = self.sequence_start_time + (self.sequence * PYMUMBLE_SEQUENCE_DURATION)
+
+        with self.encoder_lock:
+            packet = self.packet
+            packet[0] = (self.codec_type << 5) | self.target  # encapsulate in audio packet
+            sequence = VarInt(self.sequence).encode()
+            pos = 1 + len(sequence)
+            packet[1:pos] = sequence
 
-        samples = int(
-            self.encoder_framesize * PYMUMBLE_SAMPLERATE * 2 * self.channels
-        )  # number of samples in an encoder frame
-
-        while (
-            len(self.pcm) > 0 and self.sequence_last_time + self.audio_per_packet <= time()
-        ):  # audio to send and time to send it (since last packet)
-            current_time = time()
-            if (
-                self.sequence_last_time + PYMUMBLE_SEQUENCE_RESET_INTERVAL <= current_time
-            ):  # waited enough, resetting sequence to 0
-                self.sequence = 0
-                self.sequence_start_time = current_time
-                self.sequence_last_time = current_time
-            elif (
-                self.sequence_last_time + (self.audio_per_packet * 2) <= current_time
-            ):  # give some slack (2*audio_per_frame) before interrupting a continuous sequence
-                # calculating sequence after a pause
-                self.sequence = int((current_time - self.sequence_start_time) / PYMUMBLE_SEQUENCE_DURATION)
-                self.sequence_last_time = self.sequence_start_time + (self.sequence * PYMUMBLE_SEQUENCE_DURATION)
-            else:  # continuous sound
-                self.sequence += int(self.audio_per_packet / PYMUMBLE_SEQUENCE_DURATION)
-                self.sequence_last_time = self.sequence_start_time + (self.sequence * PYMUMBLE_SEQUENCE_DURATION)
-
-            payload = bytearray()  # content of the whole packet, without tcptunnel header
+            frame_bytes = len(self.frame_view)
             audio_encoded = 0  # audio time already in the packet
-
             while (
-                len(self.pcm) > 0 and audio_encoded < self.audio_per_packet
+                self.pcm.size > 0 and audio_encoded < self.audio_per_packet
             ):  # more audio to be sent and packet not full
-                self.lock.acquire()
-                to_encode = self.pcm.pop(0)
-                self.lock.release()
-
-                if len(to_encode) != samples:  # pad to_encode if needed to match sample length
-                    to_encode += b'\x00' * (samples - len(to_encode))
+                length = self.pcm.read_into(self.frame_view)
+                if length < frame_bytes:  # pad the frame with silence, in place
+                    self.frame_view[length:] = self.silence[length:]
 
                 try:
-                    encoded = self.encoder.encode(to_encode, len(to_encode) // (2 * self.channels))
-                except src.opuslib.exceptions.OpusError:
+                    encoded = self.encoder.encode(self.frame, frame_bytes // (2 * self.channels))
+                except opuslib.OpusError:
                     encoded = b''
 
                 audio_encoded += self.encoder_framesize
@@ -106,40 +124,60 @@ class SoundOutput:
                 else:
                     frameheader = len(encoded)
                     if (
-                        audio_encoded < self.audio_per_packet and len(self.pcm) > 0
+                        audio_encoded < self.audio_per_packet and self.pcm.size > 0
                     ):  # if not last frame for the packet, set the terminator bit
                         frameheader += 1 << 7
                     frameheader = struct.pack('!B', frameheader)
 
-                payload += frameheader + encoded  # add the frame to the packet
-
-            header = self.codec_type << 5  # encapsulate in audio packet
-            sequence = VarInt(self.sequence).encode()
+                # add the frame to the packet
+                end = pos + len(frameheader)
+                packet[pos:end] = frameheader
+                pos = end + len(encoded)
+                packet[end:pos] = encoded
 
-            udppacket = struct.pack('!B', header | self.target) + sequence + payload
             if self.mumble_object.positional:
-                udppacket += struct.pack(
+                struct.pack_into(
                     'fff',
+                    packet,
+                    pos,
                     self.mumble_object.positional[0],
                     self.mumble_object.positional[1],
                     self.mumble_object.positional[2],
                 )
+                pos += 12
 
-            self.Log.debug(
-                'audio packet to send: sequence:{sequence}, type:{type}, length:{len}'.format(
-                    sequence=self.sequence, type=self.codec_type, len=len(udppacket)
-                )
-            )
+            udppacket = bytes(packet[:pos])
 
-            tcppacket = (
-                struct.pack('!HL', PYMUMBLE_MSG_TYPES_UDPTUNNEL, len(udppacket)) + udppacket
-            )  # encapsulate in tcp tunnel
+        self.Log.debug(
+            'audio packet to send: sequence:%i, type:%i, length:%i', self.sequence, self.codec_type, len(udppacket)
+        )
 
-            while len(tcppacket) > 0:
-                sent = self.mumble_object.control_socket.send(tcppacket)
-                if sent < 0:
-                    raise socket.error('Server socket error')
-                tcppacket = tcppacket[sent:]
+        self.mumble_object.send_voice(udppacket)
+        for destination in self.destinations:
+            self._send_to_destination(destination, udppacket)
+
+    def _send_to_destination(self, destination, udppacket):
+        """send an already encoded packet through another connection, to the voice target of that connection"""
+        if destination.connected != PYMUMBLE_CONN_STATE_CONNECTED or destination.sound_output is None:
+            return
+        target = destination.sound_output.target
+        if target != self.target:
+            udppacket = bytes(((udppacket[0] & 0b11100000) | target,)) + udppacket[1:]
+        try:
+            destination.send_voice(udppacket)
+        except socket.error as e:  # the other connection notices its own disconnection
+            self.Log.debug('audio packet not sent to another connection: %s', e)
+
+    def add_destination(self, mumble_object):
+        """
+        Send the audio of this output through another connection too, e.g. a bot in another channel
+        The audio is encoded once for all the connections. The other connection should not send audio of its own
+        """
+        if mumble_object is not self.mumble_object and mumble_object not in self.destinations:
+            self.destinations = self.destinations + [mumble_object]
+
+    def remove_destination(self, mumble_object):
+        self.destinations = [destination for destination in self.destinations if destination is not mumble_object]
 
     def get_audio_per_packet(self):
         """return the configured length of a audio packet (in ms)"""
@@ -161,52 +199,40 @@ class SoundOutput:
 
     def _set_bandwidth(self):
         """do the calculation of the overhead and configure the actual bitrate for the codec"""
-        if self.encoder:
-            overhead_per_packet = 20  # IP header in bytes
-            overhead_per_packet += 3 * int(self.audio_per_packet / self.encoder_framesize)  # overhead per frame
-            if self.mumble_object.udp_active:
-                overhead_per_packet += 12  # UDP header
-            else:
-                overhead_per_packet += 20  # TCP header
-                overhead_per_packet += 6  # TCPTunnel encapsulation
+        with self.encoder_lock:
+            if self.encoder:
+                overhead_per_packet = 20  # IP header in bytes
+                overhead_per_packet += 3 * int(self.audio_per_packet / self.encoder_framesize)  # overhead per frame
+                if self.mumble_object.udp_active:
+                    overhead_per_packet += 12  # UDP header
+                else:
+                    overhead_per_packet += 20  # TCP header
+                    overhead_per_packet += 6  # TCPTunnel encapsulation
 
-            overhead_per_second = int(overhead_per_packet * 8 / self.audio_per_packet)  # in bits
+                overhead_per_second = int(overhead_per_packet * 8 / self.audio_per_packet)  # in bits
 
-            self.Log.debug(
-                'Bandwidth is {bandwidth}, downgrading to {bitrate} due to the protocol overhead'.format(
-                    bandwidth=self.bandwidth, bitrate=self.bandwidth - overhead_per_second
+                self.Log.debug(
+                    'Bandwidth is {bandwidth}, downgrading to {bitrate} due to the protocol overhead'.format(
+                        bandwidth=self.bandwidth, bitrate=self.bandwidth - overhead_per_second
+                    )
                 )
-            )
 
-            self.encoder.bitrate = self.bandwidth - overhead_per_second
+                self.encoder.bitrate = self.bandwidth - overhead_per_second
 
     def add_sound(self, pcm):
         """add sound to be sent (in PCM 16 bits signed format)"""
         if len(pcm) % 2 != 0:  # check that the data is align on 16 bits
             raise Exception('pcm data must be 16 bits')
 
-        samples = int(
-            self.encoder_framesize * PYMUMBLE_SAMPLERATE * 2 * self.channels
-        )  # number of samples in an encoder frame
-
-        self.lock.acquire()
-        if len(self.pcm) and len(self.pcm[-1]) < samples:
-            initial_offset = samples - len(self.pcm[-1])
-            self.pcm[-1] += pcm[:initial_offset]
-        else:
-            initial_offset = 0
-        for i in range(initial_offset, len(pcm), samples):
-            self.pcm.append(pcm[i : i + samples])
-        self.lock.release()
+        self.pcm.write(pcm)
+        self.sender.notify()
 
     def clear_buffer(self):
-        self.lock.acquire()
-        self.pcm = []
-        self.lock.release()
+        self.pcm.clear()
 
     def get_buffer_size(self):
         """return the size of the unsent buffer in sec"""
-        return sum(len(chunk) for chunk in self.pcm) / 2.0 / PYMUMBLE_SAMPLERATE / self.channels
+        return len(self.pcm) / 2.0 / PYMUMBLE_SAMPLERATE / self.channels
 
     def set_default_codec(self, codecversion):
         """Set the default codec to be used to send packets"""
@@ -218,16 +244,30 @@ class SoundOutput:
         if not self.codec:
             return ()
 
-        if self.codec.opus:
-            self.encoder = opuslib.Encoder(PYMUMBLE_SAMPLERATE, self.channels, self.opus_profile)
-            self.encoder_framesize = self.audio_per_packet
-            self.codec_type = PYMUMBLE_AUDIO_TYPE_OPUS
-        else:
-            raise CodecNotSupportedError('')
+        with self.encoder_lock:
+            if self.codec.opus:
+                self.encoder = opuslib.Encoder(PYMUMBLE_SAMPLERATE, self.channels, self.opus_profile)
+                self.encoder_framesize = self.audio_per_packet
+                self.codec_type = PYMUMBLE_AUDIO_TYPE_OPUS
+            else:
+                raise CodecNotSupportedError('')
 
-        self._set_bandwidth()
+            self._create_buffers()
+            self._set_bandwidth()
+
+    def _create_buffers(self):
+        """allocate the reusable frame and packet buffers for the current encoder frame size"""
+        frame_bytes = int(self.encoder_framesize * PYMUMBLE_SAMPLERATE * 2 * self.channels)
+        self.frame = (ctypes.c_char * frame_bytes)()  # the encoder reads a ctypes array without a copy
+        self.frame_view = memoryview(self.frame).cast('B')
+        self.silence = memoryview(bytes(frame_bytes))
+
+        frames_per_packet = max(1, round(self.audio_per_packet / self.encoder_framesize))
+        # header, sequence and positional data, and per frame its header and at most one byte per PCM byte
+        self.packet = bytearray(1 + 10 + 12 + frames_per_packet * (10 + frame_bytes))
 
     def set_whisper(self, target_id, channel=False):
+        """whisper to a user session or channel id, or to a list of them"""
         if not target_id:
             return
         if type(target_id) is int:
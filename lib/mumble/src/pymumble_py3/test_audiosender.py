@@ -0,0 +1,88 @@
+"""
+Pacing of the audio packets by the AudioSender thread
+"""
+
+import logging
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from .audiosender import AudioSender
+from .soundoutput import SoundOutput
+
+PACKET = 0.02
+
+
+class FakeSoundOutput:
+    """Sound output with a number of packets to send, recording the deadline of every sent packet"""
+
+    def __init__(self, packets, stall_at=None):
+        self.Log = logging.getLogger('PyMumble')
+        self.audio_per_packet = PACKET
+        self.packets = packets
+        self.stall_at = stall_at
+        self.deadlines = []
+
+    def has_audio(self):
+        return self.packets > 0
+
+    def send_packet(self, deadline):
+        self.deadlines.append(deadline)
+        if len(self.deadlines) == self.stall_at:
+            time.sleep(PACKET * 5)
+        self.packets -= 1
+
+
+def run_sender(sound_output):
+    sender = AudioSender(sound_output)
+    sender.start()
+    sender.notify()
+    timeout = time.monotonic() + 5
+    while sound_output.has_audio() and time.monotonic() < timeout:
+        time.sleep(PACKET)
+    sender.stop()
+    sender.join(1)
+    assert not sender.is_alive()
+    return sender
+
+
+def test_packets_are_sent_at_fixed_deadlines():
+    sound_output = FakeSoundOutput(10)
+    sender = run_sender(sound_output)
+
+    intervals = [b - a for a, b in zip(sound_output.deadlines, sound_output.deadlines[1:])]
+    assert intervals == pytest.approx([PACKET] * 9)
+    assert sender.stats['packets'] == 10
+    assert sender.stats['resync'] == 0
+
+
+def test_stall_restarts_the_cadence_instead_of_a_burst():
+    sound_output = FakeSoundOutput(6, stall_at=2)
+    sender = run_sender(sound_output)
+
+    assert sender.stats['resync'] == 1
+    assert sender.stats['late'] >= 1
+    assert sender.stats['max_drift'] >= PACKET * 4
+    assert sound_output.deadlines[2] - sound_output.deadlines[1] >= PACKET * 5
+
+
+def test_sender_idles_without_audio():
+    sound_output = FakeSoundOutput(0)
+    sender = run_sender(sound_output)
+
+    assert sender.stats['packets'] == 0
+
+
+def test_sound_output_hands_encoded_packets_to_the_connection():
+    mumble_object = MagicMock(positional=None, udp_active=False)
+    sound_output = SoundOutput(mumble_object, PACKET, 50000)
+    sound_output.set_default_codec(MagicMock(opus=True))
+
+    sound_output.add_sound(bytes(640 * 2))
+    assert sound_output.has_audio()
+    sound_output.send_packet(time.monotonic())
+    sound_output.send_packet(time.monotonic())
+
+    assert not sound_output.has_audio()
+    assert mumble_object.send_voice.call_count == 2
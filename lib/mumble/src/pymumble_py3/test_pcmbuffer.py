@@ -0,0 +1,55 @@
+"""
+Ring buffer of the outgoing PCM audio
+"""
+
+from .pcmbuffer import PcmBuffer
+
+
+def read(buffer, size):
+    target = bytearray(size)
+    length = buffer.read_into(memoryview(target))
+    return bytes(target[:length])
+
+
+def test_reads_in_write_order():
+    buffer = PcmBuffer(8)
+    buffer.write(b'abcd')
+    buffer.write(b'ef')
+
+    assert len(buffer) == 6
+    assert read(buffer, 4) == b'abcd'
+    assert read(buffer, 4) == b'ef'
+    assert len(buffer) == 0
+
+
+def test_wraps_around_the_end():
+    buffer = PcmBuffer(8)
+    buffer.write(b'abcdef')
+    assert read(buffer, 4) == b'abcd'
+
+    buffer.write(b'ghijk')
+
+    assert buffer.capacity() == 8
+    assert read(buffer, 8) == b'efghijk'
+
+
+def test_grows_instead_of_dropping_audio():
+    buffer = PcmBuffer(8)
+    buffer.write(b'abcdef')
+    assert read(buffer, 4) == b'abcd'
+    buffer.write(b'ghijk')
+
+    buffer.write(b'lmnopqrstu')
+
+    assert buffer.capacity() >= 17
+    assert read(buffer, 32) == b'efghijklmnopqrstu'
+
+
+def test_clear_drops_the_buffered_audio():
+    buffer = PcmBuffer(8)
+    buffer.write(b'abcd')
+
+    buffer.clear()
+
+    assert len(buffer) == 0
+    assert read(buffer, 4) == b''
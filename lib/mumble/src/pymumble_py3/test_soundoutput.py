@@ -0,0 +1,163 @@
+"""
+Packets built by the SoundOutput from the buffered audio
+"""
+
+import socket
+import time
+from unittest.mock import MagicMock
+
+import opuslib
+
+from . import mumble_pb2
+from .constants import PYMUMBLE_AUDIO_TYPE_OPUS, PYMUMBLE_CONN_STATE_CONNECTED, PYMUMBLE_MSG_TYPES_VOICETARGET
+from .messages import VoiceTarget
+from .mumble import Mumble
+from .soundoutput import SoundOutput
+
+FRAME_BYTES = 640  # 20 ms of 16 kHz mono audio
+
+
+class RecordingEncoder:
+    """Returns the PCM it was given, so the tests see the frames handed to the encoder"""
+
+    bitrate = 0
+
+    def encode(self, pcm, frame_size):
+        return bytes(pcm)[:100]
+
+
+def sound_output():
+    mumble_object = MagicMock(positional=None, udp_active=False)
+    output = SoundOutput(mumble_object, 0.02, 50000)
+    output.set_default_codec(MagicMock(opus=True))
+    output.encoder = RecordingEncoder()
+    return output, mumble_object
+
+
+def test_buffer_size_counts_the_unsent_audio():
+    output, _ = sound_output()
+
+    output.add_sound(bytes(FRAME_BYTES * 3))
+
+    assert output.get_buffer_size() == 0.06
+
+
+def test_packet_holds_header_sequence_and_frame():
+    output, mumble_object = sound_output()
+    output.add_sound(b'\x01' * FRAME_BYTES)
+
+    output.send_packet(time.monotonic())
+
+    packet = mumble_object.send_voice.call_args[0][0]
+    assert packet[0] >> 5 == PYMUMBLE_AUDIO_TYPE_OPUS
+    assert packet[1] == 0  # first sequence
+    assert packet[2] == 100  # frame length as a VarInt
+    assert packet[3:] == b'\x01' * 100
+
+
+def test_last_frame_is_padded_with_silence():
+    output, mumble_object = sound_output()
+    output.encoder = MagicMock(bitrate=0)
+    output.encoder.encode.side_effect = lambda pcm, frame_size: bytes(pcm)
+    output.add_sound(b'\x01' * FRAME_BYTES)
+    output.send_packet(time.monotonic())
+
+    output.add_sound(b'\x02' * 10)
+    output.send_packet(time.monotonic())
+
+    frame = output.encoder.encode.call_args[0][0]
+    assert bytes(frame) == b'\x02' * 10 + bytes(FRAME_BYTES - 10)
+    assert not output.has_audio()
+
+
+def test_encoder_error_sends_an_empty_frame():
+    output, mumble_object = sound_output()
+    output.encoder = MagicMock(bitrate=0)
+    output.encoder.encode.side_effect = opuslib.OpusError('bad frame')
+    output.add_sound(bytes(FRAME_BYTES))
+
+    output.send_packet(time.monotonic())
+
+    packet = mumble_object.send_voice.call_args[0][0]
+    assert packet[-1] == 0  # frame length 0
+
+
+def destination(target=0, connected=PYMUMBLE_CONN_STATE_CONNECTED):
+    """Another connection, with the voice target set on its own sound output"""
+    return MagicMock(connected=connected, sound_output=MagicMock(target=target))
+
+
+def test_destinations_get_the_packet_encoded_once():
+    output, mumble_object = sound_output()
+    output.encoder = MagicMock(bitrate=0)
+    output.encoder.encode.return_value = b'\x05' * 100
+    others = [destination(), destination()]
+    for other in others:
+        output.add_destination(other)
+    output.add_destination(others[0])  # already a destination
+    output.add_destination(mumble_object)  # the own connection
+
+    output.add_sound(bytes(FRAME_BYTES))
+    output.send_packet(time.monotonic())
+
+    assert output.encoder.encode.call_count == 1
+    packet = mumble_object.send_voice.call_args[0][0]
+    for other in others:
+        other.send_voice.assert_called_once_with(packet)
+
+
+def test_destination_packet_takes_its_voice_target():
+    output, mumble_object = sound_output()
+    other = destination(target=1)
+    output.add_destination(other)
+
+    output.add_sound(bytes(FRAME_BYTES))
+    output.send_packet(time.monotonic())
+
+    packet = mumble_object.send_voice.call_args[0][0]
+    mirrored = other.send_voice.call_args[0][0]
+    assert mirrored[0] == (PYMUMBLE_AUDIO_TYPE_OPUS << 5) | 1
+    assert mirrored[1:] == packet[1:]
+
+
+def test_unavailable_destinations_do_not_stop_the_others():
+    output, _ = sound_output()
+    disconnected = destination(connected=0)
+    failing = destination()
+    failing.send_voice.side_effect = socket.error('connection reset')
+    working = destination()
+    for other in (disconnected, failing, working):
+        output.add_destination(other)
+
+    output.add_sound(bytes(FRAME_BYTES))
+    output.send_packet(time.monotonic())
+
+    disconnected.send_voice.assert_not_called()
+    working.send_voice.assert_called_once()
+
+
+def test_removed_destination_gets_no_more_packets():
+    output, _ = sound_output()
+    other = destination()
+    output.add_destination(other)
+    output.remove_destination(other)
+
+    output.add_sound(bytes(FRAME_BYTES))
+    output.send_packet(time.monotonic())
+
+    other.send_voice.assert_not_called()
+
+
+def test_channel_whisper_targets_every_channel():
+    m = Mumble('127.0.0.1', 'bot')
+    m.init_connection()
+    m.send_message = MagicMock()
+
+    m.commands.new_cmd(VoiceTarget(1, [3, 5]))
+    m.treat_command(m.commands.pop_cmd())
+
+    message_type, message = m.send_message.call_args[0]
+    assert message_type == PYMUMBLE_MSG_TYPES_VOICETARGET
+    assert isinstance(message, mumble_pb2.VoiceTarget)
+    assert message.id == 1
+    assert [target.channel_id for target in message.targets] == [3, 5]
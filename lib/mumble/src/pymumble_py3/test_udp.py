@@ -0,0 +1,125 @@
+"""
+UDP voice channel of the Mumble object, against a local UDP socket playing the server
+"""
+
+import select
+import socket
+import struct
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from . import mumble_pb2
+from .constants import PYMUMBLE_AUDIO_TYPE_OPUS, PYMUMBLE_AUDIO_TYPE_PING, PYMUMBLE_MSG_TYPES_CRYPTSETUP
+from .crypto import AES_BLOCK_SIZE, CryptStateOCB2
+from .mumble import Mumble
+
+KEY = bytes(range(16))
+CLIENT_NONCE = bytes((0x11,) * AES_BLOCK_SIZE)
+SERVER_NONCE = bytes((0x22,) * AES_BLOCK_SIZE)
+
+
+@pytest.fixture()
+def server():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.settimeout(2)
+    crypt = CryptStateOCB2()
+    crypt.set_key(KEY, SERVER_NONCE, CLIENT_NONCE)
+    yield sock, crypt
+    sock.close()
+
+
+@pytest.fixture()
+def client(server):
+    sock, _ = server
+    m = Mumble('127.0.0.1', 'bot', port=sock.getsockname()[1])
+    m.init_connection()
+    m.control_socket = MagicMock()
+    m.control_socket.send.side_effect = len
+    yield m
+    m.close_udp()
+
+
+def receive(server):
+    """Receive and decrypt a packet on the server side"""
+    sock, crypt = server
+    packet, address = sock.recvfrom(2048)
+    return crypt.decrypt(packet, len(packet) - 4), address
+
+
+def reply(server, address, message):
+    """Encrypt and send a packet from the server side"""
+    sock, crypt = server
+    sock.sendto(crypt.encrypt(message), address)
+
+
+def read_reply(client):
+    select.select([client.media_socket], [], [], 2)
+    client.read_media_messages()
+
+
+def test_cryptsetup_opens_udp_and_pings(server, client):
+    setup = mumble_pb2.CryptSetup(key=KEY, client_nonce=CLIENT_NONCE, server_nonce=SERVER_NONCE)
+    client.dispatch_control_message(PYMUMBLE_MSG_TYPES_CRYPTSETUP, setup.SerializeToString())
+
+    assert client.media_socket is not None
+    assert not client.udp_active
+    message, address = receive(server)
+    assert message[0] >> 5 == PYMUMBLE_AUDIO_TYPE_PING
+
+    reply(server, address, message)
+    read_reply(client)
+
+    assert client.udp_active
+    assert client.udp_stats['nb'] == 1
+
+
+def test_voice_is_sent_over_udp_when_active(server, client):
+    client.setup_udp(KEY, CLIENT_NONCE, SERVER_NONCE)
+    ping, address = receive(server)
+    reply(server, address, ping)
+    read_reply(client)
+
+    voice = struct.pack('!B', PYMUMBLE_AUDIO_TYPE_OPUS << 5) + b'\x01\x02voice'
+    assert client.send_udp(voice)
+
+    message, _ = receive(server)
+    assert bytes(message) == voice
+
+
+def test_falls_back_to_tcp_when_udp_is_silent(server, client):
+    client.setup_udp(KEY, CLIENT_NONCE, SERVER_NONCE)
+    ping, address = receive(server)
+    reply(server, address, ping)
+    read_reply(client)
+    assert client.udp_active
+
+    client.udp_stats['last_rcv'] = time.time() - 60
+    client.check_udp()
+
+    assert not client.udp_active
+    assert client.media_socket is not None  # pings go on, UDP is used again once they are answered
+
+
+def test_undecryptable_packet_requests_resync(server, client):
+    client.setup_udp(KEY, CLIENT_NONCE, SERVER_NONCE)
+    _, address = receive(server)
+    server[0].sendto(b'\x00' * 20, address)
+    read_reply(client)
+
+    assert not client.udp_active
+    assert client.udp_stats['resync'] == 1
+    header = struct.pack('!HL', PYMUMBLE_MSG_TYPES_CRYPTSETUP, 0)
+    client.control_socket.send.assert_called_with(header)
+
+
+def test_resync_answer_updates_the_decrypt_nonce(client):
+    client.setup_udp(KEY, CLIENT_NONCE, SERVER_NONCE)
+    new_nonce = bytes((0x33,) * AES_BLOCK_SIZE)
+
+    resync = mumble_pb2.CryptSetup(server_nonce=new_nonce)
+    client.dispatch_control_message(PYMUMBLE_MSG_TYPES_CRYPTSETUP, resync.SerializeToString())
+
+    assert bytes(client.crypt.decrypt_iv) == new_nonce
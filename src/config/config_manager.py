@@ -3,25 +3,34 @@ import logging
 import os
 from dataclasses import asdict
 from pathlib import Path
+from typing import List
 
 from config.model.config_models import (
     AWSSettings,
+    CacheSettings,
     GoogleSettings,
     InputSettings,
     LanguageSettings,
+    MixerSettings,
+    MonitoringSettings,
     MumbleSettings,
     OutputSettings,
+    QueueSettings,
+    SessionSettings,
     SpeakerSettings,
     TranslatorSettings,
     UserConfig,
+    VadSettings,
 )
 from constants import (
+    AWS_PARTIAL_RESULTS_STABILITY,
     CHUNK_LEN,
     GOOGLE_ENDPOINTING_OPTIONS,
     GOOGLE_STT_REGIONS,
     INPUT_CHANNELS,
     INPUT_SAMPLE_RATE,
     OUTPUT_SAMPLE_RATE,
+    TTS_QUEUE_OVERFLOW_POLICIES,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -112,8 +121,59 @@ class ConfigManager:
             input_settings=ConfigManager._parse_input_settings(raw_config.get('input_settings', {})),
             output_settings=ConfigManager._parse_output_settings(raw_config.get('output_settings', {})),
             translator_settings=ConfigManager._parse_translator_settings(raw_config.get('translator_settings', {})),
+            additional_sessions=ConfigManager._parse_additional_sessions(raw_config.get('additional_sessions', [])),
+            monitoring_settings=ConfigManager._parse_monitoring_settings(raw_config.get('monitoring_settings', {})),
         )
 
+    @staticmethod
+    def _parse_monitoring_settings(raw: dict) -> MonitoringSettings:
+        """
+        Parse the monitoring settings from the raw configuration.
+
+        Args:
+            raw (dict): The raw monitoring settings data.
+
+        Returns:
+            MonitoringSettings: The parsed monitoring settings.
+        """
+        defaults = MonitoringSettings()
+        metrics_port = raw.get('metrics_port', defaults.metrics_port)
+        if not isinstance(metrics_port, int) or not 0 <= metrics_port <= 65535:
+            LOGGER.warning(f'Invalid metrics_port {metrics_port}, the metrics endpoint is disabled.')
+            metrics_port = defaults.metrics_port
+
+        return MonitoringSettings(
+            trace_file=raw.get('trace_file') or None,
+            metrics_port=metrics_port,
+            metrics_host=raw.get('metrics_host', defaults.metrics_host),
+        )
+
+    @staticmethod
+    def _parse_additional_sessions(raw: list) -> List[SessionSettings]:
+        """
+        Parse the additional translation sessions from the raw configuration.
+
+        Args:
+            raw (list): The raw session settings data.
+
+        Returns:
+            List[SessionSettings]: The parsed sessions; entries without id or source language are skipped.
+        """
+        sessions = []
+        for raw_session in raw:
+            if not raw_session.get('session_id') or not raw_session.get('source_language'):
+                LOGGER.warning(f'Ignoring translation session without session_id or source_language: {raw_session}')
+                continue
+            sessions.append(
+                SessionSettings(
+                    session_id=raw_session['session_id'],
+                    source_language=raw_session['source_language'],
+                    target_languages=list(raw_session.get('target_languages', [])),
+                    input_device_index=raw_session.get('input_device_index'),
+                )
+            )
+        return sessions
+
     @staticmethod
     def _parse_input_settings(raw: dict) -> InputSettings:
         """
@@ -130,6 +190,48 @@ class ConfigManager:
             input_device_index=raw.get('input_device_index'),
             input_sample_rate=raw.get('input_sample_rate', INPUT_SAMPLE_RATE),
             input_channels=raw.get('input_channels', INPUT_CHANNELS),
+            input_buffer_seconds=max(0.5, raw.get('input_buffer_seconds', 5.0)),
+            stt_chunk_ms=max(10, raw.get('stt_chunk_ms', 100)),
+            vad_settings=ConfigManager._parse_vad_settings(raw.get('vad_settings', {})),
+            mixer_settings=ConfigManager._parse_mixer_settings(raw.get('mixer_settings', {})),
+        )
+
+    @staticmethod
+    def _parse_mixer_settings(raw: dict) -> MixerSettings:
+        """
+        Parse the microphone mixer settings from the raw configuration.
+
+        Args:
+            raw (dict): The raw mixer settings data.
+
+        Returns:
+            MixerSettings: The parsed mixer settings.
+        """
+        return MixerSettings(
+            device_indices=list(raw.get('device_indices', [])),
+            gains=[float(gain) for gain in raw.get('gains', [])],
+            channel_tagging=raw.get('channel_tagging', False),
+        )
+
+    @staticmethod
+    def _parse_vad_settings(raw: dict) -> VadSettings:
+        """
+        Parse the voice activity detection settings from the raw configuration.
+
+        Args:
+            raw (dict): The raw VAD settings data.
+
+        Returns:
+            VadSettings: The parsed VAD settings.
+        """
+        defaults = VadSettings()
+        return VadSettings(
+            enabled=raw.get('enabled', defaults.enabled),
+            threshold_dbfs=raw.get('threshold_dbfs', defaults.threshold_dbfs),
+            hangover_ms=max(0, raw.get('hangover_ms', defaults.hangover_ms)),
+            pre_roll_ms=max(0, raw.get('pre_roll_ms', defaults.pre_roll_ms)),
+            # STT services close streams after about ten seconds without audio.
+            keepalive_seconds=min(max(0.5, raw.get('keepalive_seconds', defaults.keepalive_seconds)), 8.0),
         )
 
     @staticmethod
@@ -159,6 +261,10 @@ class ConfigManager:
                 language_channel_mapping=raw_mumble.get('language_channel_mapping', {}),
                 use_custom_server=raw_mumble.get('use_custom_server', False),
                 superuser_password=raw_mumble.get('superuser_password', None),
+                mirror_channel_mapping={
+                    language: [channels] if isinstance(channels, str) else list(channels)
+                    for language, channels in raw_mumble.get('mirror_channel_mapping', {}).items()
+                },
             ),
         )
 
@@ -193,11 +299,18 @@ class ConfigManager:
         Returns:
             AWSSettings: The parsed AWS settings.
         """
+        stability = raw.get('partial_results_stability', 'high')
+        if stability not in AWS_PARTIAL_RESULTS_STABILITY:
+            stability = 'high'
+
         return AWSSettings(
             region=raw.get('region', 'eu-central-1'),
             source_language=raw.get('source_language', 'de-DE'),
             show_source_transcript=raw.get('show_source_transcript', True),
             target_languages=ConfigManager._parse_language_settings(raw.get('target_languages', {})),
+            speculative_translation=raw.get('speculative_translation', False),
+            partial_results_stability=stability,
+            prewarm_connections=raw.get('prewarm_connections', False),
         )
 
     @staticmethod
@@ -227,6 +340,55 @@ class ConfigManager:
             target_languages=ConfigManager._parse_language_settings(raw.get('target_languages', {})),
             endpointing_sensitivity=endpointing,
             region=region,
+            interim_results=raw.get('interim_results', False),
+            prewarm_connections=raw.get('prewarm_connections', False),
+        )
+
+    @staticmethod
+    def _parse_cache_settings(raw: dict) -> CacheSettings:
+        """
+        Parse the cache settings from the raw configuration.
+
+        Args:
+            raw (dict): The raw cache settings data.
+
+        Returns:
+            CacheSettings: The parsed cache settings.
+        """
+        defaults = CacheSettings()
+        return CacheSettings(
+            translation_cache_size=raw.get('translation_cache_size', defaults.translation_cache_size),
+            translation_cache_ttl=raw.get('translation_cache_ttl', defaults.translation_cache_ttl),
+            persist_translation_cache=raw.get('persist_translation_cache', defaults.persist_translation_cache),
+            speech_cache_memory_mb=raw.get('speech_cache_memory_mb', defaults.speech_cache_memory_mb),
+            speech_cache_disk_mb=raw.get('speech_cache_disk_mb', defaults.speech_cache_disk_mb),
+        )
+
+    @staticmethod
+    def _parse_queue_settings(raw: dict) -> QueueSettings:
+        """
+        Parse the TTS queue settings from the raw configuration.
+
+        Args:
+            raw (dict): The raw queue settings data.
+
+        Returns:
+            QueueSettings: The parsed queue settings.
+        """
+        defaults = QueueSettings()
+
+        overflow_policy = raw.get('overflow_policy', defaults.overflow_policy)
+        if overflow_policy not in TTS_QUEUE_OVERFLOW_POLICIES:
+            overflow_policy = defaults.overflow_policy
+
+        return QueueSettings(
+            max_queue_size=max(1, raw.get('max_queue_size', defaults.max_queue_size)),
+            overflow_policy=overflow_policy,
+            max_lag_seconds=raw.get('max_lag_seconds', defaults.max_lag_seconds),
+            max_merge_chars=raw.get('max_merge_chars', defaults.max_merge_chars),
+            pipeline_depth=max(1, raw.get('pipeline_depth', defaults.pipeline_depth)),
+            coalesce_window_seconds=max(0.0, raw.get('coalesce_window_seconds', defaults.coalesce_window_seconds)),
+            coalesce_max_chars=raw.get('coalesce_max_chars', defaults.coalesce_max_chars),
         )
 
     @staticmethod
@@ -244,4 +406,6 @@ class ConfigManager:
             translator=raw.get('translator', 'aws'),
             aws_settings=ConfigManager._parse_aws_settings(raw.get('aws_settings', {})),
             google_settings=ConfigManager._parse_google_settings(raw.get('google_settings', {})),
+            cache_settings=ConfigManager._parse_cache_settings(raw.get('cache_settings', {})),
+            queue_settings=ConfigManager._parse_queue_settings(raw.get('queue_settings', {})),
         )
@@ -1,5 +1,21 @@
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+
+@dataclass
+class VadSettings:
+    enabled: bool = False
+    threshold_dbfs: float = -45.0  # RMS level from which a chunk counts as speech
+    hangover_ms: int = 500  # Audio still forwarded after the speech ended, for the STT endpointing
+    pre_roll_ms: int = 300  # Audio before the speech onset that is forwarded with it
+    keepalive_seconds: float = 5.0  # Interval of silent chunks that keep the STT stream open
+
+
+@dataclass
+class MixerSettings:
+    device_indices: List[int] = field(default_factory=list)  # With two or more devices, their audio is combined
+    gains: List[float] = field(default_factory=list)  # Gain per device, 1.0 if missing
+    channel_tagging: bool = False  # Send each device as its own channel to STT services that identify channels
 
 
 @dataclass
@@ -8,6 +24,10 @@ class InputSettings:
     input_device_index: Optional[int]
     input_sample_rate: int
     input_channels: int
+    input_buffer_seconds: float = 5.0  # Audio the microphone buffers while the translator falls behind
+    stt_chunk_ms: int = 100  # Minimum audio per chunk handed to the STT service; later chunks are coalesced
+    vad_settings: VadSettings = field(default_factory=VadSettings)
+    mixer_settings: MixerSettings = field(default_factory=MixerSettings)
 
 
 @dataclass
@@ -23,6 +43,8 @@ class MumbleSettings:
     language_channel_mapping: Dict[str, str]
     use_custom_server: bool = False
     superuser_password: Optional[str] = None
+    # Further channels per language that get the same audio, through one more connection each; encoded once
+    mirror_channel_mapping: Dict[str, List[str]] = field(default_factory=dict)
 
 
 @dataclass
@@ -47,6 +69,9 @@ class AWSSettings:
     source_language: str
     show_source_transcript: bool
     target_languages: Dict[str, LanguageSettings]
+    speculative_translation: bool = False
+    partial_results_stability: str = 'high'
+    prewarm_connections: bool = False  # Prime translate/TTS connections of all target languages on start
 
 
 @dataclass
@@ -57,6 +82,28 @@ class GoogleSettings:
     target_languages: Dict[str, LanguageSettings]
     endpointing_sensitivity: str = 'short'
     region: str = 'eu'
+    interim_results: bool = False
+    prewarm_connections: bool = False  # Prime translate/TTS connections of all target languages on start
+
+
+@dataclass
+class CacheSettings:
+    translation_cache_size: int = 2000
+    translation_cache_ttl: float = 7 * 24 * 3600.0
+    persist_translation_cache: bool = False
+    speech_cache_memory_mb: int = 32
+    speech_cache_disk_mb: int = 0  # 0 disables the on-disk speech cache
+
+
+@dataclass
+class QueueSettings:
+    max_queue_size: int = 4  # Sentences waiting for translation and TTS per target language
+    overflow_policy: str = 'drop_oldest'
+    max_lag_seconds: float = 10.0  # Used by the 'skip_lagging' policy
+    pipeline_depth: int = 2  # Sentences translated and synthesized ahead of playback per target language
+    max_merge_chars: int = 1000  # Longest text the 'merge' policy builds; beyond it, the oldest sentence is dropped
+    coalesce_window_seconds: float = 0.0  # How long a short transcript waits for the next one to merge with; 0 disables
+    coalesce_max_chars: int = 120  # Longest text built by coalescing short transcripts
 
 
 @dataclass
@@ -64,6 +111,25 @@ class TranslatorSettings:
     translator: str
     aws_settings: Optional[AWSSettings] = field(default=None)
     google_settings: Optional[GoogleSettings] = field(default=None)
+    cache_settings: CacheSettings = field(default_factory=CacheSettings)
+    queue_settings: QueueSettings = field(default_factory=QueueSettings)
+
+
+@dataclass
+class MonitoringSettings:
+    trace_file: Optional[str] = None  # JSONL file the latency trace of every utterance is appended to
+    metrics_port: int = 0  # Port of the Prometheus metrics endpoint; 0 disables it
+    metrics_host: str = '127.0.0.1'  # Interface of the metrics endpoint, e.g. 0.0.0.0 for remote scraping
+
+
+@dataclass
+class SessionSettings:
+    """A further translation session, e.g. for a speaker of another source language."""
+
+    session_id: str
+    source_language: str
+    target_languages: List[str]  # Must be configured target languages of the selected translator
+    input_device_index: Optional[int] = None  # Defaults to the input device of the main session
 
 
 @dataclass
@@ -72,3 +138,5 @@ class UserConfig:
     output_settings: OutputSettings
     translator_settings: TranslatorSettings
     theme: str = 'light'
+    additional_sessions: List[SessionSettings] = field(default_factory=list)
+    monitoring_settings: MonitoringSettings = field(default_factory=MonitoringSettings)
@@ -27,6 +27,15 @@ AWS_REGIONS = {
     'ca-central-1': 'Canada',
 }
 
+# Partial-result stability levels of AWS Transcribe; higher stability means fewer revisions but later results.
+AWS_PARTIAL_RESULTS_STABILITY = ['high', 'medium', 'low']
+
+# Bounds of the worker threads running blocking AWS Translate/Polly calls, sized by the target languages.
+AWS_MIN_WORKERS = 4
+AWS_MAX_WORKERS = 64
+# Kept-alive HTTPS connections per pooled boto3 client; at least AWS_MAX_WORKERS so no worker opens a new one.
+AWS_MAX_POOL_CONNECTIONS = 64
+
 AWS_STANDARD_VOICES = {
     'de-DE': {'voice_ids': ['Vicki', 'Marlene', 'Hans']},
     'en-US': {'voice_ids': ['Joanna', 'Salli', 'Matthew', 'Kimberly', 'Kendra', 'Justin', 'Joey', 'Ivy']},
@@ -568,3 +577,16 @@ GOOGLE_ENDPOINTING_OPTIONS = {
     'Fast': 'short',
     'Max': 'supershort',
 }
+
+# What happens to new sentences when the per-language TTS queue is full.
+TTS_QUEUE_OVERFLOW_POLICIES = ['drop_oldest', 'merge', 'skip_lagging']
+
+# Maximum number of texts sent in one Google Translate request (the API accepts up to 1024).
+GOOGLE_TRANSLATE_MAX_BATCH_SIZE = 128
+
+# Batch translation of recordings: silence appended so the STT endpointing finalizes the last utterance,
+# and how long the pipeline must stay idle after the recording before the translation counts as complete.
+BATCH_TRAILING_SILENCE_SECONDS = 1.5
+BATCH_SETTLE_SECONDS = 3.0
+# TTS queue size of batch runs: the replay outpaces TTS, and every sentence has to end up in the output.
+BATCH_MAX_QUEUE_SIZE = sys.maxsize
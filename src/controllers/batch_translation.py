@@ -0,0 +1,89 @@
+"""Translation of a recording from start to end, as fast as the input pacing and the providers allow."""
+
+import asyncio
+import logging
+import time
+from dataclasses import replace
+from typing import Optional, Tuple
+
+from config.model.config_models import QueueSettings
+from constants import BATCH_MAX_QUEUE_SIZE, BATCH_SETTLE_SECONDS
+from sound_inputs.file_input import FileInput
+from translation import Translation
+
+LOGGER = logging.getLogger(__name__)
+
+POLL_SECONDS = 0.1
+
+
+def batch_queue_settings(queue_settings: QueueSettings) -> QueueSettings:
+    """Returns the queue settings for translating a recording, which keep every sentence.
+
+    The interactive settings drop sentences once TTS falls behind the speaker. A recording is usually
+    replayed faster than real time, and the translated output must not miss any of its content.
+
+    Args:
+        queue_settings (QueueSettings): The configured queue settings.
+    """
+    return replace(queue_settings, overflow_policy='drop_oldest', max_queue_size=BATCH_MAX_QUEUE_SIZE)
+
+
+async def translate_recording(
+    translation: Translation,
+    sound_input: FileInput,
+    settle_seconds: float = BATCH_SETTLE_SECONDS,
+    timeout: Optional[float] = None,
+) -> None:
+    """Runs the translation until the recording has been streamed and every sentence has been played.
+
+    The STT services report the last transcripts some time after the audio ended, so the translation
+    counts as complete once its queues have stayed idle for `settle_seconds` after the recording.
+
+    Args:
+        translation (Translation): Translation reading from the sound input.
+        sound_input (FileInput): The recording; it must be opened with `hold_open`, so the STT stream
+            stays open while the last sentences are translated.
+        settle_seconds (float): How long the pipeline must stay idle before the translation is stopped.
+        timeout (float, optional): Longest wait for the pipeline after the recording ended.
+    """
+    run_task = asyncio.create_task(translation.run_async())
+    finished_task = asyncio.create_task(sound_input.finished.wait())
+    try:
+        await asyncio.wait([run_task, finished_task], return_when=asyncio.FIRST_COMPLETED)
+        if not run_task.done():
+            LOGGER.info('Recording streamed, waiting for the last translations...')
+            await _wait_until_settled(translation, settle_seconds, timeout)
+            await translation.stop_async()
+        await run_task
+    finally:
+        finished_task.cancel()
+
+
+async def _wait_until_settled(translation: Translation, settle_seconds: float, timeout: Optional[float]) -> None:
+    started_at = time.perf_counter()
+    state = _pipeline_state(translation)
+    idle_since: Optional[float] = None
+    while timeout is None or time.perf_counter() - started_at < timeout:
+        await asyncio.sleep(POLL_SECONDS)
+        now = time.perf_counter()
+        current = _pipeline_state(translation)
+        if current != state or current is None:
+            # New sentences arrived or some are still in flight.
+            state = current
+            idle_since = None
+        elif idle_since is None:
+            idle_since = now
+        elif now - idle_since >= settle_seconds:
+            return
+    LOGGER.warning(f'Translation of the recording did not settle within {timeout:.0f} s.')
+
+
+def _pipeline_state(translation: Translation) -> Optional[Tuple[int, ...]]:
+    """Counts of the ended sentences per language, or None while sentences are waiting or in flight."""
+    queues = translation.translator.metrics().get('queues', {})
+    if any(stats['queue_depth'] or stats['in_flight'] for stats in queues.values()):
+        return None
+    return tuple(
+        stats['processed'] + stats['dropped'] + stats['merged'] + stats['skipped']
+        for _language, stats in sorted(queues.items())
+    )
@@ -0,0 +1,108 @@
+"""Prometheus metrics of the running translation sessions and their outputs."""
+
+from functools import partial
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+from translation import SoundOutput, Translation
+from utils.metrics_server import Histogram, PrometheusText
+
+PREFIX = 'live_translation_'
+
+# Metrics of the per-language speech queues: name -> (type, help)
+QUEUE_METRICS = {
+    'queue_depth': ('gauge', 'Sentences waiting for translation and TTS.'),
+    'in_flight': ('gauge', 'Sentences being translated, synthesized or played.'),
+    'lag_seconds': ('gauge', 'Time between queueing and playback of the most recently played sentence.'),
+    'processed': ('counter', 'Sentences handed to translation and TTS.'),
+    'dropped': ('counter', 'Sentences discarded because the queue was full.'),
+    'merged': ('counter', 'Sentences merged into a waiting sentence.'),
+    'skipped': ('counter', 'Sentences skipped because playback lagged behind the speaker.'),
+}
+
+# Longest wait for the event loop of a session to take the snapshot of its metrics
+SNAPSHOT_TIMEOUT_SECONDS = 2.0
+
+LATENCY_HELP = {
+    'translate': 'Seconds from the final transcript until the translation returned.',
+    'tts_first_byte': 'Seconds from the TTS request until the first synthesized audio arrived.',
+    'end_to_end': 'Seconds from the end of the speech until the translation started playing.',
+}
+
+
+class CacheCounters(Protocol):
+    hits: int
+    misses: int
+
+
+def render_metrics(
+    translations: Dict[str, Translation],
+    outputs: Dict[str, SoundOutput],
+    caches: Optional[Dict[str, CacheCounters]] = None,
+) -> str:
+    """Renders the metrics of the translation sessions and the outputs in the Prometheus text format.
+
+    The metrics of a session are read in its event loop, which is the only place they change.
+
+    Args:
+        translations (Dict[str, Translation]): Running translations by session id.
+        outputs (Dict[str, SoundOutput]): Outputs by target language, possibly shared by several sessions.
+        caches (Dict[str, CacheCounters], optional): Caches by name, possibly shared by several sessions;
+            rendered once, without a session label.
+    """
+    text = PrometheusText(PREFIX)
+    for session_id, translation in translations.items():
+        input_metrics, translator_metrics = translation.call_in_loop(
+            partial(_snapshot, translation), SNAPSHOT_TIMEOUT_SECONDS
+        )
+        text.add('session_up', 'gauge', 'Translation sessions that are running.', 1, {'session': session_id})
+        for name, value in input_metrics.items():
+            text.add(f'input_{name}_total', 'counter', f'Sound input counter {name}.', value, {'session': session_id})
+        _add_translator_metrics(text, session_id, translator_metrics)
+
+    for name, cache in (caches or {}).items():
+        labels = {'cache': name}
+        text.add('cache_hits_total', 'counter', 'Cache lookups answered from the cache.', cache.hits, labels)
+        text.add('cache_misses_total', 'counter', 'Cache lookups that missed.', cache.misses, labels)
+
+    for language, output in outputs.items():
+        labels = {'language': language, 'output': type(output).__name__}
+        for name, output_value in output.metrics().items():
+            if name.startswith('sent_'):
+                text.add(f'output_{name}_total', 'counter', f'Sound output counter {name}.', output_value, labels)
+            else:
+                text.add(f'output_{name}', 'gauge', f'Sound output gauge {name}.', output_value, labels)
+    return text.render()
+
+
+def _snapshot(translation: Translation) -> Tuple[Dict[str, int], Dict[str, Any]]:
+    return dict(translation.sound_input.metrics()), translation.translator.metrics()
+
+
+def _add_translator_metrics(text: PrometheusText, session_id: str, metrics: Dict[str, Any]) -> None:
+    provider = metrics.get('provider', 'unknown')
+    session_labels = {'session': session_id, 'provider': provider}
+
+    for language, stats in metrics.get('queues', {}).items():
+        labels = {**session_labels, 'language': language}
+        for name, (kind, help_text) in QUEUE_METRICS.items():
+            metric_name = f'tts_queue_{name}_total' if kind == 'counter' else f'tts_queue_{name}'
+            text.add(metric_name, kind, help_text, stats[name], labels)
+
+    for stage, histograms in metrics.get('latency_histograms', {}).items():
+        for language, histogram in histograms.items():
+            text.add_histogram(
+                f'{stage}_latency_seconds',
+                LATENCY_HELP.get(stage, f'Latency of the {stage} stage.'),
+                Histogram(**histogram),
+                {**session_labels, 'language': language},
+            )
+
+    stt = metrics.get('stt')
+    if stt is not None:
+        text.add(
+            'stt_restarts_total',
+            'counter',
+            'STT streams reopened after the server closed them.',
+            stt['restarts'],
+            session_labels,
+        )
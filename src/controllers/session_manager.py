@@ -0,0 +1,157 @@
+"""Hosting of several translation sessions, e.g. one per source language, in one process.
+
+All sessions run on one shared asyncio event loop in a single background thread. Besides saving a
+thread and loop per session, this lets sessions share loop-bound resources such as asynchronous
+cloud clients and the playback lock of an output that several sessions speak into. The loop keeps
+running after the sessions are stopped, so the pooled clients bound to it stay warm for the next run.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from translation import Translation
+from utils.utterance_trace import UtteranceTrace
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionMetrics:
+    """Runtime metrics of a single translation session."""
+
+    session_id: str
+    running: bool
+    uptime_seconds: float
+    translator: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _Session:
+    translation: Translation
+    future: Future
+    started_at: float
+
+
+class TranslationSessionManager:
+    """Runs translation sessions on a shared event loop in a background thread."""
+
+    def __init__(self, thread_name: str = 'TranslationServiceThread'):
+        """Initializes the TranslationSessionManager instance.
+
+        Args:
+            thread_name (str): Name of the thread running the shared event loop.
+        """
+        self._thread_name = thread_name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._sessions: Dict[str, _Session] = {}
+
+    @property
+    def session_ids(self) -> List[str]:
+        return list(self._sessions)
+
+    def start_session(self, session_id: str, translation: Translation) -> None:
+        """Starts the translation as a new session on the shared event loop.
+
+        Raises:
+            ValueError: If a session with the same id is still running.
+        """
+        session = self._sessions.get(session_id)
+        if session is not None and not session.future.done():
+            raise ValueError(f'Translation session "{session_id}" is already running.')
+
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(translation.run_async(), loop)
+        self._sessions[session_id] = _Session(translation, future, time.monotonic())
+        LOGGER.info(f'Translation session "{session_id}" started.')
+
+    def stop_session(self, session_id: str) -> None:
+        """Stops a session and waits for it to finish."""
+        session = self._sessions.pop(session_id, None)
+        if session is None or self._loop is None:
+            return
+        self._wait_for_stop(session_id, asyncio.run_coroutine_threadsafe(session.translation.stop_async(), self._loop))
+
+    def stop_all(self) -> None:
+        """Stops all sessions in parallel; the shared event loop keeps running."""
+        translations = [session.translation for session in self._sessions.values()]
+        if translations and self._loop is not None:
+
+            async def stop_translations():
+                await asyncio.gather(*(translation.stop_async() for translation in translations))
+
+            self._wait_for_stop('all', asyncio.run_coroutine_threadsafe(stop_translations(), self._loop))
+        self._sessions.clear()
+
+    def close(self) -> None:
+        """Stops all sessions and shuts the shared event loop down."""
+        self.stop_all()
+        if self._loop is None:
+            return
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=Translation.timeout)
+            if self._thread.is_alive():
+                LOGGER.warning('Translation session thread did not terminate within timeout.')
+        self._loop = None
+        self._thread = None
+
+    @property
+    def translations(self) -> Dict[str, Translation]:
+        return {session_id: session.translation for session_id, session in self._sessions.items()}
+
+    def metrics(self) -> Dict[str, SessionMetrics]:
+        """Returns the metrics of every session, including the statistics of its translator.
+
+        The statistics are read in the shared event loop, which is the only place they change.
+        """
+        now = time.monotonic()
+        return {
+            session_id: SessionMetrics(
+                session_id,
+                not session.future.done(),
+                now - session.started_at,
+                session.translation.call_in_loop(session.translation.translator.metrics, Translation.timeout),
+            )
+            for session_id, session in self._sessions.items()
+        }
+
+    def traces(self, session_id: str) -> List[UtteranceTrace]:
+        """Returns the latency traces of the recently completed utterances of a session."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            return []
+        return session.translation.call_in_loop(session.translation.translator.traces, Translation.timeout)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run_loop, args=(self._loop,), daemon=True, name=self._thread_name
+            )
+            self._thread.start()
+        return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        LOGGER.debug('Starting the shared translation event loop.')
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            LOGGER.debug('Shared translation event loop closed.')
+
+    @staticmethod
+    def _wait_for_stop(session_id: str, future: Future) -> None:
+        try:
+            future.result(Translation.timeout + 1)
+        except Exception as e:
+            LOGGER.warning(f'Exception while stopping translation session "{session_id}": {e}')
@@ -1,20 +1,41 @@
 import logging
 import threading
-from typing import Dict, Optional
+import time
+from dataclasses import replace
+from typing import Dict, Optional, Union
 
 from PySide6.QtCore import QObject, Signal
 
-from config.model.config_models import UserConfig
+from config.config_manager import ConfigManager
+from config.model.config_models import (
+    AWSSettings,
+    CacheSettings,
+    GoogleSettings,
+    LanguageSettings,
+    SessionSettings,
+    UserConfig,
+)
+from controllers.metrics_exporter import CacheCounters, render_metrics
+from controllers.session_manager import SessionMetrics, TranslationSessionManager
 from sound_inputs.microphone import Microphone
+from sound_inputs.mixer import MicrophoneMixer
+from sound_inputs.voice_activity_gate import VoiceActivityGate
 from sound_outputs.mumble import MumbleClient
 from sound_outputs.speaker import Speaker
-from translation import SoundOutput, Translation, Translator
+from translation import SoundInput, SoundOutput, Translation, Translator
 from translators.aws_translator import AWSTranslator
+from translators.client_pool import CLIENT_POOL
 from translators.google_translator import GoogleTranslator
+from translators.speech_cache import SpeechCache
+from translators.translation_cache import TranslationCache
 from translators.translation_callbacks import TranslationCallbacks
+from utils.metrics_server import MetricsServer
+from utils.utterance_trace import UtteranceTracer
 
 LOGGER = logging.getLogger(__name__)
 
+MAIN_SESSION_ID = 'main'
+
 
 class TranslationController(QObject):
     """
@@ -36,8 +57,13 @@ class TranslationController(QObject):
             update_source_field=self.update_source_field_signal.emit,
             update_target_field=self.update_target_field_signal.emit,
         )
-        self._translation_thread: Optional[threading.Thread] = None
-        self._translation: Optional[Translation] = None
+        self._sessions = TranslationSessionManager()
+        self._outputs: Dict[str, SoundOutput] = {}
+        # Caches outlive a single translation run, so restarting the service keeps them warm.
+        self._translation_caches: Dict[str, TranslationCache] = {}
+        self._speech_cache: Optional[SpeechCache] = None
+        self._cache_settings: Optional[CacheSettings] = None
+        self._metrics_server: Optional[MetricsServer] = None
 
     def start_service(self, config: UserConfig):
         """Initializes and starts the translation service in a separate thread."""
@@ -46,19 +72,33 @@ class TranslationController(QObject):
         self.stop_button_enabled.emit(True)
         self.status_label_signal.emit('Status: Starting...')
         LOGGER.debug('Initiating translation service setup.')
+        started_at = time.perf_counter()
 
         try:
-            translator, target_languages = self._create_translator(config)
-            lang_to_output = self._create_outputs(config, target_languages)
-            microphone = Microphone(config.input_settings)
+            session_configs = {MAIN_SESSION_ID: config}
+            for session in config.additional_sessions:
+                session_configs[session.session_id] = self._create_session_config(config, session)
+
+            translations = {}
+            target_languages: Dict[str, LanguageSettings] = {}
+            for session_id, session_config in session_configs.items():
+                translator, session_languages = self._create_translator(session_config, session_id)
+                sound_input = self._create_sound_input(session_config)
+                translations[session_id] = (translator, sound_input, list(session_languages))
+                target_languages.update(session_languages)
             LOGGER.debug('Microphone input initialized.')
 
-            self._translation = Translation(translator, microphone, lang_to_output)
-            self._translation_thread = threading.Thread(
-                target=self._translation.run, daemon=True, name='TranslationServiceThread'
+            # Sessions translating into the same language share its output.
+            self._outputs = self._create_outputs(config, target_languages)
+            for session_id, (translator, sound_input, languages) in translations.items():
+                lang_to_output = {language: self._outputs[language] for language in languages}
+                translation = Translation(translator, sound_input, lang_to_output, stop_outputs=False)
+                self._sessions.start_session(session_id, translation)
+            LOGGER.info(
+                f'Translation service started with {len(translations)} session(s) in '
+                f'{(time.perf_counter() - started_at) * 1000:.0f} ms, client pool: {CLIENT_POOL.stats}'
             )
-            self._translation_thread.start()
-            LOGGER.info('Translation service thread started.')
+            self._start_metrics_server(config)
 
             self.status_label_signal.emit('Status: Running')
             self.status_message_signal.emit('Translation service is now running!', 3000)
@@ -68,8 +108,18 @@ class TranslationController(QObject):
             self.status_message_signal.emit(error_msg, 7000)
             self.status_label_signal.emit('Status: Error')
             LOGGER.critical(error_msg, exc_info=True)
+            self._sessions.stop_all()
+            self._stop_outputs()
             self._reset_gui_state_on_error()
 
+    def render_metrics(self) -> str:
+        """Returns the metrics of the running sessions and outputs in the Prometheus text format."""
+        return render_metrics(self._sessions.translations, self._outputs, self._caches())
+
+    def session_metrics(self) -> Dict[str, SessionMetrics]:
+        """Returns the metrics of the running translation sessions."""
+        return self._sessions.metrics()
+
     def stop_service(self):
         """Initiates a non-blocking shutdown of the translation service."""
         self.status_message_signal.emit('Translation service stopping...', 5000)
@@ -81,16 +131,80 @@ class TranslationController(QObject):
         shutdown_thread = threading.Thread(target=self._shutdown_and_join, daemon=True)
         shutdown_thread.start()
 
-    def _create_translator(self, config: UserConfig) -> tuple[Translator, dict]:
+    @staticmethod
+    def _create_sound_input(config: UserConfig) -> SoundInput:
+        """Creates the microphone, or the mixer of several microphones, gated by VAD if enabled."""
+        input_settings = config.input_settings
+        sound_input: SoundInput
+        if len(input_settings.mixer_settings.device_indices) > 1:
+            mixer = MicrophoneMixer.from_settings(input_settings, config.translator_settings.translator == 'aws')
+            input_settings = replace(input_settings, input_channels=mixer.channels)
+            sound_input = mixer
+        else:
+            sound_input = Microphone(input_settings)
+
+        if input_settings.vad_settings.enabled:
+            sound_input = VoiceActivityGate(sound_input, input_settings)
+        return sound_input
+
+    @staticmethod
+    def _create_session_config(config: UserConfig, session: SessionSettings) -> UserConfig:
+        """Derives the configuration of an additional session from the main configuration."""
+        translator_settings = config.translator_settings
+        provider_settings: Optional[Union[AWSSettings, GoogleSettings]] = (
+            translator_settings.aws_settings
+            if translator_settings.translator == 'aws'
+            else translator_settings.google_settings
+        )
+        if provider_settings is None:
+            raise ValueError(
+                f'Translator "{translator_settings.translator}" of session "{session.session_id}" is not configured.'
+            )
+
+        missing = [
+            language for language in session.target_languages if language not in provider_settings.target_languages
+        ]
+        if missing:
+            raise ValueError(f'Target languages {missing} of session "{session.session_id}" are not configured.')
+
+        provider_settings = replace(
+            provider_settings,
+            source_language=session.source_language,
+            target_languages={
+                language: provider_settings.target_languages[language] for language in session.target_languages
+            },
+        )
+        if isinstance(provider_settings, AWSSettings):
+            translator_settings = replace(translator_settings, aws_settings=provider_settings)
+        else:
+            translator_settings = replace(translator_settings, google_settings=provider_settings)
+
+        input_settings = config.input_settings
+        if session.input_device_index is not None:
+            input_settings = replace(input_settings, input_device_index=session.input_device_index)
+
+        return replace(config, input_settings=input_settings, translator_settings=translator_settings)
+
+    def _create_translator(self, config: UserConfig, session_id: str = MAIN_SESSION_ID) -> tuple[Translator, dict]:
         """Instantiates the correct Translator based on config and returns it with its target language dict."""
         translator_type = config.translator_settings.translator
+        tracer = UtteranceTracer(session_id, config.monitoring_settings.trace_file)
 
         if translator_type == 'aws':
             aws_settings = config.translator_settings.aws_settings
             if aws_settings is None:
                 raise ValueError('AWS translator selected but AWS settings are not configured.')
 
-            translator = AWSTranslator(aws_settings, config.input_settings, config.output_settings, self._callbacks)
+            translator = AWSTranslator(
+                aws_settings,
+                config.input_settings,
+                config.output_settings,
+                self._callbacks,
+                self._get_translation_cache(config, translator_type),
+                self._get_speech_cache(config),
+                config.translator_settings.queue_settings,
+                tracer,
+            )
             LOGGER.debug('AWS Translator initialized.')
             return translator, aws_settings.target_languages
 
@@ -100,7 +214,14 @@ class TranslationController(QObject):
                 raise ValueError('Google translator selected but Google settings are not configured.')
 
             translator = GoogleTranslator(
-                google_settings, config.input_settings, config.output_settings, self._callbacks
+                google_settings,
+                config.input_settings,
+                config.output_settings,
+                self._callbacks,
+                self._get_translation_cache(config, translator_type),
+                self._get_speech_cache(config),
+                config.translator_settings.queue_settings,
+                tracer,
             )
             LOGGER.debug('Google Translator initialized.')
 
@@ -108,6 +229,61 @@ class TranslationController(QObject):
 
         raise ValueError(f'Translator type "{translator_type}" not supported.')
 
+    def _refresh_caches(self, config: UserConfig):
+        """Drops the caches if the cache settings changed since they were created, so they are rebuilt."""
+        cache_settings = config.translator_settings.cache_settings
+        if cache_settings == self._cache_settings:
+            return
+
+        if self._cache_settings is not None:
+            LOGGER.debug('Cache settings changed, rebuilding caches.')
+        self._save_caches()
+        self._translation_caches = {}
+        self._speech_cache = None
+        # The settings object is edited in place by the GUI, so compare against a copy.
+        self._cache_settings = replace(cache_settings)
+
+    def _save_caches(self):
+        """Logs the cache statistics and persists the translation caches."""
+        for provider, translation_cache in self._translation_caches.items():
+            LOGGER.info(
+                f'{provider} translation cache: {translation_cache.hits} hits, {translation_cache.misses} misses '
+                f'({translation_cache.hit_rate:.0%})'
+            )
+            translation_cache.save()
+        if self._speech_cache is not None:
+            speech_cache = self._speech_cache
+            LOGGER.info(
+                f'Speech cache: {speech_cache.hits} hits, {speech_cache.misses} misses ({speech_cache.hit_rate:.0%})'
+            )
+
+    def _caches(self) -> Dict[str, CacheCounters]:
+        """Returns the caches shared by the sessions, by the name their metrics are exported under."""
+        caches: Dict[str, CacheCounters] = {
+            f'{provider}_translation': cache for provider, cache in self._translation_caches.items()
+        }
+        if self._speech_cache is not None:
+            caches['speech'] = self._speech_cache
+        return caches
+
+    def _get_translation_cache(self, config: UserConfig, provider: str) -> TranslationCache:
+        """Returns the translation cache of the provider, creating it on first use."""
+        self._refresh_caches(config)
+        if provider not in self._translation_caches:
+            self._translation_caches[provider] = TranslationCache.from_settings(
+                config.translator_settings.cache_settings, ConfigManager.get_app_config_dir() / 'cache', provider
+            )
+        return self._translation_caches[provider]
+
+    def _get_speech_cache(self, config: UserConfig) -> SpeechCache:
+        """Returns the speech cache shared by all providers, creating it on first use."""
+        self._refresh_caches(config)
+        if self._speech_cache is None:
+            self._speech_cache = SpeechCache.from_settings(
+                config.translator_settings.cache_settings, ConfigManager.get_app_config_dir() / 'cache'
+            )
+        return self._speech_cache
+
     def _create_outputs(self, config: UserConfig, target_languages: dict) -> Dict[str, SoundOutput]:
         """Instantiates and connects the correct SoundOutput instances for each target language."""
         output_method = config.output_settings.output_method
@@ -137,15 +313,16 @@ class TranslationController(QObject):
 
     def _shutdown_and_join(self):
         """Runs in a separate thread to cleanly stop the translation service."""
-        if self._translation and self._translation_thread and self._translation_thread.is_alive():
-            try:
-                self._translation.stop()
-                LOGGER.debug('Signaled translation service to stop. Waiting for thread to join...')
-                self._translation_thread.join(timeout=10)
-                if self._translation_thread.is_alive():
-                    LOGGER.warning('Translation thread did not terminate within timeout. Forcing cleanup.')
-            except Exception as e:
-                LOGGER.error(f'Error during thread shutdown: {e}', exc_info=True)
+        self._stop_metrics_server()
+        try:
+            for metrics in self._sessions.metrics().values():
+                LOGGER.info(f'Translation session metrics: {metrics}')
+            self._sessions.stop_all()
+        except Exception as e:
+            LOGGER.error(f'Error during translation service shutdown: {e}', exc_info=True)
+        self._stop_outputs()
+
+        self._save_caches()
 
         LOGGER.info('Translation service stopped')
         self.status_label_signal.emit('Status: Stopped')
@@ -153,6 +330,28 @@ class TranslationController(QObject):
         self.start_button_enabled.emit(True)
         self.stop_button_enabled.emit(False)
 
+    def _start_metrics_server(self, config: UserConfig):
+        monitoring = config.monitoring_settings
+        if not monitoring.metrics_port or self._metrics_server is not None:
+            return
+        try:
+            self._metrics_server = MetricsServer(self.render_metrics, monitoring.metrics_port, monitoring.metrics_host)
+            self._metrics_server.start()
+        except OSError as e:
+            # The translation keeps running without the endpoint, e.g. when the port is taken.
+            LOGGER.error(f'Could not start the metrics endpoint on port {monitoring.metrics_port}: {e}')
+            self._metrics_server = None
+
+    def _stop_metrics_server(self):
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+            self._metrics_server = None
+
+    def _stop_outputs(self):
+        for output in self._outputs.values():
+            output.stop_audio_stream()
+        self._outputs = {}
+
     def _reset_gui_state_on_error(self):
         """Resets the GUI state after a startup failure."""
         self.start_button_enabled.emit(True)
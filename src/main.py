@@ -1,20 +1,33 @@
 import argparse
+import asyncio
 import logging
 import sys
+from dataclasses import replace
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from typing import Dict, Optional
 
 from PySide6.QtWidgets import QApplication
 
 from config.config_manager import ConfigManager
 from config.model.config_models import UserConfig
+from constants import BATCH_TRAILING_SILENCE_SECONDS
+from controllers.batch_translation import batch_queue_settings, translate_recording
+from controllers.metrics_exporter import render_metrics
 from main_window import MainWindow
+from sound_inputs.file_input import FileInput
 from sound_inputs.microphone import Microphone
+from sound_inputs.mixer import MicrophoneMixer
+from sound_inputs.voice_activity_gate import VoiceActivityGate
 from sound_outputs.mumble import MumbleClient
+from sound_outputs.recording_output import RecordingOutput
 from sound_outputs.speaker import Speaker
-from translation import Translation
+from translation import SoundInput, SoundOutput, Translation
 from translators.aws_translator import AWSTranslator
 from translators.google_translator import GoogleTranslator
+from translators.speech_cache import SpeechCache
+from translators.translation_cache import TranslationCache
+from utils.metrics_server import MetricsServer
 
 
 def get_log_file_path() -> Path:
@@ -76,7 +89,7 @@ def run_cli_mode(arguments, usr_config: UserConfig):
     if arguments.source_lang:
         usr_config.translator_settings.aws_settings.source_language = arguments.source_lang
 
-    input_method = 'mic'  # Currently only microphone is supported
+    input_method = 'file' if arguments.input else 'mic'
     output_method = usr_config.output_settings.output_method
     translator_type = usr_config.translator_settings.translator
 
@@ -85,6 +98,44 @@ def run_cli_mode(arguments, usr_config: UserConfig):
     if not target_langs:
         target_langs = list(usr_config.translator_settings.aws_settings.target_languages.keys())
 
+    # The input is created first: a mixer or a recording determines the channels and sample rate
+    # the translator has to request from the STT service.
+    input_settings = usr_config.input_settings
+    sound_input: SoundInput
+    recording: Optional[FileInput] = None
+    if input_method == 'file':
+        sound_input = recording = FileInput(
+            arguments.input,
+            input_settings,
+            arguments.input_speed,
+            trailing_silence_seconds=BATCH_TRAILING_SILENCE_SECONDS,
+            hold_open=True,
+        )
+        input_settings = replace(
+            input_settings, input_sample_rate=sound_input.sample_rate, input_channels=sound_input.channels
+        )
+    elif input_method == 'mic' and len(input_settings.mixer_settings.device_indices) > 1:
+        mixer = MicrophoneMixer.from_settings(input_settings, translator_type == 'aws')
+        input_settings = replace(input_settings, input_channels=mixer.channels)
+        sound_input = mixer
+    elif input_method == 'mic':
+        sound_input = Microphone(input_settings)
+    else:
+        raise ValueError(f'Unsupported input method: {input_method}')
+
+    if input_settings.vad_settings.enabled:
+        sound_input = VoiceActivityGate(sound_input, input_settings)
+
+    queue_settings = usr_config.translator_settings.queue_settings
+    if input_method == 'file' or arguments.output_dir:
+        # Recordings are translated completely, however far TTS falls behind the replay.
+        queue_settings = batch_queue_settings(queue_settings)
+
+    cache_dir = ConfigManager.get_app_config_dir() / 'cache'
+    cache_settings = usr_config.translator_settings.cache_settings
+    translation_cache = TranslationCache.from_settings(cache_settings, cache_dir, translator_type)
+    speech_cache = SpeechCache.from_settings(cache_settings, cache_dir)
+
     if translator_type == 'aws':
         # Ensure target languages from CLI are in the config
         for lang in target_langs:
@@ -93,8 +144,11 @@ def run_cli_mode(arguments, usr_config: UserConfig):
 
         translator = AWSTranslator(
             usr_config.translator_settings.aws_settings,
-            usr_config.input_settings,
+            input_settings,
             usr_config.output_settings,
+            translation_cache=translation_cache,
+            speech_cache=speech_cache,
+            queue_settings=queue_settings,
         )
     elif translator_type == 'google':
         # Ensure target languages from CLI are in the config
@@ -104,26 +158,35 @@ def run_cli_mode(arguments, usr_config: UserConfig):
 
         translator = GoogleTranslator(
             usr_config.translator_settings.google_settings,
-            usr_config.input_settings,
+            input_settings,
             usr_config.output_settings,
+            translation_cache=translation_cache,
+            speech_cache=speech_cache,
+            queue_settings=queue_settings,
         )
     else:
         raise ValueError(f'Unsupported translator: {translator_type}')
 
-    if input_method == 'mic':
-        sound_input = Microphone(usr_config.input_settings)
-    else:
-        raise ValueError(f'Unsupported input method: {input_method}')
+    if arguments.output_dir:
+        # Recorded translations are written per language, without waiting for real-time playback.
+        output_method = 'file'
+        Path(arguments.output_dir).mkdir(parents=True, exist_ok=True)
 
     if output_method == 'speaker' and len(target_langs) > 1:
         raise ValueError('Multiple target_lang for speaker output not supported')
 
-    target_language_mapping = {}
+    target_language_mapping: Dict[str, SoundOutput] = {}
 
     for language in target_langs:
-        if output_method == 'mumble':
-            sound_output = MumbleClient(usr_config.output_settings, language)
-            sound_output.connect()
+        sound_output: SoundOutput
+        if output_method == 'file':
+            sound_output = RecordingOutput(
+                usr_config.output_settings, str(Path(arguments.output_dir) / f'{language}.wav')
+            )
+        elif output_method == 'mumble':
+            mumble_client = MumbleClient(usr_config.output_settings, language)
+            mumble_client.connect()
+            sound_output = mumble_client
         elif output_method == 'speaker':
             sound_output = Speaker(usr_config.output_settings)
         else:
@@ -133,12 +196,32 @@ def run_cli_mode(arguments, usr_config: UserConfig):
 
     translation = Translation(translator, sound_input, target_language_mapping)
 
+    metrics_server = None
+    metrics_port = arguments.metrics_port or usr_config.monitoring_settings.metrics_port
+    if metrics_port:
+        metrics_server = MetricsServer(
+            lambda: render_metrics(
+                {'main': translation},
+                target_language_mapping,
+                {f'{translator_type}_translation': translation_cache, 'speech': speech_cache},
+            ),
+            metrics_port,
+            usr_config.monitoring_settings.metrics_host,
+        )
+        metrics_server.start()
+
     try:
-        translation.run()
+        if recording is not None:
+            asyncio.run(translate_recording(translation, recording))
+        else:
+            translation.run()
     finally:
         LOGGER.info('Translation stopped')
+        if metrics_server is not None:
+            metrics_server.stop()
         for output in target_language_mapping.values():
             output.stop_audio_stream()
+        translation_cache.save()
 
 
 def run_gui_mode(conf_manager: ConfigManager):
@@ -172,6 +255,29 @@ if __name__ == '__main__':
         help='Target language(s) (e.g. en-US ru-RU)',
     )
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose logging')
+    parser.add_argument(
+        '-i',
+        '--input',
+        help='Translate a recording instead of the microphone (CLI mode): a WAV file, a raw 16-bit PCM file, '
+        'or - for raw PCM on stdin. Raw audio uses the configured input sample rate and channels.',
+    )
+    parser.add_argument(
+        '--input-speed',
+        type=float,
+        default=1.0,
+        help='Replay speed of --input relative to real time; 0 streams as fast as the STT service reads',
+    )
+    parser.add_argument(
+        '-o',
+        '--output-dir',
+        help='Write the translations to <output-dir>/<language>.wav instead of the configured output (CLI mode)',
+    )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=0,
+        help='Serve Prometheus metrics on this port (CLI mode, overrides monitoring_settings.metrics_port)',
+    )
 
     args = parser.parse_args()
 
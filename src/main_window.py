@@ -307,15 +307,25 @@ class MainWindow(QMainWindow):
     def _collect_config_data(self) -> UserConfig:
         """Collects all configuration data from the GUI widgets."""
         LOGGER.debug('Collecting configuration data from GUI.')
+        # Settings without GUI controls are carried over from the current configuration.
+        current_input_settings = self._config_manager.config.input_settings
+        current_translator_settings = self._config_manager.config.translator_settings
         try:
+            current_aws = current_translator_settings.aws_settings
+            current_google = current_translator_settings.google_settings
             input_settings = InputSettings(
                 input_device=self.audio_tab_widget.input_device.currentText(),
                 input_device_index=self.audio_tab_widget.input_device.currentData(),
                 input_channels=self.audio_tab_widget.input_channels.value(),
                 input_sample_rate=self.audio_tab_widget.input_sample_rate.value(),
+                input_buffer_seconds=current_input_settings.input_buffer_seconds,
+                stt_chunk_ms=current_input_settings.stt_chunk_ms,
+                vad_settings=current_input_settings.vad_settings,
+                mixer_settings=current_input_settings.mixer_settings,
             )
             mumble_widget = self.output_tab_widget.mumble_widget
             use_custom_server = mumble_widget.use_custom_server
+            stored_mumble_settings = self._config_manager.config.output_settings.mumble_settings
             output_settings = OutputSettings(
                 output_method=self.output_tab_widget.output_method.currentText(),
                 output_sample_rate=self.output_tab_widget.output_sample_rate.value(),
@@ -329,7 +339,8 @@ class MainWindow(QMainWindow):
                     port=int(mumble_widget.mumble_port.text()),
                     language_channel_mapping=mumble_widget.get_current_mappings(),
                     use_custom_server=use_custom_server,
-                    superuser_password=self._config_manager.config.output_settings.mumble_settings.superuser_password,
+                    superuser_password=stored_mumble_settings.superuser_password,
+                    mirror_channel_mapping=stored_mumble_settings.mirror_channel_mapping,
                 ),
             )
 
@@ -368,6 +379,9 @@ class MainWindow(QMainWindow):
                     source_language=self.translator_tab_widget.aws_tab_widget.aws_source_lang.currentData(),
                     show_source_transcript=self.live_output_dashboard.show_source_transcript_checkbox.isChecked(),
                     target_languages=aws_target_languages,
+                    speculative_translation=current_aws.speculative_translation if current_aws else False,
+                    partial_results_stability=current_aws.partial_results_stability if current_aws else 'high',
+                    prewarm_connections=current_aws.prewarm_connections if current_aws else False,
                 ),
                 google_settings=GoogleSettings(
                     credentials_path=self.translator_tab_widget.google_tab_widget.get_credentials_path(),
@@ -376,13 +390,19 @@ class MainWindow(QMainWindow):
                     target_languages=google_target_languages,
                     endpointing_sensitivity=self.translator_tab_widget.google_tab_widget.get_endpointing_sensitivity(),
                     region=self.translator_tab_widget.google_tab_widget.get_region(),
+                    interim_results=current_google.interim_results if current_google else False,
+                    prewarm_connections=current_google.prewarm_connections if current_google else False,
                 ),
+                cache_settings=current_translator_settings.cache_settings,
+                queue_settings=current_translator_settings.queue_settings,
             )
             return UserConfig(
                 input_settings,
                 output_settings,
                 translator_settings,
                 theme=self._current_theme,
+                additional_sessions=self._config_manager.config.additional_sessions,
+                monitoring_settings=self._config_manager.config.monitoring_settings,
             )
         except Exception as e:
             LOGGER.error('Error while collecting config data from GUI widgets.', exc_info=True)
@@ -0,0 +1,141 @@
+"""Sound input replaying recorded audio instead of capturing a microphone.
+
+The audio comes from a WAV file, a raw 16-bit PCM file or raw PCM on stdin (`-`), e.g. piped from
+`ffmpeg -f s16le`. Raw audio has the sample rate and channels of the input settings. It is streamed
+in chunks of `stt_chunk_ms`, paced like live capture or faster, so the translators see the same
+chunk sizes and timing as from a `Microphone`. Trailing silence can be appended so the STT
+endpointing finalizes the last utterance of the recording.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+import wave
+from asyncio import Event
+from contextlib import contextmanager
+from typing import AsyncGenerator, Callable, Dict, Iterator, Optional
+
+from config.model.config_models import InputSettings
+from translation import SoundInput
+
+LOGGER = logging.getLogger(__name__)
+
+STDIN_PATH = '-'
+
+
+class FileInput(SoundInput):
+    """Streams 16-bit PCM audio from a WAV file, a raw PCM file or stdin as if it were captured live."""
+
+    def __init__(
+        self,
+        path: str,
+        input_settings: InputSettings,
+        speed: float = 1.0,
+        trailing_silence_seconds: float = 0.0,
+        hold_open: bool = False,
+    ):
+        """Initializes the FileInput instance.
+
+        Args:
+            path (str): WAV or raw PCM file to replay, or `-` for raw PCM on stdin.
+            input_settings (InputSettings): Input settings; `stt_chunk_ms` sets the chunk size, and the
+                sample rate and channels describe raw audio.
+            speed (float): Replay speed relative to real time; 0 replays as fast as the consumer reads.
+            trailing_silence_seconds (float): Silence streamed after the recording.
+            hold_open (bool): Keep the stream open after the recording until shutdown, like a muted microphone.
+        """
+        self._path = path
+        self._is_wav = path != STDIN_PATH and self._has_wav_header(path)
+        self.sample_rate = input_settings.input_sample_rate
+        self.channels = input_settings.input_channels
+        # Unknown for stdin
+        self.duration_seconds: Optional[float] = None
+
+        if self._is_wav:
+            with wave.open(path, 'rb') as wav:
+                if wav.getsampwidth() != 2:
+                    raise ValueError(f'{path} is not a 16-bit PCM WAV file.')
+                self.sample_rate = wav.getframerate()
+                self.channels = wav.getnchannels()
+                self.duration_seconds = wav.getnframes() / self.sample_rate
+        elif path != STDIN_PATH:
+            self.duration_seconds = os.path.getsize(path) / (self.sample_rate * self.channels * 2)
+
+        self._speed = speed
+        self._trailing_silence_seconds = trailing_silence_seconds
+        self._hold_open = hold_open
+        self._chunk_frames = max(1, self.sample_rate * input_settings.stt_chunk_ms // 1000)
+        self._sent_bytes = 0
+        self.finished = asyncio.Event()  # Set once the recording and trailing silence were streamed
+
+    async def get_audio_stream(self, shutdown_event: Event) -> AsyncGenerator[bytes, None]:
+        """Streams the recording and the trailing silence in chunks of `stt_chunk_ms`.
+
+        Yields:
+            bytes: Audio data chunks.
+        """
+        self.finished.clear()
+        frame_bytes = self.channels * 2
+        chunk_bytes = self._chunk_frames * frame_bytes
+        bytes_per_second = self.sample_rate * frame_bytes
+        started_at = time.perf_counter()
+        streamed_seconds = 0.0
+
+        LOGGER.debug(f'Replaying {self._path} at {self._speed or "maximum"} speed')
+        with self._open_reader() as read:
+            silence_chunks = int(self._trailing_silence_seconds * self.sample_rate / self._chunk_frames)
+            while not shutdown_event.is_set():
+                if self._path == STDIN_PATH:
+                    # Reading a pipe blocks until the writer delivers the audio.
+                    chunk = await asyncio.to_thread(read, chunk_bytes)
+                else:
+                    chunk = read(chunk_bytes)
+                chunk = chunk[: len(chunk) - len(chunk) % frame_bytes]
+                if not chunk:
+                    if silence_chunks <= 0:
+                        break
+                    chunk = b'\x00' * chunk_bytes
+                    silence_chunks -= 1
+
+                # Deadlines are taken from the start, so the pacing does not drift with slow consumers.
+                streamed_seconds += len(chunk) / bytes_per_second
+                if self._speed > 0:
+                    delay = started_at + streamed_seconds / self._speed - time.perf_counter()
+                    await asyncio.sleep(max(0.0, delay))
+                else:
+                    await asyncio.sleep(0)
+                self._sent_bytes += len(chunk)
+                yield chunk
+
+        self.finished.set()
+        LOGGER.debug(f'Replay of {self._path} finished after {time.perf_counter() - started_at:.1f} s')
+        if self._hold_open:
+            await shutdown_event.wait()
+
+    def metrics(self) -> Dict[str, int]:
+        return {'sent_bytes': self._sent_bytes}
+
+    def stop_audio_stream(self):
+        """Nothing to release; the file is closed when the stream ends."""
+        pass
+
+    @contextmanager
+    def _open_reader(self) -> Iterator[Callable[[int], bytes]]:
+        """Yields a function reading up to the given number of bytes of PCM audio."""
+        if self._path == STDIN_PATH:
+            yield sys.stdin.buffer.read
+        elif self._is_wav:
+            frame_bytes = self.channels * 2
+            with wave.open(self._path, 'rb') as wav:
+                yield lambda size: wav.readframes(size // frame_bytes)
+        else:
+            with open(self._path, 'rb') as f:
+                yield f.read
+
+    @staticmethod
+    def _has_wav_header(path: str) -> bool:
+        with open(path, 'rb') as f:
+            header = f.read(12)
+        return header[:4] == b'RIFF' and header[8:12] == b'WAVE'
@@ -1,17 +1,20 @@
 import asyncio
-import contextlib
 import logging
 from asyncio import AbstractEventLoop, Event
-from typing import AsyncGenerator, List, Mapping, Optional, Tuple
+from typing import AsyncGenerator, Dict, List, Mapping, Optional, Tuple
 
 import pyaudio
 from pyaudio import Stream
 
 from config.model.config_models import InputSettings
 from translation import SoundInput
+from utils.pcm_ring_buffer import PcmRingBuffer
 
 LOGGER = logging.getLogger(__name__)
 
+# Upper bound for a coalesced chunk, in multiples of the configured STT chunk size.
+MAX_COALESCED_CHUNKS = 4
+
 
 class Microphone(SoundInput):
     def __init__(self, input_settings: InputSettings):
@@ -25,19 +28,32 @@ class Microphone(SoundInput):
         self._input_settings = input_settings
         self._audio_stream: Optional[Stream] = None
         self._loop: Optional[AbstractEventLoop] = None
-        self._input_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=100)
 
         self._input_device_info = self._get_input_device(self._input_settings.input_device_index)
         # Use ~100ms audio chunks to reduce end-of-utterance latency for streaming STT.
         self._buffer_frames = int(self._input_settings.input_sample_rate / 10)
 
+        # The PortAudio callback copies into a preallocated ring buffer; the consumer takes at least
+        # `stt_chunk_ms` of audio at a time and coalesces whatever accumulated while it was busy.
+        bytes_per_second = self._input_settings.input_sample_rate * self._input_settings.input_channels * 2
+        frame_bytes = self._input_settings.input_channels * 2
+        self._chunk_bytes = max(
+            frame_bytes, bytes_per_second * input_settings.stt_chunk_ms // 1000 // frame_bytes * frame_bytes
+        )
+        self._max_chunk_bytes = self._chunk_bytes * MAX_COALESCED_CHUNKS
+        self._ring_buffer = PcmRingBuffer(
+            max(self._max_chunk_bytes, int(bytes_per_second * input_settings.input_buffer_seconds))
+        )
+        self._data_ready = asyncio.Event()
+
     async def get_audio_stream(self, shutdown_event: Event) -> AsyncGenerator[bytes, None]:
-        """Streams audio from the microphone to an asyncio.Queue.
+        """Streams audio from the microphone through a ring buffer.
 
         Yields:
             bytes: Audio data chunks.
         """
         self._loop = asyncio.get_running_loop()
+        self._ring_buffer.clear()
         self._audio_stream = self._pa.open(
             format=pyaudio.paInt16,
             channels=self._input_settings.input_channels,
@@ -54,8 +70,13 @@ class Microphone(SoundInput):
 
         try:
             while not shutdown_event.is_set():
-                indata = await self._input_queue.get()
-                yield indata
+                if self._ring_buffer.available < self._chunk_bytes:
+                    self._data_ready.clear()
+                    # Re-check after clearing, the callback may have filled the buffer in between.
+                    if self._ring_buffer.available < self._chunk_bytes:
+                        await self._data_ready.wait()
+                    continue
+                yield self._ring_buffer.read(self._max_chunk_bytes)
         except asyncio.CancelledError:
             LOGGER.debug('Audio stream cancelled.')
 
@@ -73,8 +94,21 @@ class Microphone(SoundInput):
             self._pa = None
 
         self._audio_stream = None
+        if self._ring_buffer.overruns:
+            LOGGER.warning(
+                f'Microphone buffer overran {self._ring_buffer.overruns} times, '
+                f'dropped {self._ring_buffer.overrun_bytes} bytes of audio.'
+            )
         LOGGER.debug('Microphone stream stopped and PyAudio terminated.')
 
+    @property
+    def overruns(self) -> int:
+        """Number of audio buffers dropped because the translator did not keep up."""
+        return self._ring_buffer.overruns
+
+    def metrics(self) -> Dict[str, int]:
+        return {'dropped_chunks': self._ring_buffer.overruns, 'dropped_bytes': self._ring_buffer.overrun_bytes}
+
     def _callback(self, indata: bytes, *args, **kwargs) -> Tuple[Optional[bytes], int]:
         """Callback function for the audio stream.
         Args:
@@ -83,12 +117,14 @@ class Microphone(SoundInput):
         if self._loop is None:
             return None, pyaudio.paContinue
 
-        if self._input_queue.full():
-            LOGGER.warning('Input audio queue is full, dropping audio chunk.')
+        if not self._ring_buffer.write(indata):
+            # Only the first overrun is logged; the total is reported when the stream stops.
+            if self._ring_buffer.overruns == 1:
+                LOGGER.warning('Input audio buffer is full, dropping audio until the translator catches up.')
             return None, pyaudio.paContinue
 
-        with contextlib.suppress(asyncio.QueueFull):
-            self._loop.call_soon_threadsafe(self._input_queue.put_nowait, indata)
+        if self._ring_buffer.available >= self._chunk_bytes and not self._data_ready.is_set():
+            self._loop.call_soon_threadsafe(self._data_ready.set)
 
         return None, pyaudio.paContinue
 
@@ -0,0 +1,190 @@
+"""Fan-in of several sound inputs into the single audio stream of one translation session."""
+
+import asyncio
+import logging
+import operator
+import sys
+from array import array
+from asyncio import Event
+from dataclasses import replace
+from itertools import repeat
+from typing import AsyncGenerator, Dict, Iterable, List, Optional, Sequence
+
+from config.model.config_models import InputSettings
+from sound_inputs.microphone import Microphone
+from translation import SoundInput
+
+LOGGER = logging.getLogger(__name__)
+
+SAMPLE_MIN = -32768
+SAMPLE_MAX = 32767
+
+
+class MicrophoneMixer(SoundInput):
+    """Combines the 16-bit mono streams of several sound inputs, e.g. the microphones of a panel.
+
+    The inputs are either mixed into one mono stream, with a gain per input and clipping at the
+    sample range, or tagged: each input becomes one channel of an interleaved multi-channel stream,
+    so an STT service with channel identification can tell the speakers apart.
+
+    Without NumPy, a chunk is processed by chaining `map` over built-in and `operator` functions, so the
+    per-sample work runs in C rather than in a Python loop; it is not SIMD-vectorized.
+    """
+
+    def __init__(
+        self,
+        sound_inputs: Sequence[SoundInput],
+        sample_rate: int,
+        gains: Optional[Sequence[float]] = None,
+        channel_tagging: bool = False,
+        max_skew_seconds: float = 0.5,
+    ):
+        """Initializes the MicrophoneMixer instance.
+
+        Args:
+            sound_inputs (Sequence[SoundInput]): Mono inputs with the same sample rate.
+            sample_rate (int): Sample rate of the inputs.
+            gains (Sequence[float], optional): Gain per input, 1.0 if missing.
+            channel_tagging (bool): Interleave the inputs as channels instead of mixing them.
+            max_skew_seconds (float): Audio an input may run ahead before a stalled input is padded with silence.
+        """
+        self._sound_inputs = list(sound_inputs)
+        gains = list(gains or [])
+        self._gains = [gains[i] if i < len(gains) else 1.0 for i in range(len(self._sound_inputs))]
+        self._channel_tagging = channel_tagging
+        self._max_skew_bytes = int(sample_rate * max_skew_seconds) * 2
+
+        self.clipped_samples = 0
+        self.padded_bytes = 0  # Silence inserted for inputs that delivered no audio
+
+    @classmethod
+    def from_settings(cls, input_settings: InputSettings, channel_tagging: bool) -> 'MicrophoneMixer':
+        """Creates a mixer of the configured microphones, each recorded in mono.
+
+        Args:
+            input_settings (InputSettings): Input settings with the mixer settings.
+            channel_tagging (bool): Whether the translator identifies channels; only then is tagging used.
+        """
+        mixer_settings = input_settings.mixer_settings
+        microphones = [
+            Microphone(replace(input_settings, input_device_index=device_index, input_channels=1))
+            for device_index in mixer_settings.device_indices
+        ]
+        return cls(
+            microphones,
+            input_settings.input_sample_rate,
+            mixer_settings.gains,
+            channel_tagging and mixer_settings.channel_tagging,
+        )
+
+    @property
+    def channels(self) -> int:
+        """Number of channels of the produced stream."""
+        return len(self._sound_inputs) if self._channel_tagging else 1
+
+    async def get_audio_stream(self, shutdown_event: Event) -> AsyncGenerator[bytes, None]:
+        buffers = [bytearray() for _ in self._sound_inputs]
+        data_ready = asyncio.Event()
+
+        async def pump(index: int, sound_input: SoundInput):
+            try:
+                async for chunk in sound_input.get_audio_stream(shutdown_event):
+                    buffers[index] += chunk
+                    data_ready.set()
+            finally:
+                data_ready.set()
+
+        tasks = [asyncio.create_task(pump(i, sound_input)) for i, sound_input in enumerate(self._sound_inputs)]
+        try:
+            while not shutdown_event.is_set():
+                if max(len(buffer) for buffer in buffers) > self._max_skew_bytes:
+                    self._pad_stalled_inputs(buffers)
+                length = min(len(buffer) for buffer in buffers) & ~1
+                if length:
+                    chunks = [bytes(buffer[:length]) for buffer in buffers]
+                    for buffer in buffers:
+                        del buffer[:length]
+                    yield self._interleave(chunks) if self._channel_tagging else self._mix(chunks)
+                    continue
+
+                if all(task.done() for task in tasks):
+                    break
+                data_ready.clear()
+                await data_ready.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop_audio_stream(self):
+        for sound_input in self._sound_inputs:
+            sound_input.stop_audio_stream()
+        if self.clipped_samples or self.padded_bytes:
+            LOGGER.info(
+                f'Microphone mixer clipped {self.clipped_samples} samples and '
+                f'padded {self.padded_bytes} bytes of silence for stalled inputs.'
+            )
+
+    def metrics(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {'clipped_samples': self.clipped_samples, 'padded_bytes': self.padded_bytes}
+        for sound_input in self._sound_inputs:
+            for name, value in sound_input.metrics().items():
+                totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def _pad_stalled_inputs(self, buffers: List[bytearray]) -> None:
+        """Keeps one silent or disconnected input from holding back the audio of the others."""
+        longest = max(len(buffer) for buffer in buffers)
+        for buffer in buffers:
+            missing = longest - len(buffer)
+            if missing:
+                buffer += bytes(missing)
+                self.padded_bytes += missing
+
+    def _mix(self, chunks: List[bytes]) -> bytes:
+        mixed: Iterable[float] = self._scaled(self._to_samples(chunks[0]), self._gains[0])
+        for chunk, gain in zip(chunks[1:], self._gains[1:], strict=True):
+            samples = self._scaled(self._to_samples(chunk), gain)
+            mixed = map(operator.add, mixed, samples)  # noqa: B912 - the chunks are padded to the same length
+        if any(gain != 1.0 for gain in self._gains):
+            mixed = map(round, mixed)
+
+        values = list(mixed)
+        if values and (min(values) < SAMPLE_MIN or max(values) > SAMPLE_MAX):
+            self.clipped_samples += sum(map(operator.gt, repeat(SAMPLE_MIN), values))
+            self.clipped_samples += sum(map(operator.lt, repeat(SAMPLE_MAX), values))
+            values = list(self._clipped(values))
+        return self._to_bytes(array('h', values))
+
+    def _interleave(self, chunks: List[bytes]) -> bytes:
+        channel_count = len(chunks)
+        output = array('h', bytes(len(chunks[0]) * channel_count))
+        for channel, (chunk, gain) in enumerate(zip(chunks, self._gains, strict=True)):
+            samples = self._to_samples(chunk)
+            if gain != 1.0:
+                samples = array('h', self._clipped(map(round, self._scaled(samples, gain))))
+            output[channel::channel_count] = samples
+        return self._to_bytes(output)
+
+    @staticmethod
+    def _scaled(samples: Iterable[float], gain: float) -> Iterable[float]:
+        return samples if gain == 1.0 else map(operator.mul, samples, repeat(gain))
+
+    @staticmethod
+    def _clipped(values: Iterable[float]) -> Iterable[float]:
+        """Limits the values to the 16-bit sample range."""
+        return map(min, repeat(SAMPLE_MAX), map(max, repeat(SAMPLE_MIN), values))
+
+    @staticmethod
+    def _to_samples(chunk: bytes) -> array:
+        samples = array('h')
+        samples.frombytes(chunk)
+        if sys.byteorder == 'big':
+            samples.byteswap()
+        return samples
+
+    @staticmethod
+    def _to_bytes(samples: array) -> bytes:
+        if sys.byteorder == 'big':
+            samples.byteswap()
+        return samples.tobytes()
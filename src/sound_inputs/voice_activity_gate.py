@@ -0,0 +1,126 @@
+"""Voice activity gate between a sound input and the streaming STT services.
+
+Streaming STT is billed by the seconds of audio sent, and long silences between speakers would
+otherwise be streamed in full. The gate forwards audio while a voice activity detector reports
+speech, keeps forwarding for a short hangover so the STT endpointing still sees the end of the
+utterance, and prepends a short pre-roll of the audio before the speech onset so the first
+syllable is not cut off. During longer silences, a single chunk is forwarded every
+`keepalive_seconds` so the STT services do not close the stream for lack of audio.
+"""
+
+import logging
+import math
+import sys
+from array import array
+from asyncio import Event
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import AsyncGenerator, Deque, Dict, Protocol
+
+from config.model.config_models import InputSettings
+from translation import SoundInput
+
+LOGGER = logging.getLogger(__name__)
+
+FULL_SCALE = 32768.0
+
+
+class VoiceActivityDetector(Protocol):
+    def is_speech(self, chunk: bytes) -> bool:
+        """Returns whether the 16-bit PCM chunk contains speech."""
+        ...
+
+
+class EnergyVoiceActivityDetector:
+    """Classifies chunks as speech when their RMS level reaches a threshold relative to full scale."""
+
+    def __init__(self, threshold_dbfs: float):
+        self._threshold = FULL_SCALE * 10 ** (threshold_dbfs / 20)
+
+    def is_speech(self, chunk: bytes) -> bool:
+        samples = array('h')
+        samples.frombytes(chunk[: len(chunk) - len(chunk) % 2])
+        if not samples:
+            return False
+        if sys.byteorder == 'big':
+            samples.byteswap()
+        return math.sqrt(math.sumprod(samples, samples) / len(samples)) >= self._threshold
+
+
+@dataclass
+class VoiceActivityStats:
+    """Counters describing how much audio the gate kept away from the STT service."""
+
+    forwarded_bytes: int = 0
+    suppressed_bytes: int = 0
+    keepalives: int = 0  # Silent chunks forwarded to keep the STT stream open
+
+
+class VoiceActivityGate(SoundInput):
+    """Sound input wrapper that suppresses silence in the audio stream of another sound input."""
+
+    def __init__(self, sound_input: SoundInput, input_settings: InputSettings):
+        """Initializes the VoiceActivityGate instance.
+
+        Args:
+            sound_input (SoundInput): The input whose audio stream is gated.
+            input_settings (InputSettings): Audio format and VAD settings of the input.
+        """
+        self._sound_input = sound_input
+        vad_settings = input_settings.vad_settings
+        self._detector: VoiceActivityDetector = EnergyVoiceActivityDetector(vad_settings.threshold_dbfs)
+
+        bytes_per_second = input_settings.input_sample_rate * input_settings.input_channels * 2
+        self._hangover_bytes = bytes_per_second * vad_settings.hangover_ms // 1000
+        self._pre_roll_bytes = bytes_per_second * vad_settings.pre_roll_ms // 1000
+        self._keepalive_bytes = int(bytes_per_second * vad_settings.keepalive_seconds)
+        self._bytes_per_second = bytes_per_second
+
+        self.stats = VoiceActivityStats()
+
+    async def get_audio_stream(self, shutdown_event: Event) -> AsyncGenerator[bytes, None]:
+        pre_roll: Deque[bytes] = deque()
+        pre_roll_bytes = 0
+        hangover_left = 0
+        silence_since_forward = 0
+
+        async for chunk in self._sound_input.get_audio_stream(shutdown_event):
+            if self._detector.is_speech(chunk):
+                while pre_roll:
+                    buffered = pre_roll.popleft()
+                    self.stats.forwarded_bytes += len(buffered)
+                    yield buffered
+                pre_roll_bytes = 0
+                hangover_left = self._hangover_bytes
+            elif hangover_left > 0:
+                hangover_left -= len(chunk)
+            elif silence_since_forward + len(chunk) >= self._keepalive_bytes:
+                # The pre-roll is older than the keepalive chunk and would be out of order later on.
+                self.stats.suppressed_bytes += pre_roll_bytes
+                pre_roll.clear()
+                pre_roll_bytes = 0
+                self.stats.keepalives += 1
+            else:
+                silence_since_forward += len(chunk)
+                pre_roll.append(chunk)
+                pre_roll_bytes += len(chunk)
+                while pre_roll and pre_roll_bytes > self._pre_roll_bytes:
+                    dropped = pre_roll.popleft()
+                    pre_roll_bytes -= len(dropped)
+                    self.stats.suppressed_bytes += len(dropped)
+                continue
+
+            silence_since_forward = 0
+            self.stats.forwarded_bytes += len(chunk)
+            yield chunk
+
+    def metrics(self) -> Dict[str, int]:
+        return {**self._sound_input.metrics(), **{f'vad_{name}': value for name, value in asdict(self.stats).items()}}
+
+    def stop_audio_stream(self):
+        self._sound_input.stop_audio_stream()
+        LOGGER.info(
+            f'Voice activity gate suppressed {self.stats.suppressed_bytes / self._bytes_per_second:.1f} s of silence, '
+            f'forwarded {self.stats.forwarded_bytes / self._bytes_per_second:.1f} s of audio '
+            f'({self.stats.keepalives} keepalive chunks).'
+        )
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
 from pymumble_py3 import Mumble
 from pymumble_py3.constants import PYMUMBLE_CONN_STATE_CONNECTED
@@ -14,8 +15,8 @@ LOGGER = logging.getLogger(__name__)
 
 class MumbleClient(SoundOutput):
     username_postfix = MUMBLE_TRANSLATOR_USERNAME_SUFFIX
-    # Single executor for all MumbleClient instances to limit thread creation
-    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='MumbleAudio')
+    drain_poll_interval: float = 0.02  # Seconds between checks of the unsent pymumble buffer
+    drain_grace_period: float = 1.0  # Extra seconds to wait for the buffer to drain
 
     def __init__(self, output_settings: OutputSettings, language: str):
         """Initializes the MumbleClient instance.
@@ -25,19 +26,22 @@ class MumbleClient(SoundOutput):
             language (str): The language code.
         """
 
+        super().__init__()
         self._output_settings = output_settings
+        self._language = language
         self._channel_name = self._output_settings.mumble_settings.language_channel_mapping[language]
+        # The audio is encoded once and sent to these channels too, through one connection each
+        self._mirror_channel_names = self._output_settings.mumble_settings.mirror_channel_mapping.get(language, [])
+        self._mirrors: List[Mumble] = []  # Connected mirror connections
 
         self._username = language + '_' + MumbleClient.username_postfix
 
-        self._mumble = Mumble(
-            host=self._output_settings.mumble_settings.ip_address,
-            port=self._output_settings.mumble_settings.port,
-            user=self._username,
-            password='',
-            tokens=[MUMBLE_TRANSLATOR_TOKEN],
-            reconnect=False,
-        )
+        self._mumble = self._create_mumble(self._username)
+
+        # Reads wait for the TTS stream, so each language gets its own thread and never waits behind another
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'MumbleAudio-{language}')
+
+        self.sent_bytes = 0  # PCM bytes handed to pymumble for sending
 
         LOGGER.debug('Mumble client initialized')
 
@@ -63,11 +67,18 @@ class MumbleClient(SoundOutput):
             )
 
         LOGGER.debug('Mumble client connected and ready')
-        self._move_to_channel()
+        self._move_to_channel(self._mumble, self._channel_name)
+
+        for index, channel_name in enumerate(self._mirror_channel_names, start=2):
+            self._connect_mirror(f'{self._language}_{index}_{MumbleClient.username_postfix}', channel_name)
 
     def stop_audio_stream(self):
         """Disconnects from the Mumble server"""
         self._mumble.stop()
+        for mirror in self._mirrors:
+            mirror.stop()
+        self._mirrors = []
+        self._executor.shutdown(wait=False)
 
     async def play(self, output_bytes: AudioReadableStream):
         """Streams audio data asynchronously directly from output_bytes to a Mumble server.
@@ -82,9 +93,7 @@ class MumbleClient(SoundOutput):
         try:
             # Read data from output_bytes and send it to the Mumble stream
             while True:
-                data = await loop.run_in_executor(
-                    MumbleClient._executor, output_bytes.read, self._output_settings.chunk_len
-                )
+                data = await loop.run_in_executor(self._executor, output_bytes.read, self._output_settings.chunk_len)
 
                 if not data:
                     break  # End of data
@@ -94,6 +103,7 @@ class MumbleClient(SoundOutput):
                     continue
 
                 self._mumble.sound_output.add_sound(data)
+                self.sent_bytes += len(data)
         except asyncio.CancelledError:
             LOGGER.debug('Mumble playback task was cancelled.')
         except Exception as e:
@@ -101,12 +111,76 @@ class MumbleClient(SoundOutput):
         finally:
             LOGGER.debug('Streaming completed.')
 
-    def _move_to_channel(self):
-        """Moves to the specified channel."""
+    async def wait_until_played(self) -> None:
+        """Waits until pymumble has sent the buffered audio, or for about as long as that audio lasts."""
+        sound_output = self._mumble.sound_output
+        if sound_output is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        # pymumble drains its buffer in real time; the deadline guards against a stalled connection.
+        deadline = loop.time() + sound_output.get_buffer_size() + MumbleClient.drain_grace_period
+        while sound_output.get_buffer_size() > 0 and loop.time() < deadline:
+            await asyncio.sleep(MumbleClient.drain_poll_interval)
+
+    def metrics(self) -> Dict[str, float]:
+        sound_output = self._mumble.sound_output
+        if sound_output is None:
+            return {'buffered_seconds': 0.0, 'sent_bytes': self.sent_bytes}
+        # Pacing of the voice packets by the pymumble audio thread
+        sender_stats = sound_output.sender.stats
+        return {
+            'buffered_seconds': sound_output.get_buffer_size(),
+            'sent_bytes': self.sent_bytes,
+            'sent_packets': sender_stats['packets'],
+            'sent_late_packets': sender_stats['late'],
+            'max_packet_drift_seconds': sender_stats['max_drift'],
+            'mirror_connections': len(self._mirrors),
+        }
+
+    def _create_mumble(self, username: str) -> Mumble:
+        return Mumble(
+            host=self._output_settings.mumble_settings.ip_address,
+            port=self._output_settings.mumble_settings.port,
+            user=username,
+            password='',
+            tokens=[MUMBLE_TRANSLATOR_TOKEN],
+            reconnect=False,
+        )
+
+    def _connect_mirror(self, username: str, channel_name: str):
+        """Connects one more user to channel_name, which sends the audio encoded for the main connection.
+
+        A mirror that cannot connect is skipped, the main channel still gets the audio.
+
+        Args:
+            username (str): The username of the mirror connection.
+            channel_name (str): The channel the mirror connection moves to.
+        """
+        mirror = self._create_mumble(username)
+        mirror.start()
+        mirror.is_ready()
+
+        if mirror.connected != PYMUMBLE_CONN_STATE_CONNECTED:
+            LOGGER.error(f'Failed to connect to Mumble server to mirror the audio to channel {channel_name}')
+            try:
+                mirror.stop()
+            except AttributeError:
+                LOGGER.debug('Mumble stop() raised AttributeError (control_socket=None), ignoring.')
+            return
+
+        self._move_to_channel(mirror, channel_name)
+        self._mumble.sound_output.add_destination(mirror)
+        self._mirrors.append(mirror)
+        LOGGER.debug(f'Mumble audio mirrored to channel {channel_name}')
+
+    @staticmethod
+    def _move_to_channel(mumble: Mumble, channel_name: str):
+        """Moves the connection to the specified channel."""
 
-        LOGGER.debug(f'Move to channel {self._channel_name}')
+        LOGGER.debug(f'Move to channel {channel_name}')
         # Split the channel path
-        channel_path = self._channel_name.split('/')
+        channel_path = channel_name.split('/')
 
         if len(channel_path) > 2:
             raise ValueError('Invalid channel path. Only one subchannel is supported')
@@ -115,10 +189,10 @@ class MumbleClient(SoundOutput):
 
         if len(channel_path) == 1:
             main_channel_name = channel_path[0]
-            channel = self._mumble.channels.find_by_name(main_channel_name)
+            channel = mumble.channels.find_by_name(main_channel_name)
 
         else:
-            channel = self._mumble.channels.find_by_tree([channel_name for channel_name in channel_path])
+            channel = mumble.channels.find_by_tree([channel_name for channel_name in channel_path])
 
         # Now move to the channel
         channel.move_in()
@@ -0,0 +1,84 @@
+"""Sound output without an audio device, for replays, batch translation and benchmarks.
+
+The synthesized speech is consumed like a speaker would consume it, optionally paced in real time,
+and can be recorded to a WAV file per target language.
+"""
+
+import asyncio
+import logging
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from config.model.config_models import OutputSettings
+from translation import AudioReadableStream, SoundOutput
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RecordingOutput(SoundOutput):
+    """Consumes synthesized speech and optionally records it to a mono 16-bit WAV file."""
+
+    def __init__(self, output_settings: OutputSettings, path: Optional[str] = None, realtime: bool = False):
+        """Initializes the RecordingOutput instance.
+
+        Args:
+            output_settings (OutputSettings): Output settings; sample rate and chunk length are used.
+            path (str, optional): WAV file the speech is written to; without it, the audio is discarded.
+            realtime (bool): Take as long as a speaker would to play the audio.
+        """
+        super().__init__()
+        self._output_settings = output_settings
+        self._path = path
+        self._realtime = realtime
+        self._wav: Optional[wave.Wave_write] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='RecordingOutput')
+        self.played_streams = 0
+        self.played_bytes = 0
+
+    async def play(self, output_bytes: AudioReadableStream) -> None:
+        """Consumes the stream until its end; returns once it has been "played"."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._play_blocking, output_bytes)
+
+    def metrics(self) -> Dict[str, float]:
+        bytes_per_second = self._output_settings.output_sample_rate * 2
+        return {'played_streams': self.played_streams, 'played_seconds': self.played_bytes / bytes_per_second}
+
+    def stop_audio_stream(self) -> None:
+        """Closes the WAV file."""
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+            LOGGER.debug(f'Recording {self._path} closed')
+        self._executor.shutdown(wait=False)
+
+    def _play_blocking(self, output_bytes: AudioReadableStream) -> None:
+        bytes_per_second = self._output_settings.output_sample_rate * 2
+        started_at = time.perf_counter()
+        stream_bytes = 0
+        while True:
+            data = output_bytes.read(self._output_settings.chunk_len)
+            if not data:
+                break
+            self._write(data)
+            stream_bytes += len(data)
+            self.played_bytes += len(data)
+            if self._realtime:
+                time.sleep(max(0.0, started_at + stream_bytes / bytes_per_second - time.perf_counter()))
+        self.played_streams += 1
+
+    def _write(self, data: bytes) -> None:
+        if self._path is None:
+            return
+        if self._wav is None:
+            self._wav = self._open_wav(self._path)
+        self._wav.writeframes(data)
+
+    def _open_wav(self, path: str) -> wave.Wave_write:
+        wav = wave.open(path, 'wb')  # noqa: SIM115 - kept open across sentences, closed on stop
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(self._output_settings.output_sample_rate)
+        return wav
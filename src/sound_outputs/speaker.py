@@ -1,7 +1,7 @@
 import asyncio  # New import
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Mapping, Optional
+from typing import Dict, List, Mapping, Optional
 
 import pyaudio
 
@@ -18,6 +18,7 @@ class Speaker(SoundOutput):
         Args:
             output_settings (OutputSettings): Output settings object.
         """
+        super().__init__()
         self._pa = pyaudio.PyAudio()
         self._output_settings = output_settings
         self._audio_stream: Optional[pyaudio.Stream] = None
@@ -46,6 +47,13 @@ class Speaker(SoundOutput):
         if self._consumer_task is None or self._consumer_task.done():
             self._consumer_task = asyncio.create_task(self._consume_queue())
 
+    async def wait_until_played(self) -> None:
+        """Waits until every queued audio stream has been played."""
+        await self._queue.join()
+
+    def metrics(self) -> Dict[str, float]:
+        return {'queued_streams': self._queue.qsize()}
+
     def stop_audio_stream(self):
         """Signals the currently playing audio stream to stop and clears the queue."""
         # Clear pending queue
@@ -2,10 +2,14 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop
-from typing import AsyncGenerator, Dict, Optional, Protocol
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Protocol, TypeVar
+
+from utils.utterance_trace import UtteranceTrace
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class AudioReadableStream(Protocol):
     def read(self, amt: Optional[int] = None) -> bytes:
@@ -32,8 +36,17 @@ class SoundInput(ABC):
         """Stops the audio stream and cleans up resources."""
         pass
 
+    def metrics(self) -> Dict[str, int]:
+        """Returns the counters of the input, e.g. the dropped audio."""
+        return {}
+
 
 class SoundOutput(ABC):
+    def __init__(self) -> None:
+        # Held while a sentence plays, so translation sessions sharing the output do not interleave.
+        # asyncio.Lock binds to an event loop on first use, so the output can be created in any thread.
+        self._playback_lock = asyncio.Lock()
+
     @abstractmethod
     async def play(self, output_bytes: AudioReadableStream) -> None:
         """Plays the output audio bytes.
@@ -43,11 +56,28 @@ class SoundOutput(ABC):
         """
         pass
 
+    async def wait_until_played(self) -> None:
+        """Waits until the audio handed to `play` has actually been played out.
+
+        `play` may return as soon as the audio is buffered by the output. Callers use this to apply
+        backpressure based on what the listener has heard. Outputs without a buffer return at once.
+        """
+        return
+
+    @property
+    def playback_lock(self) -> asyncio.Lock:
+        """Lock held while a sentence plays, so translation sessions sharing the output do not interleave."""
+        return self._playback_lock
+
     @abstractmethod
     def stop_audio_stream(self) -> None:
         """Stops the audio stream and cleans up resources."""
         pass
 
+    def metrics(self) -> Dict[str, float]:
+        """Returns the counters and gauges of the output, e.g. its queue depth."""
+        return {}
+
 
 class Translator(ABC):
     @abstractmethod
@@ -66,17 +96,38 @@ class Translator(ABC):
         """
         pass
 
+    def metrics(self) -> Dict[str, Any]:
+        """Returns the runtime statistics of the translator, keyed by metric group."""
+        return {}
+
+    def traces(self) -> List[UtteranceTrace]:
+        """Returns the latency traces of the most recently completed utterances."""
+        return []
+
 
 class Translation:
     timeout: float = 5.0  # Timeout for stopping the translation process
 
     def __init__(
-        self, translator: Translator, sound_input: SoundInput, target_language_mapping: Dict[str, SoundOutput]
+        self,
+        translator: Translator,
+        sound_input: SoundInput,
+        target_language_mapping: Dict[str, SoundOutput],
+        stop_outputs: bool = True,
     ) -> None:
-        """Initializes the Translation instance."""
+        """Initializes the Translation instance.
+
+        Args:
+            translator (Translator): The translator of the session.
+            sound_input (SoundInput): The audio source.
+            target_language_mapping (Dict[str, SoundOutput]): Mapping of target language code to SoundOutput.
+            stop_outputs (bool): Whether the outputs are stopped with the translation. Outputs shared with
+                other sessions are stopped by their owner instead.
+        """
         self._translator = translator
         self._sound_input = sound_input
         self._target_language_mapping = target_language_mapping
+        self._stop_outputs = stop_outputs
 
         self._loop: Optional[AbstractEventLoop] = None
         self._main_task: Optional[asyncio.Task] = None
@@ -117,6 +168,48 @@ class Translation:
         else:
             LOGGER.warning('Cannot stop translation: Loop is not running.')
 
+    def call_in_loop(self, function: Callable[[], T], timeout: float) -> T:
+        """Calls the function in the event loop of the translation and returns its result.
+
+        The translation changes its queues, traces and statistics only in that loop, so other threads,
+        e.g. the metrics endpoint, read them there to get a consistent snapshot. Without a running loop,
+        the function is called directly.
+
+        Args:
+            function (Callable[[], T]): The function to call.
+            timeout (float): Longest wait in seconds for the loop to call the function.
+
+        Raises:
+            TimeoutError: If the loop did not call the function in time.
+        """
+        loop = self._loop
+        if loop is None or not loop.is_running() or _running_loop() is loop:
+            return function()
+
+        async def call() -> T:
+            return function()
+
+        return asyncio.run_coroutine_threadsafe(call(), loop).result(timeout)
+
+    @property
+    def translator(self) -> Translator:
+        return self._translator
+
+    @property
+    def sound_input(self) -> SoundInput:
+        return self._sound_input
+
+    async def run_async(self):
+        """Runs the translation in the current event loop, e.g. one shared by several sessions."""
+        self._loop = asyncio.get_running_loop()
+        self._shutdown_event.clear()
+        await self._run_translation()
+
+    async def stop_async(self, timeout: Optional[float] = None):
+        """Stops a translation started with `run_async`; must be called in its event loop."""
+        self._shutdown_event.set()
+        await self._wait_for_main_task(Translation.timeout if timeout is None else timeout)
+
     async def _run_translation(self):
         """Single async entry point: runs the full translation pipeline and cleans up on exit."""
         self._main_task = asyncio.current_task()
@@ -150,7 +243,15 @@ class Translation:
         """Performs all the necessary cleanup actions. Ensures resources are closed gracefully."""
         LOGGER.debug('Cleaning up all components...')
         self._sound_input.stop_audio_stream()
-        for output in self._target_language_mapping.values():
-            output.stop_audio_stream()
+        if self._stop_outputs:
+            for output in self._target_language_mapping.values():
+                output.stop_audio_stream()
 
         LOGGER.debug('All components have been cleaned up.')
+
+
+def _running_loop() -> Optional[AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
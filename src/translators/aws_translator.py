@@ -1,32 +1,155 @@
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from typing import AsyncGenerator, Awaitable, Callable, Dict, List, Optional
+import os
+import time
+from dataclasses import asdict
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import boto3
 from amazon_transcribe.client import StartStreamTranscriptionEventStream, TranscribeStreamingClient
 from amazon_transcribe.handlers import TranscriptResultStreamHandler
-from amazon_transcribe.model import Result, TranscriptEvent
+from amazon_transcribe.model import Item, Result, TranscriptEvent
+from botocore.config import Config
 from botocore.response import StreamingBody
 
-from config.model.config_models import AWSSettings, InputSettings, OutputSettings
+from config.model.config_models import AWSSettings, InputSettings, OutputSettings, QueueSettings
+from constants import AWS_MAX_POOL_CONNECTIONS, AWS_MAX_WORKERS, AWS_MIN_WORKERS
 from translation import SoundOutput, Translator
+from translators.client_pool import CLIENT_POOL
+from translators.sentence_coalescer import CoalescingStats, SentenceCoalescer
+from translators.speculation import CLAUSE_PUNCTUATION, SPECULATIVE_MIN_WORDS, SpeculationStats
+from translators.speech_cache import SpeechCache
+from translators.speech_scheduler import LanguageQueueStats, PlaySpeech, PreparedSpeech, SpeechScheduler
+from translators.translation_cache import TranslationCache
 from translators.translation_callbacks import TranslationCallbacks
+from translators.warmup import WARMUP_TEXT, WarmupStats, warm_up
+from utils.demand_sized_executor import DemandSizedExecutor
+from utils.pcm_stream import PcmStream
+from utils.utterance_trace import UtteranceTrace, UtteranceTracer
 
 LOGGER = logging.getLogger(__name__)
 
 
+class PartialResultSpeculator:
+    """Tracks the stable prefix of AWS Transcribe partial results for speculative translation.
+
+    Transcribe marks the items of a partial result as `stable` once they will no longer change
+    (partial-result stabilization). Whenever the stable prefix grows past a clause boundary, the
+    new clause is handed out for translation. When the final result arrives, the already spoken
+    segments are checked against it and only the remaining suffix is returned.
+    """
+
+    def __init__(self, stats: SpeculationStats):
+        self._stats = stats
+        self._result_id: Optional[str] = None
+        # (start item index, end item index, source text) of each dispatched segment
+        self._segments: List[Tuple[int, int, str]] = []
+
+    def next_segment(self, result: Result) -> Optional[str]:
+        """Returns the next stable clause of a partial result that has not been dispatched yet."""
+        self._start_result(result.result_id)
+        items = self._get_items(result)
+        committed = self._segments[-1][1] if self._segments else 0
+
+        boundary = None
+        for index in range(committed, len(items)):
+            item = items[index]
+            if not item.stable:
+                break
+            if item.item_type == 'punctuation' and item.content in CLAUSE_PUNCTUATION:
+                boundary = index + 1
+
+        if boundary is None:
+            return None
+
+        segment_items = items[committed:boundary]
+        if sum(1 for item in segment_items if item.item_type == 'pronunciation') < SPECULATIVE_MIN_WORDS:
+            return None
+
+        text = self._join_items(segment_items)
+        self._segments.append((committed, boundary, text))
+        self._stats.dispatched += 1
+        return text
+
+    def final_suffix(self, result: Result) -> str:
+        """Reconciles the final result with the dispatched segments and returns the text still to translate."""
+        alternatives = result.alternatives or []
+        transcript = (alternatives[0].transcript if alternatives else None) or ''
+        items = self._get_items(result)
+        segments = self._segments if result.result_id == self._result_id else []
+        self._result_id = None
+        self._segments = []
+
+        if not segments:
+            return transcript
+        if not items:
+            self._stats.wasted += len(segments)
+            return transcript
+
+        reused_end = 0
+        reused = 0
+        for start, end, text in segments:
+            if self._join_items(items[start:end]) != text:
+                break
+            reused_end = end
+            reused += 1
+
+        self._stats.reused += reused
+        self._stats.wasted += len(segments) - reused
+        if reused < len(segments):
+            LOGGER.debug(f'Final transcript diverged from {len(segments) - reused} speculative segment(s).')
+
+        suffix = self._join_items(items[reused_end:])
+        if suffix:
+            self._stats.final_suffixes += 1
+        return suffix
+
+    def _start_result(self, result_id: Optional[str]):
+        if result_id != self._result_id:
+            if self._segments:
+                # The previous utterance never produced a final result.
+                self._stats.wasted += len(self._segments)
+            self._result_id = result_id
+            self._segments = []
+
+    @staticmethod
+    def _get_items(result: Result) -> List[Item]:
+        if not result.alternatives:
+            return []
+        return getattr(result.alternatives[0], 'items', None) or []
+
+    @staticmethod
+    def _join_items(items: List[Item]) -> str:
+        """Builds the transcript text from items, attaching punctuation to the preceding word."""
+        text = ''
+        for item in items:
+            content = item.content or ''
+            if item.item_type == 'punctuation' or not text:
+                text += content
+            else:
+                text += ' ' + content
+        return text
+
+
 class TranscriptEventHandler(TranscriptResultStreamHandler):
     """Handles incoming transcript events from AWS Transcribe and triggers translation + TTS."""
 
     def __init__(
         self,
         output_stream,
-        polly_tts: Callable[[str, str], Awaitable[None]],
+        polly_tts: Callable[[str, str], Awaitable[Optional[PreparedSpeech]]],
         aws_settings: AWSSettings,
-        executor: ThreadPoolExecutor,
+        executor: DemandSizedExecutor,
         translate_client,
         translation_callbacks: Optional[TranslationCallbacks] = None,
+        speculation_stats: Optional[SpeculationStats] = None,
+        translation_cache: Optional[TranslationCache] = None,
+        queue_settings: Optional[QueueSettings] = None,
+        queue_stats: Optional[Dict[str, LanguageQueueStats]] = None,
+        play_speech: Optional[PlaySpeech] = None,
+        coalescing_stats: Optional[CoalescingStats] = None,
+        all_channels: bool = False,
+        tracer: Optional[UtteranceTracer] = None,
     ):
         super().__init__(output_stream)
         self._polly_tts = polly_tts
@@ -34,44 +157,117 @@ class TranscriptEventHandler(TranscriptResultStreamHandler):
         self._executor = executor
         self._translate = translate_client
         self._translation_callbacks = translation_callbacks
+        self._translation_cache = translation_cache
+        self._queue_settings = queue_settings or QueueSettings()
+        self._queue_stats = queue_stats
+        self._play_speech = play_speech
+        self._coalescing_stats = coalescing_stats
+        # Without channel identification, Transcribe reports everything as the first channel
+        self._all_channels = all_channels
+        self._tracer = tracer
+        self._scheduler: Optional[SpeechScheduler] = None
+        self._coalescer: Optional[SentenceCoalescer] = None
+        self._speculator: Optional[PartialResultSpeculator] = None
+        if aws_settings.speculative_translation:
+            self._speculator = PartialResultSpeculator(speculation_stats or SpeculationStats())
 
     async def handle_transcript_event(self, transcript_event: TranscriptEvent):
         results: List[Result] = transcript_event.transcript.results
-        if (
+        if not (
             results
             and results[0].alternatives
             and hasattr(results[0], 'is_partial')
-            and not results[0].is_partial
-            and results[0].channel_id == 'ch_0'
+            and (self._all_channels or results[0].channel_id == 'ch_0')
         ):
-            transcript = results[0].alternatives[0].transcript
-            if self._translation_callbacks is not None:
-                self._translation_callbacks.update_source_field(transcript)
-
-            tasks = [
-                asyncio.create_task(self._translate_and_tts(transcript, language))
-                for language in self._aws_settings.target_languages
-            ]
-            await asyncio.gather(*tasks)
-
-    async def _translate_and_tts(self, transcript: str, language: str):
-        """Translates the transcript and performs TTS."""
+            return
+
+        result = results[0]
+        alternatives = result.alternatives or []
+        if result.is_partial:
+            if self._speculator is not None:
+                segment = self._speculator.next_segment(result)
+                if segment:
+                    LOGGER.debug(f'Speculatively translating stable partial segment: {segment}')
+                    self._translate_all(segment, getattr(result, 'end_time', None))
+            return
+
+        transcript = alternatives[0].transcript or ''
+        if self._translation_callbacks is not None:
+            self._translation_callbacks.update_source_field(transcript)
+
+        if self._speculator is not None:
+            transcript = self._speculator.final_suffix(result)
+            if not transcript:
+                return
+
+        self._translate_all(transcript, getattr(result, 'end_time', None))
+
+    def _translate_all(self, transcript: str, audio_end: Optional[float] = None):
+        """Queues translation and TTS of the transcript for every target language.
+
+        The handler does not wait for them, so transcript events keep being processed during playback.
+        """
+        if self._tracer is not None:
+            self._tracer.mark_audio_end(audio_end)
+        if self._coalescer is None:
+            target_languages = self._aws_settings.target_languages
+            self._scheduler = SpeechScheduler(
+                target_languages,
+                self._translate_and_tts,
+                self._queue_settings,
+                self._play_speech,
+                self._queue_stats,
+                self._tracer,
+            )
+            self._scheduler.start()
+            self._coalescer = SentenceCoalescer(
+                self._scheduler.submit, self._queue_settings, len(target_languages), self._coalescing_stats
+            )
+        self._coalescer.submit(transcript)
+
+    async def stop(self):
+        """Stops the translation queues, discarding sentences that have not been processed yet."""
+        if self._coalescer is not None:
+            self._coalescer.cancel()
+            self._coalescer = None
+        if self._scheduler is not None:
+            await self._scheduler.stop()
+            self._scheduler = None
+
+    async def _translate_and_tts(self, transcript: str, language: str) -> Optional[PreparedSpeech]:
+        """Translates the transcript and starts the TTS synthesis of the translation."""
+        translated_text = await self._translate_text(transcript, language)
+
+        if self._translation_callbacks is not None:
+            self._translation_callbacks.update_target_field(language, translated_text)
+
+        speech = await self._polly_tts(translated_text, language)
+        LOGGER.debug(f'Translation processed and TTS started for language: {language}')
+        return speech
+
+    async def _translate_text(self, transcript: str, language: str) -> str:
+        """Translates the transcript with AWS Translate, answering repeated phrases from the cache."""
+        source_language = self._aws_settings.source_language
+        if self._translation_cache is not None:
+            cached = self._translation_cache.get(source_language, language, transcript)
+            if cached is not None:
+                LOGGER.debug(f'Translation cache hit for language: {language}')
+                return cached
+
         loop = asyncio.get_running_loop()
         trans_result = await loop.run_in_executor(
             self._executor,
             lambda: self._translate.translate_text(
                 Text=transcript,
-                SourceLanguageCode=self._aws_settings.source_language,
+                SourceLanguageCode=source_language,
                 TargetLanguageCode=language,
             ),
         )
         translated_text = trans_result.get('TranslatedText')
 
-        if self._translation_callbacks is not None:
-            self._translation_callbacks.update_target_field(language, translated_text)
-
-        await self._polly_tts(translated_text, language)
-        LOGGER.debug(f'Translation and TTS processed for language: {language}')
+        if self._translation_cache is not None:
+            self._translation_cache.put(source_language, language, transcript, translated_text)
+        return translated_text
 
 
 class AWSTranslator(Translator):
@@ -81,6 +277,10 @@ class AWSTranslator(Translator):
         input_settings: InputSettings,
         output_settings: OutputSettings,
         translation_callbacks: Optional[TranslationCallbacks] = None,
+        translation_cache: Optional[TranslationCache] = None,
+        speech_cache: Optional[SpeechCache] = None,
+        queue_settings: Optional[QueueSettings] = None,
+        tracer: Optional[UtteranceTracer] = None,
     ):
         """Initializes the AWSTranslator instance.
 
@@ -89,28 +289,60 @@ class AWSTranslator(Translator):
             input_settings (InputSettings): Input settings for the translator.
             output_settings (OutputSettings): Output settings for the translator.
             translation_callbacks (TranslationCallbacks, optional): Callbacks for the translated text.
+            translation_cache (TranslationCache, optional): Cache for repeated translations.
+            speech_cache (SpeechCache, optional): Cache for the synthesized speech of repeated sentences.
+            queue_settings (QueueSettings, optional): Bounds of the per-language translation queues.
+            tracer (UtteranceTracer, optional): Records the latency trace of every utterance.
         """
         self._aws_settings = aws_settings
         self._input_settings = input_settings
         self._output_settings = output_settings
         self._translation_callbacks = translation_callbacks
-
-        # Setup AWS services
+        self._translation_cache = translation_cache
+        self._speech_cache = speech_cache
+        self._queue_settings = queue_settings or QueueSettings()
+        self.speculation_stats = SpeculationStats()
+        self.queue_stats: Dict[str, LanguageQueueStats] = {}
+        self.coalescing_stats = CoalescingStats()
+        self.warmup_stats = WarmupStats()
+        self.tracer = tracer if tracer is not None else UtteranceTracer()
+
+        # Setup AWS services. The clients are pooled per region and credentials, so a restarted service
+        # or another session reuses their resolved credentials and open connections.
+        started_at = time.perf_counter()
         region = self._aws_settings.region
-        self._transcribe_client = TranscribeStreamingClient(region=region)
-        self._polly = boto3.client('polly', region_name=region)
-        self._translate = boto3.client(service_name='translate', region_name=region, use_ssl=True)
-
-        # Create a shared executor for all AWS operations to limit thread overhead
-        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='AWSWorker')
+        credentials = (os.environ.get('AWS_PROFILE'), os.environ.get('AWS_ACCESS_KEY_ID'))
+        self._transcribe_client = CLIENT_POOL.get(
+            ('aws', 'transcribe', region, credentials), lambda: TranscribeStreamingClient(region=region)
+        )
+        client_config = Config(max_pool_connections=AWS_MAX_POOL_CONNECTIONS)
+        self._polly = CLIENT_POOL.get(
+            ('aws', 'polly', region, credentials),
+            lambda: boto3.client('polly', region_name=region, config=client_config),
+        )
+        self._translate = CLIENT_POOL.get(
+            ('aws', 'translate', region, credentials),
+            lambda: boto3.client(service_name='translate', region_name=region, use_ssl=True, config=client_config),
+        )
+        self.client_setup_seconds = time.perf_counter() - started_at
+
+        # Blocking Translate/Polly calls run in worker threads. Each sentence in flight occupies at most one
+        # worker at a time, and up to pipeline_depth sentences per language are prepared next to the one being
+        # played; the warm-up runs two calls per language.
+        languages = len(self._aws_settings.target_languages)
+        max_workers = languages * max(self._queue_settings.pipeline_depth + 1, 2)
+        self._executor = DemandSizedExecutor(
+            min(AWS_MAX_WORKERS, max(AWS_MIN_WORKERS, max_workers)), thread_name_prefix='AWSWorker'
+        )
 
         # self._output: Optional[Callable[]] = None
         self._language_to_output: Dict[str, SoundOutput] = {}
         self._transcription_stream: Optional[StartStreamTranscriptionEventStream] = None
         self._write_chunks_task: Optional[asyncio.Task[None]] = None
+        self._handler: Optional[TranscriptEventHandler] = None
         self._handler_task: Optional[asyncio.Task[None]] = None
 
-        LOGGER.debug('AWS Translator initialized')
+        LOGGER.debug(f'AWS Translator initialized, clients ready in {self.client_setup_seconds * 1000:.0f} ms')
 
     async def start_translation(
         self,
@@ -119,28 +351,62 @@ class AWSTranslator(Translator):
         shutdown_event: asyncio.Event,
     ):
         self._language_to_output = language_to_output
+        warmup_task: Optional[asyncio.Task[None]] = None
 
         try:
+            if self._aws_settings.prewarm_connections:
+                # Runs while the transcription stream is being set up.
+                warmup_task = asyncio.create_task(
+                    warm_up(self._aws_settings.target_languages, self._prime_language, self.warmup_stats)
+                )
+
+            stabilization: Dict[str, Any] = {}
+            if self._aws_settings.speculative_translation:
+                # Stabilized partial results mark items that will no longer change as `stable`
+                stabilization = {
+                    'enable_partial_results_stabilization': True,
+                    'partial_results_stability': self._aws_settings.partial_results_stability,
+                }
+
+            channels: Dict[str, Any] = {}
+            mixer_settings = self._input_settings.mixer_settings
+            if mixer_settings.channel_tagging and len(mixer_settings.device_indices) > 1:
+                # Each microphone of the mixer arrives as its own channel and is transcribed separately
+                channels = {
+                    'number_of_channels': len(mixer_settings.device_indices),
+                    'enable_channel_identification': True,
+                }
+
             self._transcription_stream = await self._transcribe_client.start_stream_transcription(
                 language_code=self._aws_settings.source_language,
                 media_sample_rate_hz=self._input_settings.input_sample_rate,
                 media_encoding='pcm',
+                **stabilization,
+                **channels,
             )
 
-            handler = TranscriptEventHandler(
+            self._handler = TranscriptEventHandler(
                 self._transcription_stream.output_stream,
                 self._aws_polly_tts,
                 self._aws_settings,
                 self._executor,
                 self._translate,
                 self._translation_callbacks,
+                self.speculation_stats,
+                self._translation_cache,
+                self._queue_settings,
+                self.queue_stats,
+                self._play_speech,
+                self.coalescing_stats,
+                bool(channels),
+                self.tracer,
             )
 
             LOGGER.info('AWS Translator started.')
 
             # Create tasks for the two coroutines
             self._write_chunks_task = asyncio.create_task(self._write_chunks(mic_stream))
-            self._handler_task = asyncio.create_task(handler.handle_events())
+            self._handler_task = asyncio.create_task(self._handler.handle_events())
             shutdown_wait_task = asyncio.create_task(shutdown_event.wait())
 
             _done, pending = await asyncio.wait(
@@ -162,6 +428,8 @@ class AWSTranslator(Translator):
         except Exception as e:
             LOGGER.error(f'An unexpected error occurred during translation: {e}', exc_info=True)
         finally:
+            if warmup_task is not None and not warmup_task.done():
+                warmup_task.cancel()
             if self._transcription_stream and self._transcription_stream.input_stream:
                 try:
                     LOGGER.debug('Ending transcription stream gracefully.')
@@ -177,36 +445,164 @@ class AWSTranslator(Translator):
                     LOGGER.debug('Forcing cancellation of handler task.')
                     self._handler_task.cancel()
 
+            if self._handler is not None:
+                await self._handler.stop()
+                self._handler = None
+
             self._executor.shutdown(wait=False)
+            LOGGER.info(
+                f'AWS worker threads: {self._executor.stats.peak_in_flight} of {self._executor.max_workers} '
+                f'used at peak, {self._executor.stats.queued} calls queued'
+            )
+            if self._aws_settings.speculative_translation:
+                LOGGER.info(f'Speculative translation stats: {self.speculation_stats}')
+            if self._queue_settings.coalesce_window_seconds > 0:
+                LOGGER.info(f'Transcript coalescing stats: {self.coalescing_stats}')
             LOGGER.debug('AWS Translator shutdown complete.')
 
+    def traces(self) -> List[UtteranceTrace]:
+        return self.tracer.traces
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'provider': 'aws',
+            'speculation': asdict(self.speculation_stats),
+            'coalescing': asdict(self.coalescing_stats),
+            'queues': {language: asdict(stats) for language, stats in self.queue_stats.items()},
+            'client_setup_seconds': self.client_setup_seconds,
+            'warmup': asdict(self.warmup_stats),
+            'executor': {'max_workers': self._executor.max_workers, **asdict(self._executor.stats)},
+            'latency': {language: asdict(summary) for language, summary in self.tracer.latency_summary().items()},
+            'latency_histograms': {
+                stage: {language: asdict(histogram) for language, histogram in histograms.items()}
+                for stage, histograms in self.tracer.histograms.items()
+            },
+            'caches': self._cache_metrics(),
+        }
+
+    def _cache_metrics(self) -> Dict[str, Dict[str, int]]:
+        caches = {'translation': self._translation_cache, 'speech': self._speech_cache}
+        return {
+            name: {'hits': cache.hits, 'misses': cache.misses} for name, cache in caches.items() if cache is not None
+        }
+
+    async def _prime_language(self, language: str) -> None:
+        """Opens the Translate and Polly connections for a language and checks that its voice exists."""
+        loop = asyncio.get_running_loop()
+        voice_id = self._aws_settings.target_languages[language].voice_id
+        _translation, voices = await asyncio.gather(
+            loop.run_in_executor(
+                self._executor,
+                lambda: self._translate.translate_text(
+                    Text=WARMUP_TEXT,
+                    SourceLanguageCode=self._aws_settings.source_language,
+                    TargetLanguageCode=language,
+                ),
+            ),
+            loop.run_in_executor(
+                self._executor,
+                lambda: self._polly.describe_voices(LanguageCode=language, IncludeAdditionalLanguageCodes=True),
+            ),
+        )
+        if not any(voice.get('Id') == voice_id for voice in voices.get('Voices', [])):
+            LOGGER.warning(f'Polly voice {voice_id} is not available for language {language}.')
+
+    async def _play_speech(self, speech: PreparedSpeech, language: str):
+        await speech.play(self._language_to_output[language])
+
     async def _write_chunks(self, mic_stream: AsyncGenerator[bytes, None]):
         if self._transcription_stream is None:
             return
+        stream_started = False
         async for chunk in mic_stream:
             await self._transcription_stream.input_stream.send_audio_event(audio_chunk=chunk)
+            if not stream_started:
+                # Transcribe reports the audio times of results relative to the first audio sent.
+                self.tracer.mark_stream_start()
+                stream_started = True
+
+    async def _aws_polly_tts(self, text: str, language: str) -> Optional[PreparedSpeech]:
+        """Starts converting text to speech using AWS Polly.
 
-    async def _aws_polly_tts(self, text: str, language: str):
-        """Converts text to speech using AWS Polly and plays it."""
+        The returned speech can be played right away; its stream is fed while the audio arrives.
+        """
         LOGGER.debug(f"Synthesizing speech for text: '{text[:50]}...' in language: {language}")
 
+        voice = self._aws_settings.target_languages[language]
+        cache_key = SpeechCache.make_key(
+            'aws', voice.voice_id, voice.engine, self._output_settings.output_sample_rate, text
+        )
+        pcm_stream = PcmStream(on_playback_start=self._playback_latency_logger(language))
+
+        cached_audio = None
+        if self._speech_cache is not None:
+            # Cache lookups may read from disk, so they run on the default executor rather than the AWS one.
+            cached_audio = await asyncio.to_thread(self._speech_cache.get, cache_key)
+        if cached_audio is not None:
+            LOGGER.debug(f'Using cached speech for language: {language}.')
+            pcm_stream.feed(cached_audio)
+            pcm_stream.finish()
+            return PreparedSpeech(pcm_stream)
+
+        synthesis = asyncio.create_task(self._synthesize(text, language, cache_key, pcm_stream))
+        return PreparedSpeech(pcm_stream, synthesis)
+
+    async def _synthesize(self, text: str, language: str, cache_key: str, pcm_stream: PcmStream) -> None:
+        """Synthesizes the text with Polly into the stream and stores the complete audio in the speech cache."""
+        voice = self._aws_settings.target_languages[language]
         try:
             loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 self._executor,
                 lambda: self._polly.synthesize_speech(
-                    Engine=self._aws_settings.target_languages[language].engine,
+                    Engine=voice.engine,
                     LanguageCode=language,
                     Text=text,
-                    VoiceId=self._aws_settings.target_languages[language].voice_id,
+                    VoiceId=voice.voice_id,
                     SampleRate=str(self._output_settings.output_sample_rate),
                     OutputFormat='pcm',
                 ),
             )
 
-            output_bytes: StreamingBody = response['AudioStream']
+            audio_body: StreamingBody = response['AudioStream']
             LOGGER.debug(f'Received audio stream from Polly for language: {language}.')
-            await self._language_to_output[language].play(output_bytes)
-            LOGGER.debug(f'Audio playback initiated for language: {language}.')
+
+            # The body is pumped into the stream chunk by chunk, so the output can play the first
+            # bytes while the rest of the sentence is still downloading.
+            audio = await loop.run_in_executor(
+                self._executor, self._pump_audio_body, audio_body, pcm_stream, self._output_settings.chunk_len
+            )
+            if self._speech_cache is not None:
+                await asyncio.to_thread(self._speech_cache.put, cache_key, audio)
         except Exception as e:
-            LOGGER.error(f'Error during Polly TTS or playback for language {language}: {e}', exc_info=True)
+            pcm_stream.finish()
+            LOGGER.error(f'Error during Polly TTS for language {language}: {e}', exc_info=True)
+
+    @staticmethod
+    def _pump_audio_body(audio_body: StreamingBody, pcm_stream: PcmStream, chunk_size: int) -> bytes:
+        """Copies the Polly response body into the PCM stream as chunks arrive (runs in the executor)."""
+        chunks = []
+        try:
+            for chunk in audio_body.iter_chunks(chunk_size):
+                pcm_stream.feed(chunk)
+                chunks.append(chunk)
+            return b''.join(chunks)
+        finally:
+            pcm_stream.finish()
+            audio_body.close()
+
+    @staticmethod
+    def _playback_latency_logger(language: str):
+        """Returns a callback logging the first-byte-to-speaker latency of a synthesized sentence."""
+
+        def log_latency(pcm_stream: PcmStream):
+            time_to_first_byte = pcm_stream.time_to_first_byte
+            first_byte_to_playback = pcm_stream.first_byte_to_playback
+            if time_to_first_byte is None or first_byte_to_playback is None:
+                return
+            LOGGER.debug(
+                f'Polly first-byte latency for {language}: {time_to_first_byte * 1000:.0f} ms, '
+                f'first-byte-to-speaker latency: {first_byte_to_playback * 1000:.0f} ms'
+            )
+
+        return log_latency
@@ -0,0 +1,74 @@
+"""Process-wide pool of cloud service clients, shared by translators and reused across service restarts.
+
+Constructing a client resolves credentials and loads the service model, and its first request pays
+the TLS handshake. Pooled clients keep their connection pools, so a restarted or additional
+translation session starts with warm connections. Clients of asynchronous gRPC APIs are bound to
+the event loop they were created in; they are pooled per loop and dropped once that loop is closed.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+@dataclass
+class ClientPoolStats:
+    """Counters describing how often pooled clients were reused instead of created."""
+
+    created: int = 0
+    reused: int = 0
+    creation_seconds: float = 0.0  # Time spent constructing clients
+
+
+class ClientPool:
+    """Thread-safe pool of clients keyed by provider, service, region and credentials."""
+
+    def __init__(self):
+        self._clients: Dict[Tuple[Hashable, Optional[asyncio.AbstractEventLoop]], Any] = {}
+        self._lock = threading.Lock()
+        self.stats = ClientPoolStats()
+
+    def get(self, key: Hashable, factory: Callable[[], T], loop: Optional[asyncio.AbstractEventLoop] = None) -> T:
+        """Returns the pooled client for the key, creating it with the factory on first use.
+
+        Args:
+            key (Hashable): Identifies the client, e.g. ('aws', 'polly', region, credentials).
+            factory (Callable[[], T]): Creates the client.
+            loop (asyncio.AbstractEventLoop, optional): Event loop the client is bound to, if any.
+        """
+        with self._lock:
+            self._drop_closed_loops()
+            pool_key = (key, loop)
+            if pool_key in self._clients:
+                self.stats.reused += 1
+                return self._clients[pool_key]
+
+            started_at = time.perf_counter()
+            client = factory()
+            elapsed = time.perf_counter() - started_at
+            self.stats.created += 1
+            self.stats.creation_seconds += elapsed
+            LOGGER.debug(f'Created pooled client {key} in {elapsed * 1000:.0f} ms')
+            self._clients[pool_key] = client
+            return client
+
+    def clear(self) -> None:
+        """Drops all pooled clients."""
+        with self._lock:
+            self._clients.clear()
+            self.stats = ClientPoolStats()
+
+    def _drop_closed_loops(self) -> None:
+        closed = [pool_key for pool_key in self._clients if pool_key[1] is not None and pool_key[1].is_closed()]
+        for pool_key in closed:
+            del self._clients[pool_key]
+
+
+CLIENT_POOL = ClientPool()
@@ -1,10 +1,12 @@
 import asyncio
-import io
 import json
 import logging
 import os
-import wave
-from typing import AsyncGenerator, Dict, Optional
+import struct
+import time
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import google.auth
 from google.api_core.client_options import ClientOptions
@@ -13,10 +15,20 @@ from google.cloud import speech_v2 as speech
 from google.cloud import texttospeech, translate
 from google.cloud.speech_v2.types import cloud_speech
 
-from config.model.config_models import GoogleSettings, InputSettings, OutputSettings
-from constants import GOOGLE_STT_REGIONS
+from config.model.config_models import GoogleSettings, InputSettings, OutputSettings, QueueSettings
+from constants import GOOGLE_STT_REGIONS, GOOGLE_TRANSLATE_MAX_BATCH_SIZE
 from translation import SoundOutput, Translator
+from translators.client_pool import CLIENT_POOL
+from translators.sentence_coalescer import CoalescingStats, SentenceCoalescer
+from translators.speculation import ClauseSegmenter, SpeculationStats
+from translators.speech_cache import SpeechCache
+from translators.speech_scheduler import LanguageQueueStats, PreparedSpeech, SpeechScheduler
+from translators.translation_batcher import TranslationBatcher, TranslationBatchStats
+from translators.translation_cache import TranslationCache
 from translators.translation_callbacks import TranslationCallbacks
+from translators.warmup import WARMUP_TEXT, WarmupStats, warm_up
+from utils.pcm_stream import PcmStream
+from utils.utterance_trace import UtteranceTrace, UtteranceTracer
 
 LOGGER = logging.getLogger(__name__)
 
@@ -28,12 +40,19 @@ class GoogleTranslator(Translator):
         input_settings: InputSettings,
         output_settings: OutputSettings,
         translation_callbacks: Optional[TranslationCallbacks] = None,
+        translation_cache: Optional[TranslationCache] = None,
+        speech_cache: Optional[SpeechCache] = None,
+        queue_settings: Optional[QueueSettings] = None,
+        tracer: Optional[UtteranceTracer] = None,
     ):
         """Initializes the GoogleTranslator instance."""
         self._google_settings = google_settings
         self._input_settings = input_settings
         self._output_settings = output_settings
         self._translation_callbacks = translation_callbacks
+        self._translation_cache = translation_cache
+        self._speech_cache = speech_cache
+        self._queue_settings = queue_settings or QueueSettings()
 
         if google_settings.credentials_path and os.path.exists(google_settings.credentials_path):
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = google_settings.credentials_path
@@ -47,6 +66,19 @@ class GoogleTranslator(Translator):
         self._tts_client: Optional[texttospeech.TextToSpeechAsyncClient] = None
 
         self._language_to_output: Dict[str, SoundOutput] = {}
+        self._scheduler: Optional[SpeechScheduler] = None
+        self._coalescer: Optional[SentenceCoalescer] = None
+        self.speculation_stats = SpeculationStats()
+        self.queue_stats: Dict[str, LanguageQueueStats] = {}
+        self.coalescing_stats = CoalescingStats()
+        self.translation_batch_stats = TranslationBatchStats()
+        self.client_setup_seconds = 0.0
+        self.warmup_stats = WarmupStats()
+        self.stt_restarts = 0  # Recognition streams reopened after the server closed them
+        self.tracer = tracer if tracer is not None else UtteranceTracer()
+        self._translation_batcher = TranslationBatcher(
+            self._translate_batch, GOOGLE_TRANSLATE_MAX_BATCH_SIZE, self.translation_batch_stats
+        )
 
         LOGGER.debug('Google Translator initialized')
 
@@ -57,16 +89,37 @@ class GoogleTranslator(Translator):
         shutdown_event: asyncio.Event,
     ):
         self._language_to_output = language_to_output
+        warmup_task: Optional[asyncio.Task[None]] = None
 
         try:
+            # The async clients are bound to this loop. They are pooled per loop and credentials, so a
+            # restart on the same loop (and any other session on it) reuses their gRPC channels.
+            started_at = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            credentials = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
             # Chirp models require regional endpoints
             region = self._google_settings.region
             client_options = ClientOptions(api_endpoint=f'{region}-speech.googleapis.com')
-            self._speech_client = speech.SpeechAsyncClient(client_options=client_options)
-            self._translate_client = translate.TranslationServiceAsyncClient()
-            self._tts_client = texttospeech.TextToSpeechAsyncClient()
+            self._speech_client = CLIENT_POOL.get(
+                ('google', 'speech', region, credentials),
+                lambda: speech.SpeechAsyncClient(client_options=client_options),
+                loop,
+            )
+            self._translate_client = CLIENT_POOL.get(
+                ('google', 'translate', credentials), translate.TranslationServiceAsyncClient, loop
+            )
+            self._tts_client = CLIENT_POOL.get(
+                ('google', 'texttospeech', credentials), texttospeech.TextToSpeechAsyncClient, loop
+            )
+            self.client_setup_seconds = time.perf_counter() - started_at
 
-            LOGGER.info('Google Translator started.')
+            LOGGER.info(f'Google Translator started, clients ready in {self.client_setup_seconds * 1000:.0f} ms.')
+
+            if self._google_settings.prewarm_connections:
+                # Runs while the recognition stream is being set up.
+                warmup_task = asyncio.create_task(
+                    warm_up(self._google_settings.target_languages, self._prime_language, self.warmup_stats)
+                )
 
             stt_task = asyncio.create_task(self._run_streaming_recognition(mic_stream, shutdown_event))
             shutdown_wait_task = asyncio.create_task(shutdown_event.wait())
@@ -84,11 +137,33 @@ class GoogleTranslator(Translator):
         except Exception as e:
             LOGGER.error(f'An unexpected error occurred during Google translation: {e}', exc_info=True)
         finally:
+            if warmup_task is not None and not warmup_task.done():
+                warmup_task.cancel()
+            if self._coalescer is not None:
+                self._coalescer.cancel()
+                self._coalescer = None
+            if self._scheduler is not None:
+                await self._scheduler.stop()
+                self._scheduler = None
             self._speech_client = None
             self._translate_client = None
             self._tts_client = None
+            if self._google_settings.interim_results:
+                LOGGER.info(f'Interim translation stats: {self.speculation_stats}')
+            if self._queue_settings.coalesce_window_seconds > 0:
+                LOGGER.info(f'Transcript coalescing stats: {self.coalescing_stats}')
+            LOGGER.info(
+                f'Translation batch stats: {self.translation_batch_stats}, '
+                f'mean latency {self.translation_batch_stats.mean_latency * 1000:.0f} ms'
+            )
             LOGGER.debug('Google Translator shutdown complete.')
 
+    def _audio_channel_count(self) -> int:
+        # Google STT has no channel identification in streaming mode, so several microphones are mixed to mono.
+        if len(self._input_settings.mixer_settings.device_indices) > 1:
+            return 1
+        return self._input_settings.input_channels
+
     def _get_endpointing_sensitivity(self):
         endpointing_map = {
             'standard': (
@@ -117,11 +192,16 @@ class GoogleTranslator(Translator):
             LOGGER.debug(f'Sending first request with recognizer: {recognizer_path}')
             yield cloud_speech.StreamingRecognizeRequest(recognizer=recognizer_path, streaming_config=streaming_config)
 
+            stream_started = False
             async for chunk in mic_stream:
                 if shutdown_event.is_set():
                     LOGGER.debug('Shutdown event set, stopping request generator.')
                     break
                 yield cloud_speech.StreamingRecognizeRequest(recognizer=recognizer_path, audio=chunk)
+                if not stream_started:
+                    # Result offsets are relative to the first audio of each (restarted) stream.
+                    self.tracer.mark_stream_start()
+                    stream_started = True
         except Exception as e:
             LOGGER.error(f'Error in Google STT request generator: {e}', exc_info=True)
         finally:
@@ -129,7 +209,11 @@ class GoogleTranslator(Translator):
 
     async def _run_streaming_recognition(self, mic_stream: AsyncGenerator[bytes, None], shutdown_event: asyncio.Event):
         """Runs the Google Cloud Speech-to-Text streaming recognition in a continuous loop."""
+        first_stream = True
         while not shutdown_event.is_set():
+            if not first_stream:
+                self.stt_restarts += 1
+            first_stream = False
             try:
                 if not self._project_id:
                     LOGGER.error('Google Project ID is missing. Speech V2 requires a project ID.')
@@ -139,7 +223,7 @@ class GoogleTranslator(Translator):
                     explicit_decoding_config=cloud_speech.ExplicitDecodingConfig(
                         encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
                         sample_rate_hertz=self._input_settings.input_sample_rate,
-                        audio_channel_count=self._input_settings.input_channels,
+                        audio_channel_count=self._audio_channel_count(),
                     ),
                     language_codes=[self._google_settings.source_language],
                     model=GOOGLE_STT_REGIONS.get(self._google_settings.region, 'chirp_3'),
@@ -151,12 +235,14 @@ class GoogleTranslator(Translator):
                 streaming_config = cloud_speech.StreamingRecognitionConfig(
                     config=recognition_config,
                     streaming_features=cloud_speech.StreamingRecognitionFeatures(
-                        interim_results=False,
+                        interim_results=self._google_settings.interim_results,
                         endpointing_sensitivity=self._get_endpointing_sensitivity(),
                     ),
                 )
 
                 requests = self._generator_wrapper(mic_stream, shutdown_event, streaming_config)
+                # A new stream starts with fresh hypotheses, so clause tracking restarts as well.
+                segmenter = ClauseSegmenter(self.speculation_stats) if self._google_settings.interim_results else None
 
                 if self._speech_client is None:
                     LOGGER.error('Google Speech client is not initialized.')
@@ -180,12 +266,26 @@ class GoogleTranslator(Translator):
                         if self._translation_callbacks is not None:
                             self._translation_callbacks.update_source_field(transcript)
 
-                        for language in self._google_settings.target_languages:
-                            asyncio.create_task(self._translate_and_tts(transcript, language))
+                        if segmenter is not None:
+                            transcript = segmenter.finalize(transcript)
+
+                        if transcript:
+                            self.tracer.mark_audio_end(self._result_end_seconds(result))
+                            self._dispatch_translation(transcript)
 
                         # Yield control to allow other tasks to run
                         await asyncio.sleep(0)
 
+                    elif segmenter is not None:
+                        # Interim results split the hypothesis into several results of decreasing stability.
+                        interim_transcript = ' '.join(
+                            r.alternatives[0].transcript for r in response.results if r.alternatives
+                        )
+                        for clause in segmenter.update(interim_transcript, result.stability):
+                            LOGGER.debug(f'Translating completed interim clause: {clause}')
+                            self.tracer.mark_audio_end(self._result_end_seconds(result))
+                            self._dispatch_translation(clause)
+
             except asyncio.CancelledError:
                 LOGGER.debug('STT streaming task cancelled.')
                 break
@@ -201,74 +301,265 @@ class GoogleTranslator(Translator):
             finally:
                 LOGGER.debug('Google STT streaming recognition stream session finished.')
 
-    async def _translate_and_tts(self, transcript: str, language: str):
-        """Translates the transcript and performs Text-to-Speech."""
+    def _dispatch_translation(self, transcript: str):
+        """Queues translation and TTS of the transcript for every target language."""
+        if self._coalescer is None:
+            target_languages = self._google_settings.target_languages
+            self._scheduler = SpeechScheduler(
+                target_languages,
+                self._translate_and_tts,
+                self._queue_settings,
+                self._play_speech,
+                self.queue_stats,
+                self.tracer,
+            )
+            self._scheduler.start()
+            self._coalescer = SentenceCoalescer(
+                self._scheduler.submit, self._queue_settings, len(target_languages), self.coalescing_stats
+            )
+        self._coalescer.submit(transcript)
+
+    def traces(self) -> List[UtteranceTrace]:
+        return self.tracer.traces
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'provider': 'google',
+            'speculation': asdict(self.speculation_stats),
+            'coalescing': asdict(self.coalescing_stats),
+            'translation_batches': asdict(self.translation_batch_stats),
+            'queues': {language: asdict(stats) for language, stats in self.queue_stats.items()},
+            'client_setup_seconds': self.client_setup_seconds,
+            'warmup': asdict(self.warmup_stats),
+            'latency': {language: asdict(summary) for language, summary in self.tracer.latency_summary().items()},
+            'latency_histograms': {
+                stage: {language: asdict(histogram) for language, histogram in histograms.items()}
+                for stage, histograms in self.tracer.histograms.items()
+            },
+            'caches': self._cache_metrics(),
+            'stt': {'restarts': self.stt_restarts},
+        }
+
+    def _cache_metrics(self) -> Dict[str, Dict[str, int]]:
+        caches = {'translation': self._translation_cache, 'speech': self._speech_cache}
+        return {
+            name: {'hits': cache.hits, 'misses': cache.misses} for name, cache in caches.items() if cache is not None
+        }
+
+    async def _prime_language(self, language: str) -> None:
+        """Opens the Translate and TTS channels for a language and checks that its voice exists."""
+        tts_client = self._tts_client
+        if tts_client is None:
+            raise RuntimeError('Google TTS client is not initialized.')
+
+        voice_id = self._google_settings.target_languages[language].voice_id
+        _translations, voices = await asyncio.gather(
+            self._translate_batch([WARMUP_TEXT], language),
+            tts_client.list_voices(language_code=language),
+        )
+        if not any(voice.name == voice_id for voice in voices.voices):
+            LOGGER.warning(f'Google TTS voice {voice_id} is not available for language {language}.')
+
+    async def _play_speech(self, speech: PreparedSpeech, language: str):
+        await speech.play(self._language_to_output[language])
+
+    async def _translate_and_tts(self, transcript: str, language: str) -> Optional[PreparedSpeech]:
+        """Translates the transcript and starts the Text-to-Speech synthesis of the translation."""
         try:
             if not self._project_id:
                 LOGGER.error('Google Project ID is missing. Cannot call Translate API.')
-                return
+                return None
 
             if self._translate_client is None:
                 LOGGER.error('Google Translate client is not initialized.')
-                return
-
-            parent = f'projects/{self._project_id}/locations/global'
-
-            response = await self._translate_client.translate_text(
-                parent=parent,
-                contents=[transcript],
-                mime_type='text/plain',
-                source_language_code=self._normalize_language_code(self._google_settings.source_language),
-                target_language_code=self._normalize_language_code(language),
-            )
+                return None
 
-            translated_text = response.translations[0].translated_text if response.translations else ''
+            translated_text = await self._translate_text(transcript, language)
             if not translated_text:
                 LOGGER.warning(f'Google Translate returned empty translation for language: {language}')
-                return
+                return None
 
             if self._translation_callbacks is not None:
                 self._translation_callbacks.update_target_field(language, translated_text)
 
-            await self._google_tts(translated_text, language)
-            LOGGER.debug(f'Translation and TTS processed for language: {language}')
+            speech = await self._google_tts(translated_text, language)
+            LOGGER.debug(f'Translation processed and TTS started for language: {language}')
+            return speech
 
         except Exception as e:
             LOGGER.error(f'Error during Google Translate/TTS for {language}: {e}')
+            return None
+
+    async def _translate_text(self, transcript: str, language: str) -> str:
+        """Translates the transcript with Google Translate, answering repeated phrases from the cache."""
+        source_language = self._google_settings.source_language
+        if self._translation_cache is not None:
+            cached = self._translation_cache.get(source_language, language, transcript)
+            if cached is not None:
+                LOGGER.debug(f'Translation cache hit for language: {language}')
+                return cached
+
+        translated_text = await self._translation_batcher.translate(transcript, language)
+
+        if self._translation_cache is not None:
+            self._translation_cache.put(source_language, language, transcript, translated_text)
+        return translated_text
+
+    async def _translate_batch(self, transcripts: List[str], language: str) -> List[str]:
+        """Translates several transcripts into one language with a single Google Translate request."""
+        translate_client = self._translate_client
+        if translate_client is None:
+            raise RuntimeError('Google Translate client is not initialized.')
+
+        response = await translate_client.translate_text(
+            parent=f'projects/{self._project_id}/locations/global',
+            contents=transcripts,
+            mime_type='text/plain',
+            source_language_code=self._normalize_language_code(self._google_settings.source_language),
+            target_language_code=self._normalize_language_code(language),
+        )
+        return [translation.translated_text for translation in response.translations]
 
-    async def _google_tts(self, text: str, language: str):
-        """Converts text to speech using Google Cloud TTS and queues playback."""
+    async def _google_tts(self, text: str, language: str) -> Optional[PreparedSpeech]:
+        """Starts converting text to speech using Google Cloud TTS.
+
+        The returned speech can be played right away; its stream is fed while the audio arrives.
+        """
         LOGGER.debug(f"Synthesizing speech for text: '{text[:50]}...' in language: {language}")
 
-        try:
-            if self._tts_client is None:
-                LOGGER.error('Google TTS client is not initialized.')
-                return
+        tts_client = self._tts_client
+        if tts_client is None:
+            LOGGER.error('Google TTS client is not initialized.')
+            return None
 
-            lang_settings = self._google_settings.target_languages[language]
-            voice_id = lang_settings.voice_id
+        voice_id = self._google_settings.target_languages[language].voice_id
+        # Google voice names already encode the voice type (Standard, Neural2, Chirp3-HD, ...)
+        cache_key = SpeechCache.make_key('google', voice_id, '', self._output_settings.output_sample_rate, text)
+        pcm_stream = PcmStream(on_playback_start=self._playback_latency_logger(language))
 
-            synthesis_input = texttospeech.SynthesisInput(text=text)
-            voice = texttospeech.VoiceSelectionParams(language_code=language, name=voice_id)
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.LINEAR16,
-                sample_rate_hertz=self._output_settings.output_sample_rate,
-            )
+        cached_audio = None
+        if self._speech_cache is not None:
+            cached_audio = await asyncio.to_thread(self._speech_cache.get, cache_key)
+        if cached_audio is not None:
+            LOGGER.debug(f'Using cached speech for language: {language}.')
+            pcm_stream.feed(cached_audio)
+            pcm_stream.finish()
+            return PreparedSpeech(pcm_stream)
 
-            response = await self._tts_client.synthesize_speech(
-                input=synthesis_input, voice=voice, audio_config=audio_config
-            )
+        synthesis = asyncio.create_task(self._synthesize(tts_client, text, language, voice_id, cache_key, pcm_stream))
+        return PreparedSpeech(pcm_stream, synthesis)
 
-            # LINEAR16 enthält WAV-Header → strippen, sonst Klack am Anfang
-            wav_buffer = io.BytesIO(response.audio_content)
-            with wave.open(wav_buffer) as wf:
-                raw_pcm = wf.readframes(wf.getnframes())
-            await self._language_to_output[language].play(io.BytesIO(raw_pcm))
+    async def _synthesize(
+        self,
+        tts_client: texttospeech.TextToSpeechAsyncClient,
+        text: str,
+        language: str,
+        voice_id: str,
+        cache_key: str,
+        pcm_stream: PcmStream,
+    ) -> None:
+        """Synthesizes the text into the stream and stores the complete audio in the speech cache."""
+        voice = texttospeech.VoiceSelectionParams(language_code=language, name=voice_id)
+        try:
+            try:
+                if self._supports_streaming_synthesis(voice_id):
+                    audio = await self._synthesize_streaming(tts_client, text, voice, pcm_stream)
+                else:
+                    audio = await self._synthesize_unary(tts_client, text, voice, pcm_stream)
+            finally:
+                pcm_stream.finish()
+            if self._speech_cache is not None:
+                await asyncio.to_thread(self._speech_cache.put, cache_key, audio)
 
         except GoogleAPIError as e:
             LOGGER.error(f'Google API Error in TTS for {language}: {e}')
         except Exception as e:
-            LOGGER.error(f'Error during Google TTS or playback for language {language}: {e}', exc_info=True)
+            LOGGER.error(f'Error during Google TTS for language {language}: {e}', exc_info=True)
+
+    async def _synthesize_streaming(
+        self,
+        tts_client: texttospeech.TextToSpeechAsyncClient,
+        text: str,
+        voice: texttospeech.VoiceSelectionParams,
+        pcm_stream: PcmStream,
+    ) -> bytes:
+        """Feeds raw PCM chunks from the bidirectional streaming TTS API into the stream and returns the whole audio."""
+        streaming_config = texttospeech.StreamingSynthesizeConfig(
+            voice=voice,
+            streaming_audio_config=texttospeech.StreamingAudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.PCM,
+                sample_rate_hertz=self._output_settings.output_sample_rate,
+            ),
+        )
+
+        async def request_generator():
+            yield texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config)
+            yield texttospeech.StreamingSynthesizeRequest(input=texttospeech.StreamingSynthesisInput(text=text))
+
+        chunks = []
+        responses = await tts_client.streaming_synthesize(requests=request_generator())
+        async for response in responses:
+            pcm_stream.feed(response.audio_content)
+            chunks.append(response.audio_content)
+        return b''.join(chunks)
+
+    async def _synthesize_unary(
+        self,
+        tts_client: texttospeech.TextToSpeechAsyncClient,
+        text: str,
+        voice: texttospeech.VoiceSelectionParams,
+        pcm_stream: PcmStream,
+    ) -> bytes:
+        """Synthesizes the whole sentence in one request, feeds the PCM payload into the stream and returns it."""
+        audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.LINEAR16,
+            sample_rate_hertz=self._output_settings.output_sample_rate,
+        )
+        response = await tts_client.synthesize_speech(
+            input=texttospeech.SynthesisInput(text=text), voice=voice, audio_config=audio_config
+        )
+        # LINEAR16 contains a WAV header -> strip it, otherwise there is a click at the beginning
+        audio = self._strip_wav_header(response.audio_content)
+        pcm_stream.feed(audio)
+        return audio.tobytes()
+
+    @staticmethod
+    def _supports_streaming_synthesis(voice_id: str) -> bool:
+        """Streaming synthesis is only offered for Chirp 3 HD voices."""
+        return '-Chirp3-HD-' in voice_id
+
+    @staticmethod
+    def _strip_wav_header(audio_content: bytes) -> memoryview:
+        """Returns the PCM payload of a RIFF/WAV buffer without copying or decoding the frames."""
+        audio = memoryview(audio_content)
+        if audio[:4] != b'RIFF' or audio[8:12] != b'WAVE':
+            return audio
+
+        offset = 12
+        while offset + 8 <= len(audio):
+            chunk_id = audio[offset : offset + 4]
+            (chunk_size,) = struct.unpack_from('<I', audio, offset + 4)
+            offset += 8
+            if chunk_id == b'data':
+                return audio[offset : offset + chunk_size]
+            offset += chunk_size + (chunk_size % 2)
+        return audio[len(audio) :]
+
+    @staticmethod
+    def _playback_latency_logger(language: str):
+        """Returns a callback logging the first-byte-to-speaker latency of a synthesized sentence."""
+
+        def log_latency(pcm_stream: PcmStream):
+            time_to_first_byte = pcm_stream.time_to_first_byte
+            first_byte_to_playback = pcm_stream.first_byte_to_playback
+            if time_to_first_byte is None or first_byte_to_playback is None:
+                return
+            LOGGER.debug(
+                f'Google TTS first-byte latency for {language}: {time_to_first_byte * 1000:.0f} ms, '
+                f'first-byte-to-speaker latency: {first_byte_to_playback * 1000:.0f} ms'
+            )
+
+        return log_latency
 
     @staticmethod
     def _resolve_project_id(credentials_path: str) -> Optional[str]:
@@ -292,6 +583,14 @@ class GoogleTranslator(Translator):
             LOGGER.debug(f'Could not determine project_id from google.auth: {e}')
             return None
 
+    @staticmethod
+    def _result_end_seconds(result: cloud_speech.StreamingRecognitionResult) -> Optional[float]:
+        """Returns the end of the result's audio in seconds from the start of the stream, if reported."""
+        end_offset = getattr(result, 'result_end_offset', None)
+        if not isinstance(end_offset, timedelta):
+            return None
+        return end_offset.total_seconds()
+
     @staticmethod
     def _normalize_language_code(language_code: str) -> str:
         """Maps locale-like codes to a broadly supported base language for Google Translate."""
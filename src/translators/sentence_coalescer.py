@@ -0,0 +1,95 @@
+"""Coalescing of short consecutive transcripts into one translation request.
+
+During fast speech the STT services emit bursts of short final transcripts ("Yes." "Okay." "So,").
+Each of them would otherwise pay a full translate and TTS round trip per target language. The
+coalescer holds a short transcript back for up to `coalesce_window_seconds` and appends the finals
+that arrive in the meantime, as long as the merged text stays within `coalesce_max_chars`. Longer
+transcripts are forwarded right away, after any held-back text, so the order is preserved.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from config.model.config_models import QueueSettings
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class CoalescingStats:
+    """Counters describing how many translation requests the coalescing saved."""
+
+    transcripts: int = 0  # Transcripts received from the STT service
+    requests: int = 0  # Texts forwarded to translation and TTS
+    merged: int = 0  # Transcripts appended to a held-back one
+    calls_saved: int = 0  # Translate and TTS calls saved across all target languages
+
+
+class SentenceCoalescer:
+    """Merges short consecutive transcripts arriving within a time window into one request."""
+
+    def __init__(
+        self,
+        forward: Callable[[str], None],
+        queue_settings: QueueSettings,
+        language_count: int,
+        stats: Optional[CoalescingStats] = None,
+    ):
+        """Initializes the SentenceCoalescer instance.
+
+        Args:
+            forward (Callable[[str], None]): Receives the (merged) texts, e.g. `SpeechScheduler.submit`.
+            queue_settings (QueueSettings): Coalescing window and character budget.
+            language_count (int): Number of target languages, each paying a translate and a TTS call per request.
+            stats (CoalescingStats, optional): Counters to update.
+        """
+        self._forward = forward
+        self._window = queue_settings.coalesce_window_seconds
+        self._max_chars = queue_settings.coalesce_max_chars
+        self._language_count = language_count
+        self.stats = stats if stats is not None else CoalescingStats()
+        self._pending: Optional[str] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, text: str) -> None:
+        """Forwards the text, or holds it back to merge it with the transcripts that follow shortly."""
+        self.stats.transcripts += 1
+        if self._window <= 0:
+            self._send(text)
+            return
+
+        if self._pending is not None and len(self._pending) + 1 + len(text) > self._max_chars:
+            self.flush()
+
+        if self._pending is not None:
+            self._pending = f'{self._pending} {text}'
+            self.stats.merged += 1
+            self.stats.calls_saved += 2 * self._language_count
+        elif len(text) >= self._max_chars:
+            self._send(text)
+        else:
+            self._pending = text
+            self._flush_handle = asyncio.get_running_loop().call_later(self._window, self.flush)
+
+    def flush(self) -> None:
+        """Forwards the held-back text immediately."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._send(pending)
+
+    def cancel(self) -> None:
+        """Discards the held-back text."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = None
+
+    def _send(self, text: str) -> None:
+        self.stats.requests += 1
+        LOGGER.debug(f'Forwarding coalesced text for translation: {text[:50]}')
+        self._forward(text)
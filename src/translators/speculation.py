@@ -0,0 +1,113 @@
+"""Shared building blocks for translating speech before the STT service has finalized an utterance.
+
+Streaming STT services publish revisable hypotheses (partial or interim results) long before the
+final transcript of an utterance. Translating completed clauses of the stable part of such a
+hypothesis early cuts the perceived latency on long sentences. Once the final transcript arrives,
+the early work is reconciled against it and only the remaining text is translated.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import List
+
+LOGGER = logging.getLogger(__name__)
+
+# Punctuation that closes a clause; speculative translation only ever cuts the text behind one of these.
+CLAUSE_PUNCTUATION = frozenset('.?!,;:')
+# Minimum number of words a speculative segment needs, to avoid translating single-word fragments.
+SPECULATIVE_MIN_WORDS = 3
+
+
+@dataclass
+class SpeculationStats:
+    """Counters describing how much speculative (partial-result) work ended up being used."""
+
+    dispatched: int = 0  # Segments sent to translate/TTS ahead of the final result
+    reused: int = 0  # Speculative segments confirmed by the final result
+    wasted: int = 0  # Speculative segments the final result did not confirm
+    final_suffixes: int = 0  # Remaining suffixes translated once the final result arrived
+
+
+class ClauseSegmenter:
+    """Cuts completed clauses out of the stable part of successive interim transcripts.
+
+    A word counts as stable once two consecutive interim hypotheses agree on it (local agreement),
+    or when the STT service reports a stability at or above `stability_threshold` for the whole
+    hypothesis. A clause is complete when a stable word ends with clause punctuation and at least
+    one more word follows it in the current hypothesis.
+    """
+
+    def __init__(self, stats: SpeculationStats, stability_threshold: float = 0.9):
+        self._stats = stats
+        self._stability_threshold = stability_threshold
+        self._previous_words: List[str] = []
+        self._committed_words = 0
+        self._segments: List[List[str]] = []
+
+    def update(self, interim_transcript: str, stability: float = 0.0) -> List[str]:
+        """Feeds the latest interim hypothesis and returns the clauses that became complete."""
+        words = interim_transcript.split()
+        if stability >= self._stability_threshold:
+            stable_count = len(words)
+        else:
+            stable_count = self._common_prefix_length(self._previous_words, words)
+        self._previous_words = words
+
+        if stable_count < self._committed_words:
+            # The service revised words that were already spoken; nothing more can be committed.
+            return []
+
+        clauses: List[str] = []
+        clause_start = self._committed_words
+        for index in range(self._committed_words, min(stable_count, len(words) - 1)):
+            if words[index][-1] in CLAUSE_PUNCTUATION and index + 1 - clause_start >= SPECULATIVE_MIN_WORDS:
+                segment = words[clause_start : index + 1]
+                self._segments.append(segment)
+                clauses.append(' '.join(segment))
+                clause_start = index + 1
+
+        self._committed_words = clause_start
+        self._stats.dispatched += len(clauses)
+        return clauses
+
+    def finalize(self, final_transcript: str) -> str:
+        """Reconciles the final transcript with the spoken clauses and returns the text still to translate."""
+        words = final_transcript.split()
+        segments = self._segments
+        self._previous_words = []
+        self._committed_words = 0
+        self._segments = []
+
+        reused_end = 0
+        reused = 0
+        for segment in segments:
+            candidate = words[reused_end : reused_end + len(segment)]
+            if self._normalize(candidate) != self._normalize(segment):
+                break
+            reused_end += len(segment)
+            reused += 1
+
+        self._stats.reused += reused
+        self._stats.wasted += len(segments) - reused
+        if reused < len(segments):
+            LOGGER.debug(f'Final transcript diverged from {len(segments) - reused} speculative segment(s).')
+
+        suffix = ' '.join(words[reused_end:])
+        if segments and suffix:
+            self._stats.final_suffixes += 1
+        return suffix
+
+    @staticmethod
+    def _common_prefix_length(previous: List[str], current: List[str]) -> int:
+        length = 0
+        for previous_word, current_word in zip(previous, current, strict=False):
+            if previous_word != current_word:
+                break
+            length += 1
+        return length
+
+    @staticmethod
+    def _normalize(words: List[str]) -> List[str]:
+        """Ignores casing and punctuation, which STT services commonly revise in the final transcript."""
+        return [re.sub(r'[^\w]', '', word).lower() for word in words]
@@ -0,0 +1,180 @@
+"""Content-addressed cache for synthesized speech.
+
+Translated phrases that recur during an event ("Thank you", "Next slide", speaker names) are
+otherwise re-synthesized by the TTS provider every time. The cache stores the raw 16-bit PCM of a
+synthesized sentence under a hash of everything that influences the audio, so a repeated phrase
+plays instantly without a network round trip.
+
+Entries live in a memory tier bounded by `max_memory_bytes`. If a cache directory is given, they
+are additionally written to a disk tier bounded by `max_disk_bytes`, with one raw PCM file per
+sentence, which survives application restarts. Disk hits are promoted back into memory. Both tiers
+evict least recently used entries first.
+
+Lookups may touch the disk, so callers on the event loop run `get` and `put` in a worker thread.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from config.model.config_models import CacheSettings
+
+LOGGER = logging.getLogger(__name__)
+
+MEGABYTE = 1024 * 1024
+
+
+class SpeechCache:
+    """Thread-safe two-tier (memory, disk) LRU cache of synthesized PCM audio."""
+
+    def __init__(self, max_memory_bytes: int, max_disk_bytes: int = 0, cache_dir: Optional[Path] = None):
+        """Initializes the SpeechCache instance.
+
+        Args:
+            max_memory_bytes (int): Maximum total size of the PCM audio kept in memory.
+            max_disk_bytes (int): Maximum total size of the PCM files kept in cache_dir.
+            cache_dir (Path, optional): Directory of the disk tier. Without it, only memory is used.
+        """
+        self._max_memory_bytes = max_memory_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._cache_dir = cache_dir if max_disk_bytes > 0 else None
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        if self._cache_dir is not None:
+            self._load_disk_index(self._cache_dir)
+
+    @classmethod
+    def from_settings(cls, cache_settings: CacheSettings, cache_dir: Path) -> 'SpeechCache':
+        """Creates the speech cache, with a disk tier in cache_dir if one is configured."""
+        return cls(
+            cache_settings.speech_cache_memory_mb * MEGABYTE,
+            cache_settings.speech_cache_disk_mb * MEGABYTE,
+            cache_dir / 'speech',
+        )
+
+    @staticmethod
+    def make_key(provider: str, voice_id: str, engine: str, sample_rate: int, text: str) -> str:
+        """Returns the content address of a sentence synthesized with the given voice parameters."""
+        key_material = '\x1f'.join((provider, voice_id, engine, str(sample_rate), text.strip()))
+        return hashlib.sha256(key_material.encode('utf-8')).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._memory.keys() | self._disk.keys())
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached PCM audio, promoting disk entries to memory, or None if it is missing."""
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+            elif key in self._disk:
+                audio = self._read_from_disk(key)
+                if audio is not None:
+                    self._store_in_memory(key, audio)
+
+            if audio is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Stores synthesized PCM audio in both tiers, evicting least recently used entries as needed."""
+        if not audio:
+            return
+
+        audio = bytes(audio)
+        with self._lock:
+            self._store_in_memory(key, audio)
+            if self._cache_dir is not None and key not in self._disk:
+                self._write_to_disk(key, audio)
+
+    def _store_in_memory(self, key: str, audio: bytes) -> None:
+        if len(audio) > self._max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+
+        while self._memory_bytes > self._max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _path(self, key: str) -> Path:
+        assert self._cache_dir is not None  # only used while the disk tier is enabled
+        return self._cache_dir / f'{key}.pcm'
+
+    def _load_disk_index(self, cache_dir: Path) -> None:
+        """Indexes the PCM files of a previous run, least recently used first."""
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            files = sorted(cache_dir.glob('*.pcm'), key=lambda path: path.stat().st_mtime)
+        except OSError as e:
+            LOGGER.warning(f'Could not open speech cache directory {cache_dir}: {e}')
+            self._cache_dir = None
+            return
+
+        for path in files:
+            size = path.stat().st_size
+            self._disk[path.stem] = size
+            self._disk_bytes += size
+        self._evict_from_disk()
+        LOGGER.debug(f'Indexed {len(self._disk)} cached sentences ({self._disk_bytes} bytes) in {cache_dir}')
+
+    def _read_from_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            audio = path.read_bytes()
+            # The modification time doubles as the access time, so the LRU order survives restarts
+            os.utime(path)
+        except OSError as e:
+            LOGGER.warning(f'Could not read cached speech {path}: {e}')
+            self._disk_bytes -= self._disk.pop(key)
+            return None
+
+        self._disk.move_to_end(key)
+        return audio
+
+    def _write_to_disk(self, key: str, audio: bytes) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            LOGGER.warning(f'Could not write cached speech {path}: {e}')
+            return
+
+        self._disk[key] = len(audio)
+        self._disk_bytes += len(audio)
+        self._evict_from_disk()
+
+    def _evict_from_disk(self) -> None:
+        while self._disk_bytes > self._max_disk_bytes and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                self._path(key).unlink()
+            except OSError as e:
+                LOGGER.debug(f'Could not remove evicted speech cache entry {key}: {e}')
@@ -0,0 +1,279 @@
+"""Bounded, pipelined per-language work queues between the transcript handlers and the outputs.
+
+Every target language gets its own queue, so a slow voice in one language never holds up the
+others. The queues are bounded: when the speaker talks faster than translation, synthesis and
+playback can keep up, the configured overflow policy decides which text is dropped or merged, so
+the spoken output never drifts far behind the live speaker.
+
+Each language runs a two-stage pipeline. The dispatcher numbers the sentences and starts translating
+and synthesizing up to `pipeline_depth` of them ahead of playback. The player plays the prepared
+sentences strictly in sequence-number order, however fast their synthesis finished. It only moves on
+once the output reports the previous sentence as played (`SoundOutput.wait_until_played`), so queue
+depth and lag reflect what the listener has heard, not just what has been buffered.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Coroutine, Deque, Dict, Iterable, List, Optional, Tuple
+
+from config.model.config_models import QueueSettings
+from translation import SoundOutput
+from utils.pcm_stream import PcmStream
+from utils.utterance_trace import UtteranceTrace, UtteranceTracer
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class LanguageQueueStats:
+    """Queue metrics of a single target language."""
+
+    queue_depth: int = 0  # Sentences waiting to be translated
+    max_queue_depth: int = 0  # Highest number of waiting sentences seen
+    in_flight: int = 0  # Sentences being translated, synthesized or played
+    lag_seconds: float = 0.0  # Time between queueing and playback of the most recently played sentence
+    max_lag_seconds: float = 0.0
+    processed: int = 0  # Sentences handed to translation and TTS
+    dropped: int = 0  # Oldest sentences discarded because the queue was full
+    merged: int = 0  # Sentences appended to a waiting sentence by the 'merge' policy
+    skipped: int = 0  # Sentences discarded by the 'skip_lagging' policy
+
+
+@dataclass
+class PreparedSpeech:
+    """A translated sentence whose synthesized audio is (still being) fed into `pcm_stream`."""
+
+    pcm_stream: PcmStream
+    synthesis: Optional[asyncio.Task[None]] = None  # None if the audio is complete, e.g. from the cache
+
+    async def play(self, output: SoundOutput) -> None:
+        """Plays the speech on the output and returns once it has been played out."""
+        try:
+            async with output.playback_lock:
+                await output.play(self.pcm_stream)
+                if self.synthesis is not None:
+                    await self.synthesis
+                await output.wait_until_played()
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+
+    def cancel(self) -> None:
+        """Stops the synthesis and discards the audio."""
+        if self.synthesis is not None:
+            self.synthesis.cancel()
+        self.pcm_stream.close()
+
+
+PrepareSpeech = Callable[[str, str], Coroutine[Any, Any, Optional[PreparedSpeech]]]
+PlaySpeech = Callable[[PreparedSpeech, str], Awaitable[None]]
+
+
+@dataclass
+class _QueuedSentence:
+    text: str
+    enqueued_at: float
+    trace: Optional[UtteranceTrace] = None
+    sequence: int = 0
+
+
+class _LanguageQueue:
+    def __init__(self, stats: LanguageQueueStats, pipeline_depth: int):
+        self.sentences: Deque[_QueuedSentence] = deque()
+        self.ready = asyncio.Event()
+        self.stats = stats
+        self.pipeline_slots = asyncio.Semaphore(pipeline_depth)
+        # Prepared (or still preparing) sentences by sequence number
+        self.pipeline: Dict[int, Tuple[_QueuedSentence, asyncio.Task[Optional[PreparedSpeech]]]] = {}
+        self.pipeline_changed = asyncio.Event()
+        self.next_sequence = 0
+        self.next_to_play = 0
+        self.tasks: List[asyncio.Task[None]] = []
+
+
+class SpeechScheduler:
+    """Translates, synthesizes and plays queued sentences per target language, in order and pipelined."""
+
+    def __init__(
+        self,
+        languages: Iterable[str],
+        prepare: PrepareSpeech,
+        queue_settings: QueueSettings,
+        play: Optional[PlaySpeech] = None,
+        stats: Optional[Dict[str, LanguageQueueStats]] = None,
+        tracer: Optional[UtteranceTracer] = None,
+    ):
+        """Initializes the SpeechScheduler instance.
+
+        Args:
+            languages (Iterable[str]): Target language codes that get a queue.
+            prepare (PrepareSpeech): Coroutine translating (text, language) and starting its synthesis.
+            queue_settings (QueueSettings): Queue size, overflow policy and pipeline depth.
+            play (PlaySpeech, optional): Coroutine playing prepared speech of a language until it was heard.
+            stats (Dict[str, LanguageQueueStats], optional): Per-language metrics to update, so the owner
+                can read them independently of the scheduler's lifetime.
+            tracer (UtteranceTracer, optional): Records the latency trace of every submitted text.
+        """
+        self._prepare = prepare
+        self._play = play
+        self._settings = queue_settings
+        self._tracer = tracer
+        stats = stats if stats is not None else {}
+        self._queues: Dict[str, _LanguageQueue] = {
+            language: _LanguageQueue(stats.setdefault(language, LanguageQueueStats()), queue_settings.pipeline_depth)
+            for language in languages
+        }
+
+    @property
+    def stats(self) -> Dict[str, LanguageQueueStats]:
+        return {language: queue.stats for language, queue in self._queues.items()}
+
+    def start(self) -> None:
+        """Starts the dispatcher and player of every target language in the running event loop."""
+        for language, queue in self._queues.items():
+            if not queue.tasks:
+                queue.tasks = [
+                    asyncio.create_task(self._run_dispatcher(language, queue)),
+                    asyncio.create_task(self._run_player(language, queue)),
+                ]
+
+    async def stop(self) -> None:
+        """Cancels the pipelines and discards the sentences that have not been played yet."""
+        tasks = [task for queue in self._queues.values() for task in queue.tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for language, queue in self._queues.items():
+            for sentence, preparation in queue.pipeline.values():
+                self._discard(preparation)
+                self._finish_trace(sentence, language, 'discarded')
+            for sentence in queue.sentences:
+                self._finish_trace(sentence, language, 'discarded')
+            queue.tasks = []
+            queue.pipeline.clear()
+            queue.sentences.clear()
+            queue.stats.queue_depth = 0
+            queue.stats.in_flight = 0
+            LOGGER.info(f'TTS queue stats for {language}: {queue.stats}')
+        if self._tracer is not None:
+            await self._tracer.flush()
+
+    def submit(self, text: str) -> None:
+        """Queues the text for every target language without waiting for translation or TTS."""
+        now = time.monotonic()
+        trace = self._tracer.start(text, self._queues) if self._tracer is not None else None
+        for language, queue in self._queues.items():
+            self._enqueue(language, queue, _QueuedSentence(text, now, trace))
+            queue.stats.queue_depth = len(queue.sentences)
+            queue.stats.max_queue_depth = max(queue.stats.max_queue_depth, queue.stats.queue_depth)
+            queue.ready.set()
+
+    def _enqueue(self, language: str, queue: _LanguageQueue, sentence: _QueuedSentence) -> None:
+        sentences = queue.sentences
+        if len(sentences) < self._settings.max_queue_size:
+            sentences.append(sentence)
+            return
+
+        policy = self._settings.overflow_policy
+        if policy == 'merge' and len(sentences[-1].text) + 1 + len(sentence.text) <= self._settings.max_merge_chars:
+            # The merged sentence keeps its original timestamp, so the lag reflects the oldest text in it.
+            sentences[-1].text = f'{sentences[-1].text} {sentence.text}'
+            queue.stats.merged += 1
+            self._finish_trace(sentence, language, 'merged')
+            return
+
+        if policy == 'skip_lagging':
+            self._skip_lagging(language, queue, sentence.enqueued_at)
+            if len(sentences) < self._settings.max_queue_size:
+                sentences.append(sentence)
+                return
+
+        dropped = sentences.popleft()
+        sentences.append(sentence)
+        queue.stats.dropped += 1
+        self._finish_trace(dropped, language, 'dropped')
+        LOGGER.warning(f'TTS queue for {language} is full, dropped sentence: {dropped.text[:50]}')
+
+    def _skip_lagging(self, language: str, queue: _LanguageQueue, now: float) -> None:
+        """Discards waiting sentences that are older than the configured maximum lag."""
+        while queue.sentences and now - queue.sentences[0].enqueued_at > self._settings.max_lag_seconds:
+            skipped = queue.sentences.popleft()
+            queue.stats.skipped += 1
+            self._finish_trace(skipped, language, 'skipped')
+            LOGGER.warning(f'TTS for {language} lags behind the speaker, skipped sentence: {skipped.text[:50]}')
+
+    async def _run_dispatcher(self, language: str, queue: _LanguageQueue) -> None:
+        """Numbers waiting sentences and starts preparing them while a pipeline slot is free."""
+        while True:
+            await queue.pipeline_slots.acquire()
+
+            while True:
+                if self._settings.overflow_policy == 'skip_lagging':
+                    self._skip_lagging(language, queue, time.monotonic())
+                if queue.sentences:
+                    break
+                queue.stats.queue_depth = 0
+                queue.ready.clear()
+                await queue.ready.wait()
+
+            sentence = queue.sentences.popleft()
+            sentence.sequence = queue.next_sequence
+            queue.next_sequence += 1
+            queue.stats.queue_depth = len(queue.sentences)
+            queue.stats.in_flight += 1
+            queue.stats.processed += 1
+
+            preparation = asyncio.create_task(self._prepare(sentence.text, language))
+            queue.pipeline[sentence.sequence] = (sentence, preparation)
+            queue.pipeline_changed.set()
+
+    async def _run_player(self, language: str, queue: _LanguageQueue) -> None:
+        """Plays prepared sentences in sequence-number order."""
+        while True:
+            while queue.next_to_play not in queue.pipeline:
+                queue.pipeline_changed.clear()
+                await queue.pipeline_changed.wait()
+
+            sentence, preparation = queue.pipeline[queue.next_to_play]
+            try:
+                speech = await preparation
+                if speech is not None:
+                    stats = queue.stats
+                    stats.lag_seconds = time.monotonic() - sentence.enqueued_at
+                    stats.max_lag_seconds = max(stats.max_lag_seconds, stats.lag_seconds)
+                    LOGGER.debug(f'Playing sentence #{sentence.sequence} for {language}')
+                    if self._play is not None:
+                        await self._play(speech, language)
+                    self._finish_trace(sentence, language, 'played', speech.pcm_stream)
+                else:
+                    self._finish_trace(sentence, language, 'failed')
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.error(f'Error while processing sentence #{sentence.sequence} for {language}: {e}', exc_info=True)
+                self._finish_trace(sentence, language, 'failed')
+
+            del queue.pipeline[sentence.sequence]
+            queue.next_to_play += 1
+            queue.stats.in_flight -= 1
+            queue.pipeline_slots.release()
+
+    def _finish_trace(
+        self, sentence: _QueuedSentence, language: str, status: str, pcm_stream: Optional[PcmStream] = None
+    ) -> None:
+        if self._tracer is not None and sentence.trace is not None:
+            played_at = time.time() if status == 'played' else None
+            self._tracer.finish(sentence.trace, language, status, pcm_stream, played_at)
+
+    @staticmethod
+    def _discard(preparation: asyncio.Task[Optional[PreparedSpeech]]) -> None:
+        if not preparation.done():
+            preparation.cancel()
+        elif not preparation.cancelled() and preparation.exception() is None:
+            speech = preparation.result()
+            if speech is not None:
+                speech.cancel()
@@ -0,0 +1,102 @@
+"""Batching front-end for translation services that accept several texts per request.
+
+The per-language pipelines of the speech scheduler request translations independently. Requests
+made during the same event loop iteration, i.e. the fan-out of one transcript to every target
+language and any sentences queued behind it, are collected and sent as one request per target
+language with all texts in `contents`. The requests for the different languages run concurrently.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+TranslateBatch = Callable[[List[str], str], Awaitable[List[str]]]
+
+
+@dataclass
+class TranslationBatchStats:
+    """Counters describing the batched translation requests."""
+
+    batches: int = 0  # Requests sent to the translation service
+    texts: int = 0  # Texts translated by these requests
+    last_latency: float = 0.0  # Seconds the most recent request took
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def requests_saved(self) -> int:
+        return self.texts - self.batches
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.batches if self.batches else 0.0
+
+
+class TranslationBatcher:
+    """Collects concurrent translation requests and sends them as one request per target language."""
+
+    def __init__(
+        self, translate_batch: TranslateBatch, max_batch_size: int, stats: Optional[TranslationBatchStats] = None
+    ):
+        """Initializes the TranslationBatcher instance.
+
+        Args:
+            translate_batch (TranslateBatch): Coroutine translating a list of texts into one language,
+                returning the translations in the same order.
+            max_batch_size (int): Maximum number of texts per request.
+            stats (TranslationBatchStats, optional): Counters to update.
+        """
+        self._translate_batch = translate_batch
+        self._max_batch_size = max(1, max_batch_size)
+        self.stats = stats if stats is not None else TranslationBatchStats()
+        self._pending: Dict[str, List[Tuple[str, asyncio.Future[str]]]] = {}
+        self._flush_scheduled = False
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def translate(self, text: str, language: str) -> str:
+        """Translates the text together with the other texts requested in this event loop iteration."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.setdefault(language, []).append((text, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        for language, requests in pending.items():
+            for start in range(0, len(requests), self._max_batch_size):
+                task = asyncio.create_task(self._send(language, requests[start : start + self._max_batch_size]))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, language: str, requests: List[Tuple[str, asyncio.Future[str]]]) -> None:
+        # Identical texts (e.g. the same sentence queued twice) are translated only once.
+        texts = list(dict.fromkeys(text for text, _future in requests))
+        started_at = time.monotonic()
+        try:
+            translations = await self._translate_batch(texts, language)
+        except Exception as e:
+            for _text, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        latency = time.monotonic() - started_at
+        self.stats.batches += 1
+        self.stats.texts += len(requests)
+        self.stats.last_latency = latency
+        self.stats.max_latency = max(self.stats.max_latency, latency)
+        self.stats.total_latency += latency
+        LOGGER.debug(f'Translated batch of {len(texts)} texts into {language} in {latency * 1000:.0f} ms')
+
+        translated = dict(zip(texts, translations, strict=False))
+        for text, future in requests:
+            if not future.done():
+                future.set_result(translated.get(text, ''))
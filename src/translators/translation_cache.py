@@ -0,0 +1,141 @@
+"""In-process LRU cache for machine translation results.
+
+Recurring phrases ("Thank you", "Next slide", speaker names, agenda items) are translated over
+and over during an event. The cache sits in front of the provider's translate call, evicts the
+least recently used entries beyond `max_entries`, expires entries older than `ttl_seconds`, and
+can optionally be persisted to a JSON file so it survives application restarts.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+from config.model.config_models import CacheSettings
+
+LOGGER = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]
+
+
+class TranslationCache:
+    """Thread-safe LRU cache keyed by (source language, target language, text)."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, persist_path: Optional[Path] = None):
+        """Initializes the TranslationCache instance.
+
+        Args:
+            max_entries (int): Maximum number of cached translations.
+            ttl_seconds (float): Age after which a cached translation is no longer used.
+            persist_path (Path, optional): JSON file the cache is loaded from and saved to.
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._persist_path = persist_path
+        self._entries: OrderedDict[CacheKey, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        if self._persist_path is not None:
+            self.load()
+
+    @classmethod
+    def from_settings(cls, cache_settings: CacheSettings, cache_dir: Path, provider: str) -> 'TranslationCache':
+        """Creates the translation cache of a provider, persisted in cache_dir if configured."""
+        persist_path = None
+        if cache_settings.persist_translation_cache:
+            persist_path = cache_dir / f'translations-{provider}.json'
+        return cls(cache_settings.translation_cache_size, cache_settings.translation_cache_ttl, persist_path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, source_language: str, target_language: str, text: str) -> Optional[str]:
+        """Returns the cached translation, or None if it is missing or expired."""
+        key = (source_language, target_language, text.strip())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[1] > self._ttl_seconds:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, source_language: str, target_language: str, text: str, translation: str) -> None:
+        """Stores a translation, evicting the least recently used entries if the cache is full."""
+        if self._max_entries <= 0 or not translation:
+            return
+
+        key = (source_language, target_language, text.strip())
+        with self._lock:
+            self._entries[key] = (translation, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def load(self) -> None:
+        """Loads non-expired entries from the persist file, if it exists."""
+        if self._persist_path is None or self._max_entries <= 0 or not self._persist_path.exists():
+            return
+
+        try:
+            with open(self._persist_path, 'r', encoding='utf-8') as file:
+                raw_entries = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            LOGGER.warning(f'Could not load translation cache from {self._persist_path}: {e}')
+            return
+
+        if not isinstance(raw_entries, list):
+            LOGGER.warning(f'Ignoring translation cache {self._persist_path}: unexpected file format')
+            return
+
+        now = time.time()
+        with self._lock:
+            for raw_entry in raw_entries[-self._max_entries :]:
+                try:
+                    source_language, target_language, text, translation, created = raw_entry
+                    if now - float(created) > self._ttl_seconds:
+                        continue
+                except TypeError, ValueError:
+                    LOGGER.debug(f'Skipping malformed translation cache entry: {raw_entry!r}')
+                    continue
+                self._entries[(str(source_language), str(target_language), str(text))] = (
+                    str(translation),
+                    float(created),
+                )
+        LOGGER.debug(f'Loaded {len(self._entries)} cached translations from {self._persist_path}')
+
+    def save(self) -> None:
+        """Writes the cache to the persist file (oldest entries first)."""
+        if self._persist_path is None:
+            return
+
+        with self._lock:
+            raw_entries = [[*key, translation, created] for key, (translation, created) in self._entries.items()]
+
+        try:
+            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._persist_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(raw_entries, file, ensure_ascii=False)
+            os.replace(tmp_path, self._persist_path)
+            LOGGER.debug(f'Saved {len(raw_entries)} cached translations to {self._persist_path}')
+        except OSError as e:
+            LOGGER.warning(f'Could not save translation cache to {self._persist_path}: {e}')
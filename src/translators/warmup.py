@@ -0,0 +1,53 @@
+"""Connection warm-up for the translation and TTS services of the target languages.
+
+Without a warm-up, the first final transcript is the first request to the translation and TTS
+endpoints, and the first sentence pays the TLS handshakes and voice lookups on top of the usual
+latency. The warm-up sends a cheap request per target language to both services in parallel while
+the STT stream is coming up, so the first sentence is served over open connections.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+# Shortest text that still makes the translation service run a real request for the language pair.
+WARMUP_TEXT = 'OK'
+
+
+@dataclass
+class WarmupStats:
+    """Outcome of the warm-up of one translation run."""
+
+    languages: int = 0
+    failures: int = 0
+    seconds: float = 0.0  # Wall-clock time of the whole warm-up
+
+
+async def warm_up(languages: Iterable[str], prime: Callable[[str], Awaitable[None]], stats: WarmupStats) -> None:
+    """Primes the connections of all target languages in parallel.
+
+    Failures are only logged: the warm-up is an optimization and must not stop the translation.
+
+    Args:
+        languages (Iterable[str]): Target languages to prime.
+        prime (Callable[[str], Awaitable[None]]): Coroutine priming the services for one language.
+        stats (WarmupStats): Outcome of the warm-up, updated in place.
+    """
+    languages = list(languages)
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*(prime(language) for language in languages), return_exceptions=True)
+
+    stats.languages = len(languages)
+    stats.failures = 0
+    for language, result in zip(languages, results, strict=True):
+        if isinstance(result, Exception):
+            stats.failures += 1
+            LOGGER.warning(f'Warm-up for language {language} failed: {result}')
+    stats.seconds = time.perf_counter() - started_at
+    LOGGER.info(
+        f'Warmed up translation and TTS connections for {len(languages)} languages in {stats.seconds * 1000:.0f} ms'
+    )
@@ -0,0 +1,55 @@
+"""Thread pool for blocking SDK calls, sized from the language fan-out and counting its saturation."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class ExecutorStats:
+    """Counters describing the demand on the worker threads."""
+
+    in_flight: int = 0  # Calls submitted and not finished yet
+    peak_in_flight: int = 0
+    queued: int = 0  # Calls that waited because every worker was busy
+
+
+class DemandSizedExecutor(ThreadPoolExecutor):
+    """Plain thread pool whose size the caller derives from the expected fan-out, e.g. the target languages.
+
+    The size is fixed at construction. The counters record the calls in flight, their peak and the calls
+    that had to wait for a busy worker, which shows whether the chosen size was too small.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = ''):
+        """Initializes the DemandSizedExecutor instance.
+
+        Args:
+            max_workers (int): Number of worker threads.
+            thread_name_prefix (str): Prefix of the worker thread names.
+        """
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.max_workers = max_workers
+        self.stats = ExecutorStats()
+        self._stats_lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        with self._stats_lock:
+            if self.stats.in_flight >= self.max_workers:
+                self.stats.queued += 1
+            self.stats.in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+        try:
+            future = super().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._call_done()
+            raise
+        future.add_done_callback(lambda _future: self._call_done())
+        return future
+
+    def _call_done(self) -> None:
+        with self._stats_lock:
+            self.stats.in_flight -= 1
@@ -0,0 +1,151 @@
+"""Minimal metrics endpoint in the Prometheus text exposition format.
+
+The service runs headless on event PCs, so the metrics are served by a small HTTP server from the
+standard library on `/metrics`, without a dependency on a Prometheus client library.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@dataclass
+class Histogram:
+    """Distribution of observed values over fixed buckets."""
+
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    counts: List[int] = field(default_factory=list)  # Per bucket, not cumulative; the last one is +Inf
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+
+class PrometheusText:
+    """Collects samples grouped by metric family and renders them in the text exposition format."""
+
+    def __init__(self, prefix: str = ''):
+        self._prefix = prefix
+        self._families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def add(self, name: str, kind: str, help_text: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        """Adds a sample of a counter or gauge."""
+        name = self._prefix + name
+        self._family(name, kind, help_text).append(f'{name}{self._labels(labels)} {self._number(value)}')
+
+    def add_histogram(self, name: str, help_text: str, histogram: Histogram, labels: Dict[str, str]) -> None:
+        """Adds the cumulative buckets, sum and count of a histogram."""
+        name = self._prefix + name
+        samples = self._family(name, 'histogram', help_text)
+        cumulative = 0
+        bounds = [self._number(bound) for bound in histogram.buckets] + ['+Inf']
+        for bound, count in zip(bounds, histogram.counts, strict=True):
+            cumulative += count
+            samples.append(f'{name}_bucket{self._labels({**labels, "le": bound})} {cumulative}')
+        samples.append(f'{name}_sum{self._labels(labels)} {self._number(histogram.total)}')
+        samples.append(f'{name}_count{self._labels(labels)} {histogram.count}')
+
+    def render(self) -> str:
+        lines = []
+        for name, (kind, help_text, samples) in self._families.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+
+    def _family(self, name: str, kind: str, help_text: str) -> List[str]:
+        return self._families.setdefault(name, (kind, help_text, []))[2]
+
+    @staticmethod
+    def _labels(labels: Optional[Dict[str, str]]) -> str:
+        if not labels:
+            return ''
+        return '{' + ','.join(f'{key}="{PrometheusText._escape(value)}"' for key, value in labels.items()) + '}'
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+    @staticmethod
+    def _number(value: float) -> str:
+        return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsServer:
+    """Serves the collected metrics on /metrics from a background thread."""
+
+    def __init__(self, collect: Callable[[], str], port: int, host: str = '127.0.0.1'):
+        """Initializes the MetricsServer instance.
+
+        Args:
+            collect (Callable[[], str]): Returns the current metrics in the text exposition format.
+            port (int): TCP port to listen on; 0 picks a free port.
+            host (str): Interface to listen on.
+        """
+        self._collect = collect
+        self._address = (host, port)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> Optional[int]:
+        """The port the server listens on, once started."""
+        return self._server.server_address[1] if self._server is not None else None
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        collect = self._collect
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                try:
+                    body = collect().encode('utf-8')
+                except Exception as e:
+                    LOGGER.error(f'Collecting metrics failed: {e}', exc_info=True)
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                LOGGER.debug(f'Metrics request from {self.address_string()}: {format % args}')
+
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name='MetricsServerThread')
+        self._thread.start()
+        LOGGER.info(f'Metrics endpoint listening on http://{self._address[0]}:{self.port}/metrics')
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._server = None
+        self._thread = None
@@ -0,0 +1,78 @@
+"""Preallocated ring buffer handing PCM audio from an audio callback thread to the event loop."""
+
+import threading
+from typing import Union
+
+
+class PcmRingBuffer:
+    """Thread-safe ring buffer of PCM bytes with a fixed, preallocated capacity.
+
+    The audio callback thread writes into the buffer without allocating; the consumer reads any
+    number of buffered bytes at once, which coalesces several callback buffers into one chunk.
+    When the consumer falls behind and the buffer is full, incoming audio is dropped and counted.
+    """
+
+    def __init__(self, capacity: int):
+        """Initializes the PcmRingBuffer instance.
+
+        Args:
+            capacity (int): Number of bytes the buffer holds.
+        """
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._capacity = capacity
+        self._read_pos = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.overruns = 0  # Writes dropped because the buffer was full
+        self.overrun_bytes = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def available(self) -> int:
+        """Number of buffered bytes that have not been read yet."""
+        return self._size
+
+    def write(self, data: Union[bytes, memoryview]) -> bool:
+        """Copies the data into the buffer.
+
+        Returns:
+            bool: False if the data did not fit and was dropped.
+        """
+        length = len(data)
+        source = memoryview(data)
+        with self._lock:
+            if length > self._capacity - self._size:
+                self.overruns += 1
+                self.overrun_bytes += length
+                return False
+
+            write_pos = (self._read_pos + self._size) % self._capacity
+            first = min(length, self._capacity - write_pos)
+            self._view[write_pos : write_pos + first] = source[:first]
+            if first < length:
+                self._view[: length - first] = source[first:]
+            self._size += length
+            return True
+
+    def read(self, max_bytes: int) -> bytes:
+        """Removes and returns up to max_bytes of the oldest buffered audio."""
+        with self._lock:
+            length = min(max_bytes, self._size)
+            first = min(length, self._capacity - self._read_pos)
+            if first == length:
+                data = bytes(self._view[self._read_pos : self._read_pos + length])
+            else:
+                data = b''.join((self._view[self._read_pos :], self._view[: length - first]))
+            self._read_pos = (self._read_pos + length) % self._capacity
+            self._size -= length
+            return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._read_pos = 0
+            self._size = 0
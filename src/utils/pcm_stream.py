@@ -0,0 +1,101 @@
+"""Incrementally fed PCM stream used to start playback before TTS synthesis has finished.
+
+A `PcmStream` implements the `AudioReadableStream` protocol, so it can be passed to
+any `SoundOutput.play` right away. The translator keeps feeding audio chunks into it
+as they arrive from the TTS provider, while the output reads them from its own worker
+thread. `read()` blocks until enough audio is buffered or the producer has finished.
+"""
+
+import threading
+import time
+from typing import Callable, Optional, Union
+
+
+class PcmStream:
+    """Thread-safe byte stream fed by a producer (TTS) and drained by a consumer (SoundOutput)."""
+
+    def __init__(self, on_playback_start: Optional[Callable[['PcmStream'], None]] = None):
+        """Initializes the PcmStream instance.
+
+        Args:
+            on_playback_start (Callable, optional): Called once, from the consumer thread, when the
+                first audio bytes are handed to the output.
+        """
+        self._buffer = bytearray()
+        self._condition = threading.Condition()
+        self._finished = False
+        self._on_playback_start = on_playback_start
+
+        self.requested_at: float = time.perf_counter()
+        self.first_chunk_at: Optional[float] = None
+        self.playback_started_at: Optional[float] = None
+
+    @property
+    def time_to_first_byte(self) -> Optional[float]:
+        """Seconds between the synthesis request and the first audio bytes received from the provider."""
+        if self.first_chunk_at is None:
+            return None
+        return self.first_chunk_at - self.requested_at
+
+    @property
+    def time_to_playback(self) -> Optional[float]:
+        """Seconds between the synthesis request and the first audio bytes handed to the output."""
+        if self.playback_started_at is None:
+            return None
+        return self.playback_started_at - self.requested_at
+
+    @property
+    def first_byte_to_playback(self) -> Optional[float]:
+        """Seconds between the first audio bytes received from the provider and handing them to the output."""
+        if self.first_chunk_at is None or self.playback_started_at is None:
+            return None
+        return self.playback_started_at - self.first_chunk_at
+
+    def feed(self, data: Union[bytes, memoryview]) -> None:
+        """Appends audio received from the provider and wakes up a waiting reader."""
+        if not data:
+            return
+        with self._condition:
+            if self._finished:
+                return
+            if self.first_chunk_at is None:
+                self.first_chunk_at = time.perf_counter()
+            self._buffer += data
+            self._condition.notify_all()
+
+    def finish(self) -> None:
+        """Marks the end of the audio; readers drain the remaining buffer and then get EOF."""
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Reads up to amt bytes, blocking until that much audio is buffered or the stream is finished.
+
+        Only whole 16-bit samples are returned until the stream is finished, so outputs never
+        receive a misaligned chunk.
+        """
+        with self._condition:
+            if amt is None:
+                self._condition.wait_for(lambda: self._finished)
+                amt = len(self._buffer)
+            else:
+                self._condition.wait_for(lambda: self._finished or len(self._buffer) >= amt)
+                if not self._finished:
+                    amt -= amt % 2
+
+            data = bytes(self._buffer[:amt])
+            del self._buffer[:amt]
+
+        if data and self.playback_started_at is None:
+            self.playback_started_at = time.perf_counter()
+            if self._on_playback_start is not None:
+                self._on_playback_start(self)
+        return data
+
+    def close(self) -> None:
+        """Discards any buffered audio and releases blocked readers."""
+        with self._condition:
+            self._finished = True
+            self._buffer.clear()
+            self._condition.notify_all()
@@ -0,0 +1,227 @@
+"""End-to-end latency traces of the translated utterances.
+
+Every text handed to the speech scheduler gets a trace record with the time its audio was
+captured and its transcript became final, and, per target language, the times the translation
+returned, the first synthesized audio arrived, and playback started and ended. Completed records
+are kept in memory for the metrics and can be appended to a JSONL file, one record per line;
+the file is written in a worker thread, so the event loop does not wait for the disk.
+All timestamps are wall-clock seconds since the epoch.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Deque, Dict, Iterable, List, Optional
+
+from utils.metrics_server import Histogram
+from utils.pcm_stream import PcmStream
+
+LOGGER = logging.getLogger(__name__)
+
+TRACE_HISTORY = 200  # Completed traces kept in memory
+
+# Latency stages recorded in histograms, from the final transcript to the translated speech
+LATENCY_STAGES = ('translate', 'tts_first_byte', 'end_to_end')
+
+
+@dataclass
+class LanguageTrace:
+    """Timestamps of an utterance in one target language."""
+
+    status: str = 'pending'  # played, failed, dropped, merged, skipped or discarded
+    translation_returned: Optional[float] = None  # TTS was requested right after the translation returned
+    tts_first_byte: Optional[float] = None
+    playback_start: Optional[float] = None
+    playback_end: Optional[float] = None
+
+
+@dataclass
+class UtteranceTrace:
+    """Trace record of one utterance, from the captured audio to the played translations."""
+
+    utterance_id: int
+    session_id: str
+    text: str
+    final_transcript: float
+    audio_captured: Optional[float] = None  # End of the utterance's audio, if the STT service reports it
+    languages: Dict[str, LanguageTrace] = field(default_factory=dict)
+
+    @property
+    def completed(self) -> bool:
+        return all(language.status != 'pending' for language in self.languages.values())
+
+    def latency(self, language: str) -> Optional[float]:
+        """Seconds from the end of the speech (or the final transcript) until the translation started playing."""
+        playback_start = self.languages[language].playback_start
+        if playback_start is None:
+            return None
+        return playback_start - (self.audio_captured or self.final_transcript)
+
+
+@dataclass
+class LatencySummary:
+    """End-to-end latency of the recently played utterances of one target language."""
+
+    count: int = 0
+    last: float = 0.0
+    mean: float = 0.0
+    max: float = 0.0
+
+
+class UtteranceTracer:
+    """Creates, completes and records the utterance traces of one translation session."""
+
+    def __init__(self, session_id: str = 'main', trace_file: Optional[str] = None, history: int = TRACE_HISTORY):
+        """Initializes the UtteranceTracer instance.
+
+        Args:
+            session_id (str): Session the traces belong to.
+            trace_file (str, optional): JSONL file completed traces are appended to.
+            history (int): Number of completed traces kept in memory.
+        """
+        self._session_id = session_id
+        self._trace_file = trace_file
+        self._next_id = 0
+        self._stream_started_at: Optional[float] = None
+        self._audio_end: Optional[float] = None
+        self._traces: Deque[UtteranceTrace] = deque(maxlen=history)
+        self._unwritten: List[str] = []  # JSONL lines waiting for the writer task
+        self._writer: Optional[asyncio.Task] = None
+        # Latency histograms by stage and target language, over all utterances of the session
+        self.histograms: Dict[str, Dict[str, Histogram]] = {stage: {} for stage in LATENCY_STAGES}
+
+    @property
+    def traces(self) -> List[UtteranceTrace]:
+        """The most recently completed traces, oldest first."""
+        return list(self._traces)
+
+    def mark_stream_start(self) -> None:
+        """Records that the first audio of a new STT stream was sent; result offsets are relative to it."""
+        self._stream_started_at = time.time()
+
+    def mark_audio_end(self, offset_seconds: Optional[float]) -> None:
+        """Records the end of the next utterance's audio as an offset from the start of the STT stream."""
+        if offset_seconds is not None and self._stream_started_at is not None:
+            self._audio_end = self._stream_started_at + offset_seconds
+
+    def start(self, text: str, languages: Iterable[str]) -> UtteranceTrace:
+        """Creates the trace of a text whose transcript just became final."""
+        trace = UtteranceTrace(
+            self._next_id,
+            self._session_id,
+            text,
+            time.time(),
+            self._audio_end,
+            {language: LanguageTrace() for language in languages},
+        )
+        self._next_id += 1
+        self._audio_end = None
+        return trace
+
+    def finish(
+        self,
+        trace: UtteranceTrace,
+        language: str,
+        status: str,
+        pcm_stream: Optional[PcmStream] = None,
+        played_at: Optional[float] = None,
+    ) -> None:
+        """Completes the trace of one language and records the trace once every language is complete.
+
+        Args:
+            trace (UtteranceTrace): The trace to complete.
+            language (str): Target language that is complete.
+            status (str): How the utterance ended in this language.
+            pcm_stream (PcmStream, optional): Stream of the synthesized speech, with its timestamps.
+            played_at (float, optional): Wall-clock time playback ended.
+        """
+        language_trace = trace.languages.get(language)
+        if language_trace is None or language_trace.status != 'pending':
+            return
+
+        language_trace.status = status
+        language_trace.playback_end = played_at
+        if pcm_stream is not None:
+            language_trace.translation_returned = self._to_wall_clock(pcm_stream.requested_at)
+            language_trace.tts_first_byte = self._to_wall_clock(pcm_stream.first_chunk_at)
+            language_trace.playback_start = self._to_wall_clock(pcm_stream.playback_started_at)
+            self._observe(trace, language)
+
+        if trace.completed:
+            self._traces.append(trace)
+            self._write(trace)
+
+    async def flush(self) -> None:
+        """Waits until the completed traces have been written to the trace file."""
+        if self._writer is not None:
+            await self._writer
+
+    def latency_summary(self) -> Dict[str, LatencySummary]:
+        """Summarizes the end-to-end latency per target language over the recent traces."""
+        latencies: Dict[str, List[float]] = {}
+        for trace in self._traces:
+            for language in trace.languages:
+                latency = trace.latency(language)
+                if latency is not None:
+                    latencies.setdefault(language, []).append(latency)
+        return {
+            language: LatencySummary(len(values), values[-1], sum(values) / len(values), max(values))
+            for language, values in latencies.items()
+        }
+
+    def _observe(self, trace: UtteranceTrace, language: str) -> None:
+        language_trace = trace.languages[language]
+        latencies = {
+            'translate': self._difference(trace.final_transcript, language_trace.translation_returned),
+            'tts_first_byte': self._difference(language_trace.translation_returned, language_trace.tts_first_byte),
+            'end_to_end': trace.latency(language),
+        }
+        for stage, latency in latencies.items():
+            if latency is not None:
+                self.histograms[stage].setdefault(language, Histogram()).observe(max(0.0, latency))
+
+    @staticmethod
+    def _difference(start: Optional[float], end: Optional[float]) -> Optional[float]:
+        return end - start if start is not None and end is not None else None
+
+    def _write(self, trace: UtteranceTrace) -> None:
+        if not self._trace_file:
+            return
+        # The record is serialized right away, the trace may still be read and changed in the loop.
+        line = json.dumps(asdict(trace), ensure_ascii=False) + '\n'
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:  # Outside of an event loop, nothing waits for the disk
+            self._append(line)
+            return
+
+        self._unwritten.append(line)
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_unwritten())
+
+    async def _write_unwritten(self) -> None:
+        """Appends the waiting lines in a worker thread; a single writer keeps the records in order."""
+        while self._unwritten:
+            lines = ''.join(self._unwritten)
+            self._unwritten.clear()
+            await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        trace_file = self._trace_file
+        if not trace_file:
+            return
+        try:
+            with open(trace_file, 'a', encoding='utf-8') as f:
+                f.write(lines)
+        except OSError as e:
+            LOGGER.warning(f'Could not write utterance trace to {trace_file}: {e}')
+            self._trace_file = None
+
+    @staticmethod
+    def _to_wall_clock(perf_counter_time: Optional[float]) -> Optional[float]:
+        if perf_counter_time is None:
+            return None
+        return time.time() - (time.perf_counter() - perf_counter_time)
@@ -8,6 +8,7 @@ from translation import SoundInput, SoundOutput, Translator
 
 class SoundOutputStub(SoundOutput):
     def __init__(self):
+        super().__init__()
         self.play_called = False
         self.played_bytes = None
         self.stop_called = False
@@ -31,6 +32,19 @@ class SoundInputStub(SoundInput):
         self.stop_called = True
 
 
+class ChunkSoundInputStub(SoundInput):
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.stop_called = False
+
+    async def get_audio_stream(self, shutdown_event):
+        for chunk in self.chunks:
+            yield chunk
+
+    def stop_audio_stream(self):
+        self.stop_called = True
+
+
 class TranslatorStub(Translator):
     def __init__(self):
         self.start_translation_called = False
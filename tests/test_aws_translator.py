@@ -3,7 +3,7 @@ import contextlib
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from amazon_transcribe.model import Alternative, Result, Transcript, TranscriptEvent
+from amazon_transcribe.model import Alternative, Item, Result, Transcript, TranscriptEvent
 
 from config.model.config_models import (
     AWSSettings,
@@ -11,9 +11,17 @@ from config.model.config_models import (
     LanguageSettings,
     MumbleSettings,
     OutputSettings,
+    QueueSettings,
     SpeakerSettings,
 )
-from translators.aws_translator import AWSTranslator
+from translators.aws_translator import (
+    AWSTranslator,
+    PartialResultSpeculator,
+    SpeculationStats,
+    TranscriptEventHandler,
+)
+from translators.client_pool import CLIENT_POOL
+from translators.speech_cache import SpeechCache
 
 from .stubs import SoundOutputStub
 
@@ -37,9 +45,20 @@ class TestAWSTranslator(unittest.IsolatedAsyncioTestCase):
             mumble_settings=MumbleSettings(ip_address='localhost', port=64738, language_channel_mapping={}),
         )
 
+        CLIENT_POOL.clear()
+        self.addCleanup(CLIENT_POOL.clear)
         with patch('boto3.client'), patch('translators.aws_translator.TranscribeStreamingClient'):
             self.translator = AWSTranslator(self.aws_settings, self.input_settings, self.output_settings)
 
+    def test_restarted_translator_reuses_pooled_clients(self):
+        with patch('boto3.client') as boto_client, patch('translators.aws_translator.TranscribeStreamingClient'):
+            restarted = AWSTranslator(self.aws_settings, self.input_settings, self.output_settings)
+
+        boto_client.assert_not_called()
+        self.assertIs(restarted._polly, self.translator._polly)
+        self.assertIs(restarted._translate, self.translator._translate)
+        self.assertIs(restarted._transcribe_client, self.translator._transcribe_client)
+
     async def test_start_translation_logic(self):
         # Arrange
         self.translator._translate.translate_text = MagicMock(return_value={'TranslatedText': 'Hello'})
@@ -63,6 +82,44 @@ class TestAWSTranslator(unittest.IsolatedAsyncioTestCase):
         mock_stream.input_stream.send_audio_event.assert_called_with(audio_chunk=b'dummy_audio_chunk')
         self.assertTrue(sound_output_stub.play_called)
 
+    def test_worker_limit_grows_with_target_languages(self):
+        self.aws_settings.target_languages = {
+            language: LanguageSettings(voice_id='Justin', show_transcript=False)
+            for language in ('en-US', 'fr-FR', 'es-ES', 'it-IT')
+        }
+        with patch('boto3.client'), patch('translators.aws_translator.TranscribeStreamingClient'):
+            translator = AWSTranslator(
+                self.aws_settings, self.input_settings, self.output_settings, queue_settings=QueueSettings()
+            )
+
+        self.assertEqual(self.translator._executor.max_workers, 4)
+        self.assertEqual(translator._executor.max_workers, 12)
+
+    async def test_prewarm_primes_translate_and_polly_for_each_target_language(self):
+        self.translator._aws_settings.prewarm_connections = True
+        self.translator._translate.translate_text = MagicMock(return_value={'TranslatedText': 'OK'})
+        self.translator._polly.describe_voices = MagicMock(return_value={'Voices': [{'Id': 'Justin'}]})
+
+        mock_stream = MagicMock()
+        mock_stream.input_stream.send_audio_event = AsyncMock()
+        mock_stream.input_stream.end_stream = AsyncMock()
+        mock_stream.output_stream = self._dummy_output_stream()
+        self.translator._transcribe_client.start_stream_transcription = AsyncMock(return_value=mock_stream)
+
+        shutdown_event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.05, shutdown_event.set)
+
+        await self.translator.start_translation({'en-US': SoundOutputStub()}, self._mock_mic_stream(), shutdown_event)
+
+        self.translator._translate.translate_text.assert_any_call(
+            Text='OK', SourceLanguageCode='de-DE', TargetLanguageCode='en-US'
+        )
+        self.translator._polly.describe_voices.assert_called_once_with(
+            LanguageCode='en-US', IncludeAdditionalLanguageCodes=True
+        )
+        self.assertEqual(self.translator.warmup_stats.languages, 1)
+        self.assertEqual(self.translator.warmup_stats.failures, 0)
+
     async def test_polly_engine_parameter(self):
         # Arrange
         self.translator._translate.translate_text = MagicMock(return_value={'TranslatedText': 'Hello'})
@@ -95,6 +152,40 @@ class TestAWSTranslator(unittest.IsolatedAsyncioTestCase):
             OutputFormat='pcm',
         )
 
+    async def test_polly_tts_streams_audio_body_to_output(self):
+        audio_body = MagicMock()
+        audio_body.iter_chunks.return_value = iter([b'\x01\x02', b'\x03\x04'])
+        self.translator._polly.synthesize_speech = MagicMock(return_value={'AudioStream': audio_body})
+
+        sound_output_stub = SoundOutputStub()
+        self.translator._language_to_output = {'en-US': sound_output_stub}
+
+        speech = await self.translator._aws_polly_tts('Hello', 'en-US')
+
+        await self.translator._play_speech(speech, 'en-US')
+
+        audio_body.iter_chunks.assert_called_once_with(1024)
+        audio_body.close.assert_called_once()
+        self.assertEqual(sound_output_stub.played_bytes.read(), b'\x01\x02\x03\x04')
+
+    async def test_polly_tts_plays_repeated_sentence_from_speech_cache(self):
+        audio_body = MagicMock()
+        audio_body.iter_chunks.return_value = iter([b'\x01\x02', b'\x03\x04'])
+        self.translator._polly.synthesize_speech = MagicMock(return_value={'AudioStream': audio_body})
+        self.translator._speech_cache = SpeechCache(max_memory_bytes=1024)
+
+        first_output, second_output = SoundOutputStub(), SoundOutputStub()
+        self.translator._language_to_output = {'en-US': first_output}
+        speech = await self.translator._aws_polly_tts('Thank you', 'en-US')
+        await self.translator._play_speech(speech, 'en-US')
+        self.translator._language_to_output = {'en-US': second_output}
+        speech = await self.translator._aws_polly_tts('Thank you', 'en-US')
+        await self.translator._play_speech(speech, 'en-US')
+
+        self.translator._polly.synthesize_speech.assert_called_once()
+        self.assertEqual(second_output.played_bytes.read(), b'\x01\x02\x03\x04')
+        self.assertEqual(self.translator._speech_cache.hits, 1)
+
     @staticmethod
     def _create_mock_event(transcript='Test'):
         event = MagicMock(spec=TranscriptEvent)
@@ -112,3 +203,120 @@ class TestAWSTranslator(unittest.IsolatedAsyncioTestCase):
     async def _mock_mic_stream(self):
         yield b'dummy_audio_chunk'
         await asyncio.sleep(0.1)
+
+
+def _items(text, stable_count=None):
+    """Builds Transcribe items for a text like 'Hello world , how are you ?'."""
+    tokens = text.split()
+    stable_count = len(tokens) if stable_count is None else stable_count
+    return [
+        Item(
+            content=token,
+            item_type='punctuation' if token in '.,?!;:' else 'pronunciation',
+            stable=index < stable_count,
+        )
+        for index, token in enumerate(tokens)
+    ]
+
+
+def _result(text, is_partial, result_id='r1', stable_count=None, channel_id='ch_0'):
+    items = _items(text, stable_count)
+    transcript = PartialResultSpeculator._join_items(items)
+    return Result(
+        result_id=result_id,
+        is_partial=is_partial,
+        channel_id=channel_id,
+        alternatives=[Alternative(transcript=transcript, items=items, entities=None)],
+    )
+
+
+class TestPartialResultSpeculator(unittest.TestCase):
+    def setUp(self):
+        self.stats = SpeculationStats()
+        self.speculator = PartialResultSpeculator(self.stats)
+
+    def test_dispatches_stable_clause_once(self):
+        partial = _result('Guten Morgen liebe Gäste , heute sprechen', True, stable_count=5)
+
+        self.assertEqual(self.speculator.next_segment(partial), 'Guten Morgen liebe Gäste,')
+        self.assertIsNone(self.speculator.next_segment(partial))
+        self.assertEqual(self.stats.dispatched, 1)
+
+    def test_ignores_unstable_and_short_clauses(self):
+        self.assertIsNone(self.speculator.next_segment(_result('Guten Morgen liebe Gäste ,', True, stable_count=3)))
+        self.assertIsNone(self.speculator.next_segment(_result('Ja , gut', True)))
+        self.assertEqual(self.stats.dispatched, 0)
+
+    def test_final_suffix_reuses_confirmed_segments(self):
+        self.speculator.next_segment(_result('Guten Morgen liebe Gäste , heute', True, stable_count=5))
+
+        suffix = self.speculator.final_suffix(_result('Guten Morgen liebe Gäste , heute sprechen wir .', False))
+
+        self.assertEqual(suffix, 'heute sprechen wir.')
+        self.assertEqual(self.stats.reused, 1)
+        self.assertEqual(self.stats.wasted, 0)
+        self.assertEqual(self.stats.final_suffixes, 1)
+
+    def test_final_suffix_counts_diverged_segments_as_wasted(self):
+        self.speculator.next_segment(_result('Guten Morgen liebe Gäste , heute', True, stable_count=5))
+
+        suffix = self.speculator.final_suffix(_result('Guten Abend liebe Gäste , heute sprechen wir .', False))
+
+        self.assertEqual(suffix, 'Guten Abend liebe Gäste, heute sprechen wir.')
+        self.assertEqual(self.stats.reused, 0)
+        self.assertEqual(self.stats.wasted, 1)
+
+    def test_final_without_speculation_returns_full_transcript(self):
+        self.assertEqual(self.speculator.final_suffix(_result('Hallo Welt .', False)), 'Hallo Welt.')
+
+
+class TestTranscriptEventHandlerSpeculation(unittest.IsolatedAsyncioTestCase):
+    async def test_translates_stable_prefix_then_only_the_final_suffix(self):
+        aws_settings = AWSSettings(
+            region='eu-central-1',
+            source_language='de-DE',
+            show_source_transcript=True,
+            target_languages={'en-US': LanguageSettings(voice_id='Justin', show_transcript=True)},
+            speculative_translation=True,
+        )
+        handler = TranscriptEventHandler(MagicMock(), AsyncMock(), aws_settings, MagicMock(), MagicMock())
+        handler._translate_and_tts = AsyncMock()
+
+        for result in (
+            _result('Guten Morgen liebe Gäste', True, stable_count=2),
+            _result('Guten Morgen liebe Gäste , heute', True, stable_count=5),
+            _result('Guten Morgen liebe Gäste , heute sprechen wir .', False),
+        ):
+            event = MagicMock(spec=TranscriptEvent)
+            event.transcript = Transcript(results=[result])
+            await handler.handle_transcript_event(event)
+        await asyncio.sleep(0.01)  # Let the language queue process the sentences
+        await handler.stop()
+
+        translated = [call.args for call in handler._translate_and_tts.await_args_list]
+        self.assertEqual(
+            translated,
+            [('Guten Morgen liebe Gäste,', 'en-US'), ('heute sprechen wir.', 'en-US')],
+        )
+
+    async def test_translates_other_channels_only_with_channel_identification(self):
+        aws_settings = AWSSettings(
+            region='eu-central-1',
+            source_language='de-DE',
+            show_source_transcript=True,
+            target_languages={'en-US': LanguageSettings(voice_id='Justin', show_transcript=True)},
+        )
+        event = MagicMock(spec=TranscriptEvent)
+        event.transcript = Transcript(results=[_result('Hallo Welt .', False, channel_id='ch_1')])
+
+        for all_channels, expected in ((False, []), (True, [('Hallo Welt.', 'en-US')])):
+            handler = TranscriptEventHandler(
+                MagicMock(), AsyncMock(), aws_settings, MagicMock(), MagicMock(), all_channels=all_channels
+            )
+            handler._translate_and_tts = AsyncMock()
+
+            await handler.handle_transcript_event(event)
+            await asyncio.sleep(0.01)
+            await handler.stop()
+
+            self.assertEqual([call.args for call in handler._translate_and_tts.await_args_list], expected)
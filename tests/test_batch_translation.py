@@ -0,0 +1,93 @@
+import asyncio
+import tempfile
+import unittest
+import wave
+from dataclasses import asdict
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from config.model.config_models import InputSettings, QueueSettings
+from controllers.batch_translation import batch_queue_settings, translate_recording
+from sound_inputs.file_input import FileInput
+from translation import Translation, Translator
+from translators.speech_scheduler import LanguageQueueStats, SpeechScheduler
+
+
+class RecordingTranslatorStub(Translator):
+    """Turns every received chunk into a sentence that stays in flight for a short while."""
+
+    def __init__(self):
+        self.stats = LanguageQueueStats()
+        self.chunks = 0
+
+    async def start_translation(self, language_to_output, mic_stream, shutdown_event):
+        async for _chunk in mic_stream:
+            self.chunks += 1
+            self.stats.in_flight += 1
+            asyncio.get_running_loop().call_later(0.05, self._played)
+
+    def _played(self):
+        self.stats.in_flight -= 1
+        self.stats.processed += 1
+
+    def metrics(self):
+        return {'queues': {'en-US': asdict(self.stats)}}
+
+
+class TestTranslateRecording(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        path = str(Path(self.temp_dir.name) / 'talk.wav')
+        with wave.open(path, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(b'\x01\x00' * 4000)
+        input_settings = InputSettings(None, None, 8000, 1, stt_chunk_ms=100)
+        self.sound_input = FileInput(path, input_settings, speed=0, hold_open=True)
+
+    async def test_stops_once_every_sentence_has_ended(self):
+        translator = RecordingTranslatorStub()
+        translation = Translation(translator, self.sound_input, {})
+
+        await asyncio.wait_for(translate_recording(translation, self.sound_input, settle_seconds=0.2), 5.0)
+
+        self.assertEqual(translator.chunks, 5)
+        self.assertEqual(translator.stats.processed, 5)
+        self.assertEqual(translator.stats.in_flight, 0)
+
+    async def test_gives_up_waiting_after_timeout(self):
+        translator = RecordingTranslatorStub()
+        translator.stats.queue_depth = 1  # Never drains
+        translation = Translation(translator, self.sound_input, {})
+
+        with self.assertLogs('controllers.batch_translation', 'WARNING'):
+            await asyncio.wait_for(
+                translate_recording(translation, self.sound_input, settle_seconds=0.1, timeout=0.3), 5.0
+            )
+
+
+class TestBatchQueueSettings(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    async def _all_processed(scheduler: SpeechScheduler, count: int) -> None:
+        while any(stats.processed + stats.dropped < count for stats in scheduler.stats.values()):
+            await asyncio.sleep(0.01)
+
+    async def test_fast_replay_drops_no_sentence(self):
+        settings = batch_queue_settings(QueueSettings(max_queue_size=4, overflow_policy='skip_lagging'))
+        scheduler = SpeechScheduler(['en-US', 'fr-FR'], AsyncMock(), settings)
+
+        for index in range(50):  # Transcripts of a replay arrive far faster than TTS drains them
+            scheduler.submit(f'Satz {index}.')
+        scheduler.start()
+        await asyncio.wait_for(self._all_processed(scheduler, 50), 5.0)
+        await scheduler.stop()
+
+        for stats in scheduler.stats.values():
+            self.assertEqual(stats.dropped + stats.skipped + stats.merged, 0)
+            self.assertEqual(stats.processed, 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
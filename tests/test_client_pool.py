@@ -0,0 +1,48 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from translators.client_pool import ClientPool
+
+
+class TestClientPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = ClientPool()
+
+    def test_reuses_client_for_the_same_key(self):
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = self.pool.get(('aws', 'polly', 'eu-central-1'), factory)
+        second = self.pool.get(('aws', 'polly', 'eu-central-1'), factory)
+
+        self.assertIs(first, second)
+        factory.assert_called_once()
+        self.assertEqual(self.pool.stats.created, 1)
+        self.assertEqual(self.pool.stats.reused, 1)
+
+    def test_creates_separate_clients_per_region(self):
+        first = self.pool.get(('aws', 'polly', 'eu-central-1'), object)
+        second = self.pool.get(('aws', 'polly', 'us-east-1'), object)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.pool.stats.created, 2)
+
+    def test_loop_bound_clients_are_dropped_with_their_loop(self):
+        loop = asyncio.new_event_loop()
+        first = self.pool.get(('google', 'translate'), object, loop)
+        self.assertIs(self.pool.get(('google', 'translate'), object, loop), first)
+
+        loop.close()
+        other_loop = asyncio.new_event_loop()
+        self.addCleanup(other_loop.close)
+
+        self.assertIsNot(self.pool.get(('google', 'translate'), object, other_loop), first)
+        self.assertEqual(self.pool.stats.created, 2)
+
+    def test_clear_drops_clients_and_stats(self):
+        first = self.pool.get('key', object)
+
+        self.pool.clear()
+
+        self.assertIsNot(self.pool.get('key', object), first)
+        self.assertEqual(self.pool.stats.reused, 0)
@@ -6,6 +6,7 @@ from unittest.mock import mock_open, patch
 from config.config_manager import ConfigManager
 from config.model.config_models import (
     AWSSettings,
+    CacheSettings,
     InputSettings,
     OutputSettings,
     TranslatorSettings,
@@ -86,3 +87,75 @@ class TestConfigManager(unittest.TestCase):
 
         self.assertIsInstance(config.translator_settings.aws_settings, AWSSettings)
         self.assertEqual(config.translator_settings.google_settings.endpointing_sensitivity, 'short')
+
+    def test_parse_aws_speculative_translation_settings(self):
+        aws_settings = ConfigManager._parse_aws_settings(
+            {'speculative_translation': True, 'partial_results_stability': 'unknown'}
+        )
+
+        self.assertTrue(aws_settings.speculative_translation)
+        self.assertEqual(aws_settings.partial_results_stability, 'high')
+        self.assertFalse(ConfigManager._parse_aws_settings({}).speculative_translation)
+        self.assertFalse(ConfigManager._parse_aws_settings({}).prewarm_connections)
+        self.assertTrue(ConfigManager._parse_google_settings({'prewarm_connections': True}).prewarm_connections)
+
+    def test_parse_cache_settings(self):
+        raw = {
+            'translator_settings': {'cache_settings': {'translation_cache_size': 50, 'persist_translation_cache': True}}
+        }
+
+        cache_settings = ConfigManager.create_user_config(raw).translator_settings.cache_settings
+
+        self.assertEqual(cache_settings.translation_cache_size, 50)
+        self.assertTrue(cache_settings.persist_translation_cache)
+        self.assertEqual(cache_settings.translation_cache_ttl, CacheSettings().translation_cache_ttl)
+
+    def test_parse_vad_settings_keeps_keepalive_below_stt_timeouts(self):
+        vad_settings = ConfigManager._parse_vad_settings({'enabled': True, 'keepalive_seconds': 30})
+
+        self.assertTrue(vad_settings.enabled)
+        self.assertEqual(vad_settings.keepalive_seconds, 8.0)
+
+    def test_parse_additional_sessions_skips_incomplete_entries(self):
+        sessions = ConfigManager._parse_additional_sessions(
+            [
+                {
+                    'session_id': 'english',
+                    'source_language': 'en-US',
+                    'target_languages': ['fr-FR'],
+                    'input_device_index': 2,
+                },
+                {'session_id': 'french'},
+            ]
+        )
+
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(sessions[0].session_id, 'english')
+        self.assertEqual(sessions[0].target_languages, ['fr-FR'])
+        self.assertEqual(sessions[0].input_device_index, 2)
+
+    def test_parse_mirror_channel_mapping_accepts_a_single_channel(self):
+        raw = {'mumble_settings': {'mirror_channel_mapping': {'de': 'Main/German-2', 'en': ['Lobby', 'Hall']}}}
+
+        mumble_settings = ConfigManager._parse_output_settings(raw).mumble_settings
+
+        self.assertEqual(mumble_settings.mirror_channel_mapping, {'de': ['Main/German-2'], 'en': ['Lobby', 'Hall']})
+
+    def test_parse_monitoring_settings_treats_empty_trace_file_as_disabled(self):
+        self.assertIsNone(ConfigManager._parse_monitoring_settings({'trace_file': ''}).trace_file)
+        self.assertEqual(ConfigManager._parse_monitoring_settings({'trace_file': 't.jsonl'}).trace_file, 't.jsonl')
+
+    def test_parse_monitoring_settings_disables_invalid_metrics_port(self):
+        self.assertEqual(ConfigManager._parse_monitoring_settings({'metrics_port': 9464}).metrics_port, 9464)
+        self.assertEqual(ConfigManager._parse_monitoring_settings({'metrics_port': 70000}).metrics_port, 0)
+        self.assertEqual(ConfigManager._parse_monitoring_settings({'metrics_port': '9464'}).metrics_port, 0)
+
+    def test_parse_queue_settings_falls_back_to_default_policy(self):
+        queue_settings = ConfigManager._parse_queue_settings(
+            {'overflow_policy': 'unknown', 'max_queue_size': 0, 'pipeline_depth': 0, 'coalesce_window_seconds': -1}
+        )
+
+        self.assertEqual(queue_settings.overflow_policy, 'drop_oldest')
+        self.assertEqual(queue_settings.max_queue_size, 1)
+        self.assertEqual(queue_settings.pipeline_depth, 1)
+        self.assertEqual(queue_settings.coalesce_window_seconds, 0.0)
@@ -0,0 +1,39 @@
+import threading
+import unittest
+
+from utils.demand_sized_executor import DemandSizedExecutor
+
+
+class TestDemandSizedExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = DemandSizedExecutor(2, thread_name_prefix='TestWorker')
+        self.addCleanup(self.executor.shutdown)
+
+    def test_counts_in_flight_and_queued_calls(self):
+        release = threading.Event()
+        futures = [self.executor.submit(release.wait, 5) for _ in range(3)]
+
+        self.assertEqual(self.executor.stats.in_flight, 3)
+        self.assertEqual(self.executor.stats.queued, 1)
+
+        release.set()
+        for future in futures:
+            future.result(5)
+
+        self.assertEqual(self.executor.stats.in_flight, 0)
+        self.assertEqual(self.executor.stats.peak_in_flight, 3)
+
+    def test_starts_workers_only_on_demand(self):
+        for _ in range(5):
+            self.executor.submit(sum, [1, 2]).result(5)
+
+        self.assertEqual(self.executor.stats.peak_in_flight, 1)
+        self.assertEqual(self.executor.stats.queued, 0)
+
+    def test_submit_after_shutdown_leaves_no_call_in_flight(self):
+        self.executor.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            self.executor.submit(sum, [1])
+
+        self.assertEqual(self.executor.stats.in_flight, 0)
@@ -0,0 +1,100 @@
+import asyncio
+import io
+import tempfile
+import time
+import unittest
+import wave
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from config.model.config_models import InputSettings
+from sound_inputs.file_input import FileInput
+
+
+class TestFileInput(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = str(Path(self.temp_dir.name) / 'talk.wav')
+        with wave.open(self.path, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(b'\x01\x00' * 2000)  # 250 ms
+        self.input_settings = InputSettings(None, None, 16000, 1, stt_chunk_ms=100)
+
+    async def _read_all(self, sound_input):
+        return [chunk async for chunk in sound_input.get_audio_stream(asyncio.Event())]
+
+    async def test_streams_chunks_of_stt_chunk_ms_and_trailing_silence(self):
+        sound_input = FileInput(self.path, self.input_settings, speed=0, trailing_silence_seconds=0.2)
+
+        chunks = await self._read_all(sound_input)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [1600, 1600, 800, 1600, 1600])
+        self.assertEqual(chunks[-1], b'\x00' * 1600)
+        self.assertEqual((sound_input.sample_rate, sound_input.channels), (8000, 1))
+        self.assertAlmostEqual(sound_input.duration_seconds, 0.25)
+        self.assertTrue(sound_input.finished.is_set())
+        self.assertEqual(sound_input.metrics(), {'sent_bytes': 7200})
+
+    async def test_paces_replay_by_speed(self):
+        sound_input = FileInput(self.path, self.input_settings, speed=2.5)
+
+        started_at = time.perf_counter()
+        await self._read_all(sound_input)
+
+        self.assertGreaterEqual(time.perf_counter() - started_at, 0.09)
+
+    async def test_hold_open_keeps_stream_open_until_shutdown(self):
+        sound_input = FileInput(self.path, self.input_settings, speed=0, hold_open=True)
+        shutdown_event = asyncio.Event()
+        chunks = []
+
+        async def read():
+            async for chunk in sound_input.get_audio_stream(shutdown_event):
+                chunks.append(chunk)
+
+        task = asyncio.create_task(read())
+        await asyncio.wait_for(sound_input.finished.wait(), 1.0)
+        self.assertFalse(task.done())
+
+        shutdown_event.set()
+        await asyncio.wait_for(task, 1.0)
+        self.assertEqual(len(chunks), 3)
+
+    async def test_streams_raw_pcm_with_configured_format(self):
+        raw_path = str(Path(self.temp_dir.name) / 'talk.pcm')
+        Path(raw_path).write_bytes(b'\x01\x00' * 4000)  # 250 ms at 16 kHz
+        sound_input = FileInput(raw_path, self.input_settings, speed=0)
+
+        chunks = await self._read_all(sound_input)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3200, 3200, 1600])
+        self.assertEqual((sound_input.sample_rate, sound_input.channels), (16000, 1))
+        self.assertAlmostEqual(sound_input.duration_seconds, 0.25)
+
+    async def test_streams_raw_pcm_from_stdin(self):
+        stdin = MagicMock()
+        stdin.buffer = io.BytesIO(b'\x01\x00' * 3201)
+        sound_input = FileInput('-', self.input_settings, speed=0)
+
+        with patch('sys.stdin', stdin):
+            chunks = await self._read_all(sound_input)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3200, 3200, 2])
+        self.assertIsNone(sound_input.duration_seconds)
+
+    def test_rejects_non_16_bit_files(self):
+        with wave.open(self.path, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(1)
+            wav.setframerate(8000)
+            wav.writeframes(b'\x80' * 100)
+
+        with self.assertRaises(ValueError):
+            FileInput(self.path, self.input_settings)
+
+
+if __name__ == '__main__':
+    unittest.main()
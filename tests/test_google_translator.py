@@ -16,6 +16,8 @@ from config.model.config_models import (
     SpeakerSettings,
 )
 from translators.google_translator import GoogleTranslator
+from translators.speech_cache import SpeechCache
+from translators.translation_cache import TranslationCache
 
 EndpointingSensitivity = cloud_speech.StreamingRecognitionFeatures.EndpointingSensitivity
 
@@ -109,13 +111,16 @@ class TestGoogleTranslator(unittest.IsolatedAsyncioTestCase):
         translator._speech_client = FakeSpeechClient()
         translator._project_id = 'demo-project'
         translator._translation_callbacks = MagicMock()
-        translator._translate_and_tts = AsyncMock(side_effect=lambda _t, _l: shutdown_event.set())
+        translator._translation_callbacks.update_source_field.side_effect = lambda _t: shutdown_event.set()
+        translator._translate_and_tts = AsyncMock(return_value=None)
 
         async def mic_stream():
             yield b'audio'
             await shutdown_event.wait()
 
         await translator._run_streaming_recognition(mic_stream(), shutdown_event)
+        await asyncio.sleep(0.01)
+        await translator._scheduler.stop()
 
         streaming_config = captured['first_request'].streaming_config
         self.assertEqual(captured['first_request'].recognizer, 'projects/demo-project/locations/eu/recognizers/_')
@@ -159,6 +164,48 @@ class TestGoogleTranslator(unittest.IsolatedAsyncioTestCase):
 
         translator._translate_and_tts.assert_not_awaited()
 
+    async def test_run_streaming_recognition_translates_interim_clauses_early(self):
+        self.google_settings.interim_results = True
+        shutdown_event = asyncio.Event()
+        captured = {}
+
+        def interim(transcript):
+            result = SimpleNamespace(alternatives=[SimpleNamespace(transcript=transcript)], is_final=False, stability=0)
+            return SimpleNamespace(results=[result])
+
+        class FakeSpeechClient:
+            async def streaming_recognize(self, requests):
+                captured['first_request'] = await anext(requests)
+
+                async def response_iter():
+                    yield interim('Guten Morgen liebe Gäste, heute')
+                    yield interim('Guten Morgen liebe Gäste, heute sprechen')
+                    final = SimpleNamespace(
+                        alternatives=[SimpleNamespace(transcript='Guten Morgen liebe Gäste, heute sprechen wir.')],
+                        is_final=True,
+                    )
+                    yield SimpleNamespace(results=[final])
+                    shutdown_event.set()
+
+                return response_iter()
+
+        translator = self._build_translator()
+        translator._speech_client = FakeSpeechClient()
+        translator._project_id = 'demo-project'
+        translator._translate_and_tts = AsyncMock()
+
+        async def mic_stream():
+            yield b'audio'
+            await shutdown_event.wait()
+
+        await translator._run_streaming_recognition(mic_stream(), shutdown_event)
+        await asyncio.sleep(0)
+
+        self.assertTrue(captured['first_request'].streaming_config.streaming_features.interim_results)
+        translated = [call.args for call in translator._translate_and_tts.await_args_list]
+        self.assertEqual(translated, [('Guten Morgen liebe Gäste,', 'en-US'), ('heute sprechen wir.', 'en-US')])
+        self.assertEqual(translator.speculation_stats.reused, 1)
+
     async def test_run_streaming_recognition_returns_early_without_project_id(self):
         translator = self._build_translator()
         translator._speech_client = MagicMock()
@@ -200,6 +247,24 @@ class TestGoogleTranslator(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(kwargs['target_language_code'], 'en')
         translator._google_tts.assert_awaited_once_with('Hello world', 'en-US')
 
+    async def test_translate_and_tts_answers_repeated_phrases_from_cache(self):
+        translator = self._build_translator()
+        translator._translation_cache = TranslationCache(max_entries=10, ttl_seconds=60)
+
+        translator._project_id = 'demo-project'
+        translator._google_tts = AsyncMock()
+        translator._translate_client = MagicMock()
+        translator._translate_client.translate_text = AsyncMock(
+            return_value=SimpleNamespace(translations=[SimpleNamespace(translated_text='Thank you')])
+        )
+
+        await translator._translate_and_tts('Danke', 'en-US')
+        await translator._translate_and_tts('Danke', 'en-US')
+
+        translator._translate_client.translate_text.assert_awaited_once()
+        self.assertEqual(translator._google_tts.await_count, 2)
+        self.assertEqual(translator._translation_cache.hits, 1)
+
     async def test_translate_and_tts_skips_tts_when_translation_is_empty(self):
         translator = self._build_translator()
 
@@ -246,12 +311,83 @@ class TestGoogleTranslator(unittest.IsolatedAsyncioTestCase):
         sound_output = AsyncMock()
         translator._language_to_output = {'en-US': sound_output}
 
-        await translator._google_tts('Hello world', 'en-US')
+        speech = await translator._google_tts('Hello world', 'en-US')
+
+        await translator._play_speech(speech, 'en-US')
 
         sound_output.play.assert_awaited_once()
         played_stream = sound_output.play.await_args.args[0]
         self.assertEqual(played_stream.read(), raw_pcm)
 
+    async def test_google_tts_streams_chirp3_hd_audio_chunks(self):
+        translator = self._build_translator()
+        translator._google_settings.target_languages['en-US'].voice_id = 'en-US-Chirp3-HD-Kore'
+        captured = {}
+
+        async def streaming_synthesize(requests):
+            captured['requests'] = [request async for request in requests]
+
+            async def response_iter():
+                yield SimpleNamespace(audio_content=b'\x01\x02')
+                yield SimpleNamespace(audio_content=b'\x03\x04')
+
+            return response_iter()
+
+        translator._tts_client = MagicMock()
+        translator._tts_client.streaming_synthesize = streaming_synthesize
+        translator._tts_client.synthesize_speech = AsyncMock()
+
+        sound_output = AsyncMock()
+        translator._language_to_output = {'en-US': sound_output}
+
+        speech = await translator._google_tts('Hello world', 'en-US')
+
+        await translator._play_speech(speech, 'en-US')
+
+        translator._tts_client.synthesize_speech.assert_not_awaited()
+        config_request, input_request = captured['requests']
+        self.assertEqual(config_request.streaming_config.voice.name, 'en-US-Chirp3-HD-Kore')
+        self.assertEqual(config_request.streaming_config.streaming_audio_config.sample_rate_hertz, 16000)
+        self.assertEqual(input_request.input.text, 'Hello world')
+        played_stream = sound_output.play.await_args.args[0]
+        self.assertEqual(played_stream.read(), b'\x01\x02\x03\x04')
+
+    async def test_google_tts_plays_repeated_sentence_from_speech_cache(self):
+        translator = self._build_translator()
+        translator._speech_cache = SpeechCache(max_memory_bytes=1024)
+        translator._tts_client = MagicMock()
+        translator._tts_client.synthesize_speech = AsyncMock(return_value=SimpleNamespace(audio_content=b'\x01\x02'))
+
+        sound_output = AsyncMock()
+        translator._language_to_output = {'en-US': sound_output}
+
+        speech = await translator._google_tts('Thank you', 'en-US')
+
+        await translator._play_speech(speech, 'en-US')
+        speech = await translator._google_tts('Thank you', 'en-US')
+        await translator._play_speech(speech, 'en-US')
+
+        translator._tts_client.synthesize_speech.assert_awaited_once()
+        played_stream = sound_output.play.await_args.args[0]
+        self.assertEqual(played_stream.read(), b'\x01\x02')
+
+    def test_strip_wav_header_skips_extra_chunks(self):
+        raw_pcm = b'\x01\x02\x03\x04'
+        wav = (
+            b'RIFF'
+            + (4 + 10 + 8 + len(raw_pcm) + 8).to_bytes(4, 'little')
+            + b'WAVE'
+            + b'LIST'
+            + (2).to_bytes(4, 'little')
+            + b'xx'
+            + b'data'
+            + len(raw_pcm).to_bytes(4, 'little')
+            + raw_pcm
+        )
+
+        self.assertEqual(bytes(GoogleTranslator._strip_wav_header(wav)), raw_pcm)
+        self.assertEqual(bytes(GoogleTranslator._strip_wav_header(raw_pcm)), raw_pcm)
+
     # -- start_translation -------------------------------------------------------------------
 
     async def test_start_translation_initializes_and_tears_down_clients(self):
@@ -273,3 +409,21 @@ class TestGoogleTranslator(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(translator._speech_client)
         self.assertIsNone(translator._translate_client)
         self.assertIsNone(translator._tts_client)
+
+    async def test_restart_on_the_same_loop_reuses_pooled_clients(self):
+        shutdown_event = asyncio.Event()
+        shutdown_event.set()
+
+        async def mic_stream():
+            return
+            yield  # pragma: no cover - makes this an async generator
+
+        with (
+            patch('translators.google_translator.speech.SpeechAsyncClient', return_value=MagicMock()) as speech_client,
+            patch('translators.google_translator.translate.TranslationServiceAsyncClient', return_value=MagicMock()),
+            patch('translators.google_translator.texttospeech.TextToSpeechAsyncClient', return_value=AsyncMock()),
+        ):
+            await self._build_translator().start_translation({}, mic_stream(), shutdown_event)
+            await self._build_translator().start_translation({}, mic_stream(), shutdown_event)
+
+        speech_client.assert_called_once()
@@ -0,0 +1,77 @@
+import unittest
+from dataclasses import asdict
+from unittest.mock import MagicMock
+
+from controllers.metrics_exporter import render_metrics
+from translators.speech_scheduler import LanguageQueueStats
+from utils.metrics_server import Histogram
+
+
+class TestRenderMetrics(unittest.TestCase):
+    def _translation(self):
+        histogram = Histogram()
+        histogram.observe(0.3)
+        translation = MagicMock()
+        translation.call_in_loop.side_effect = lambda function, timeout: function()
+        translation.sound_input.metrics.return_value = {'dropped_chunks': 3}
+        translation.translator.metrics.return_value = {
+            'provider': 'google',
+            'queues': {'en-US': asdict(LanguageQueueStats(queue_depth=2, dropped=1))},
+            'latency_histograms': {'end_to_end': {'en-US': asdict(histogram)}},
+            'caches': {'translation': {'hits': 4, 'misses': 1}},
+            'stt': {'restarts': 5},
+        }
+        return translation
+
+    def test_renders_session_and_output_metrics(self):
+        output = MagicMock()
+        output.metrics.return_value = {'buffered_seconds': 0.5, 'sent_bytes': 960}
+
+        translation_cache = MagicMock(hits=4, misses=1)
+        lines = render_metrics(
+            {'main': self._translation()}, {'en-US': output}, {'google_translation': translation_cache}
+        ).splitlines()
+
+        self.assertIn('live_translation_session_up{session="main"} 1', lines)
+        self.assertIn('live_translation_input_dropped_chunks_total{session="main"} 3', lines)
+        self.assertIn(
+            'live_translation_tts_queue_queue_depth{session="main",provider="google",language="en-US"} 2', lines
+        )
+        self.assertIn(
+            'live_translation_tts_queue_dropped_total{session="main",provider="google",language="en-US"} 1', lines
+        )
+        self.assertIn(
+            'live_translation_end_to_end_latency_seconds_count{session="main",provider="google",language="en-US"} 1',
+            lines,
+        )
+        self.assertIn('live_translation_cache_hits_total{cache="google_translation"} 4', lines)
+        self.assertIn('live_translation_stt_restarts_total{session="main",provider="google"} 5', lines)
+        self.assertIn('live_translation_output_buffered_seconds{language="en-US",output="MagicMock"} 0.5', lines)
+        self.assertIn('live_translation_output_sent_bytes_total{language="en-US",output="MagicMock"} 960', lines)
+
+    def test_shared_cache_is_rendered_once(self):
+        speech_cache = MagicMock(hits=7, misses=2)
+
+        lines = render_metrics(
+            {'main': self._translation(), 'second': self._translation()}, {}, {'speech': speech_cache}
+        ).splitlines()
+
+        self.assertEqual(
+            [line for line in lines if line.startswith('live_translation_cache_hits_total')],
+            ['live_translation_cache_hits_total{cache="speech"} 7'],
+        )
+
+    def test_session_metrics_are_read_in_its_event_loop(self):
+        translation = self._translation()
+
+        render_metrics({'main': translation}, {})
+
+        translation.call_in_loop.assert_called_once()
+        translation.translator.metrics.assert_called_once()
+
+    def test_without_sessions_renders_empty_document(self):
+        self.assertEqual(render_metrics({}, {}), '\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
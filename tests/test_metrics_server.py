@@ -0,0 +1,79 @@
+import unittest
+import urllib.error
+import urllib.request
+
+from utils.metrics_server import Histogram, MetricsServer, PrometheusText
+
+
+class TestHistogram(unittest.TestCase):
+    def test_counts_values_in_their_bucket(self):
+        histogram = Histogram(buckets=(0.5, 1.0))
+        histogram.observe(0.2)
+        histogram.observe(1.0)
+        histogram.observe(3.0)
+
+        self.assertEqual(histogram.counts, [1, 1, 1])
+        self.assertEqual(histogram.count, 3)
+        self.assertAlmostEqual(histogram.total, 4.2)
+
+
+class TestPrometheusText(unittest.TestCase):
+    def test_renders_families_with_help_type_and_labels(self):
+        text = PrometheusText('app_')
+        text.add('queue_depth', 'gauge', 'Waiting sentences.', 2, {'language': 'en-US'})
+        text.add('queue_depth', 'gauge', 'Waiting sentences.', 0, {'language': 'fr-"FR"'})
+
+        self.assertEqual(
+            text.render(),
+            '# HELP app_queue_depth Waiting sentences.\n'
+            '# TYPE app_queue_depth gauge\n'
+            'app_queue_depth{language="en-US"} 2\n'
+            'app_queue_depth{language="fr-\\"FR\\""} 0\n',
+        )
+
+    def test_renders_cumulative_histogram_buckets(self):
+        histogram = Histogram(buckets=(0.5, 1.0))
+        histogram.observe(0.2)
+        histogram.observe(3.0)
+        text = PrometheusText()
+        text.add_histogram('latency_seconds', 'Latency.', histogram, {'stage': 'translate'})
+
+        lines = text.render().splitlines()
+        self.assertIn('latency_seconds_bucket{stage="translate",le="0.5"} 1', lines)
+        self.assertIn('latency_seconds_bucket{stage="translate",le="1.0"} 1', lines)
+        self.assertIn('latency_seconds_bucket{stage="translate",le="+Inf"} 2', lines)
+        self.assertIn('latency_seconds_sum{stage="translate"} 3.2', lines)
+        self.assertIn('latency_seconds_count{stage="translate"} 2', lines)
+
+
+class TestMetricsServer(unittest.TestCase):
+    def test_serves_collected_metrics(self):
+        server = MetricsServer(lambda: 'up 1\n', port=0)
+        server.start()
+        self.addCleanup(server.stop)
+
+        with urllib.request.urlopen(f'http://127.0.0.1:{server.port}/metrics', timeout=5) as response:
+            self.assertEqual(response.read(), b'up 1\n')
+            self.assertTrue(response.headers['Content-Type'].startswith('text/plain'))
+
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            urllib.request.urlopen(f'http://127.0.0.1:{server.port}/other', timeout=5)
+        self.assertEqual(context.exception.code, 404)
+        context.exception.close()
+
+    def test_answers_500_when_collecting_fails(self):
+        def collect():
+            raise RuntimeError('boom')
+
+        server = MetricsServer(collect, port=0)
+        server.start()
+        self.addCleanup(server.stop)
+
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            urllib.request.urlopen(f'http://127.0.0.1:{server.port}/metrics', timeout=5)
+        self.assertEqual(context.exception.code, 500)
+        context.exception.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ import pyaudio
 
 from config.model.config_models import InputSettings
 from sound_inputs.microphone import Microphone
+from utils.pcm_ring_buffer import PcmRingBuffer
 
 
 class TestMicrophone(unittest.IsolatedAsyncioTestCase):
@@ -35,21 +36,19 @@ class TestMicrophone(unittest.IsolatedAsyncioTestCase):
         self.mock_pa_instance.open.return_value = mock_stream
         shutdown_event = asyncio.Event()
 
-        # Simulate some data in the queue
-        await self.microphone._input_queue.put(b'audio_chunk')
-
-        # Start the generator as a task so we can stop it
         generator = self.microphone.get_audio_stream(shutdown_event)
+        next_chunk = asyncio.create_task(generator.__anext__())
+        await asyncio.sleep(0)
 
-        # Consume one item
-        item = await generator.__anext__()
-        self.assertEqual(item, b'audio_chunk')
+        # Simulate two PortAudio buffers arriving before the consumer runs
+        chunk = b'\x01\x00' * 1600
+        self.microphone._callback(chunk)
+        self.microphone._callback(chunk)
 
-        # Shutdown
-        shutdown_event.set()
-        # Put another item to unblock the queue.get() if needed
-        await self.microphone._input_queue.put(b'stop')
+        self.assertEqual(await next_chunk, chunk * 2)
 
+        shutdown_event.set()
+        self.microphone._callback(chunk)
         with self.assertRaises(StopAsyncIteration):
             await generator.__anext__()
 
@@ -96,22 +95,24 @@ class TestMicrophone(unittest.IsolatedAsyncioTestCase):
 
     def test_callback_success(self):
         self.microphone._loop = MagicMock()
-        self.microphone._input_queue = asyncio.Queue(maxsize=1)
 
-        res = self.microphone._callback(b'data')
+        res = self.microphone._callback(b'\x00' * 3200)
 
         self.assertEqual(res, (None, pyaudio.paContinue))
-        self.assertTrue(self.microphone._loop.call_soon_threadsafe.called)
+        self.microphone._loop.call_soon_threadsafe.assert_called_once_with(self.microphone._data_ready.set)
+        self.assertEqual(self.microphone._ring_buffer.available, 3200)
 
-    def test_callback_queue_full(self):
+    def test_callback_counts_overruns_when_buffer_is_full(self):
         self.microphone._loop = MagicMock()
-        self.microphone._input_queue = MagicMock()
-        self.microphone._input_queue.full.return_value = True
+        self.microphone._ring_buffer = PcmRingBuffer(4)
 
-        res = self.microphone._callback(b'data')
+        self.microphone._callback(b'\x00' * 4)
+        res = self.microphone._callback(b'\x00' * 4)
+        self.microphone._callback(b'\x00' * 4)
 
         self.assertEqual(res, (None, pyaudio.paContinue))
-        self.assertFalse(self.microphone._loop.call_soon_threadsafe.called)
+        self.assertEqual(self.microphone.overruns, 2)
+        self.assertEqual(self.microphone._ring_buffer.overrun_bytes, 8)
 
     def test_callback_no_loop(self):
         self.microphone._loop = None
@@ -156,3 +157,4 @@ class TestMicrophone(unittest.IsolatedAsyncioTestCase):
 
     def test_uses_100ms_input_buffer_for_lower_latency(self):
         self.assertEqual(self.microphone._buffer_frames, 1600)
+        self.assertEqual(self.microphone._chunk_bytes, 3200)
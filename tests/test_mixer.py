@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+from array import array
+
+from sound_inputs.mixer import MicrophoneMixer
+
+from .stubs import ChunkSoundInputStub
+
+
+def pcm(*samples):
+    return array('h', samples).tobytes()
+
+
+class TestMicrophoneMixer(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    async def _collect(mixer):
+        return b''.join([chunk async for chunk in mixer.get_audio_stream(asyncio.Event())])
+
+    async def test_mixes_inputs_with_gain_and_clipping(self):
+        first = ChunkSoundInputStub([pcm(1000, 30000, -30000)])
+        second = ChunkSoundInputStub([pcm(500, 30000, -30000)])
+        mixer = MicrophoneMixer([first, second], sample_rate=16000, gains=[1.0, 2.0])
+
+        mixed = await self._collect(mixer)
+
+        self.assertEqual(mixed, pcm(2000, 32767, -32768))
+        self.assertEqual(mixer.clipped_samples, 2)
+        self.assertEqual(mixer.channels, 1)
+
+    async def test_rounds_fractional_gains_and_clips_unity_gains(self):
+        first = ChunkSoundInputStub([pcm(3, 5), pcm(20000, -20000)])
+        second = ChunkSoundInputStub([pcm(0, 0), pcm(20000, -20000)])
+        unity = MicrophoneMixer([first, second], sample_rate=16000)
+        self.assertEqual(await self._collect(unity), pcm(3, 5, 32767, -32768))
+        self.assertEqual(unity.clipped_samples, 2)
+
+        first = ChunkSoundInputStub([pcm(3, 5)])
+        second = ChunkSoundInputStub([pcm(0, 0)])
+        halved = MicrophoneMixer([first, second], sample_rate=16000, gains=[0.5, 1.0])
+        self.assertEqual(await self._collect(halved), pcm(2, 2))
+        self.assertEqual(halved.clipped_samples, 0)
+
+    async def test_aligns_inputs_delivering_different_chunk_sizes(self):
+        first = ChunkSoundInputStub([pcm(1, 2), pcm(3, 4)])
+        second = ChunkSoundInputStub([pcm(10, 20, 30, 40)])
+        mixer = MicrophoneMixer([first, second], sample_rate=16000)
+
+        self.assertEqual(await self._collect(mixer), pcm(11, 22, 33, 44))
+
+    async def test_channel_tagging_interleaves_inputs(self):
+        first = ChunkSoundInputStub([pcm(1, 2)])
+        second = ChunkSoundInputStub([pcm(10, 20)])
+        mixer = MicrophoneMixer([first, second], sample_rate=16000, channel_tagging=True)
+
+        self.assertEqual(await self._collect(mixer), pcm(1, 10, 2, 20))
+        self.assertEqual(mixer.channels, 2)
+
+    async def test_pads_a_stalled_input_with_silence(self):
+        talking = ChunkSoundInputStub([pcm(*range(1, 11))])
+        silent = ChunkSoundInputStub([])
+        mixer = MicrophoneMixer([talking, silent], sample_rate=8, max_skew_seconds=0.5)
+
+        self.assertEqual(await self._collect(mixer), pcm(*range(1, 11)))
+        self.assertEqual(mixer.padded_bytes, 20)
+
+    def test_stop_audio_stream_stops_every_input(self):
+        inputs = [ChunkSoundInputStub([]), ChunkSoundInputStub([])]
+
+        MicrophoneMixer(inputs, sample_rate=16000).stop_audio_stream()
+
+        self.assertTrue(all(sound_input.stop_called for sound_input in inputs))
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -53,6 +55,30 @@ class TestMumbleClient(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(self.mock_mumble.sound_output.add_sound.call_count, 2)
 
+    async def test_waiting_streams_do_not_block_other_clients(self):
+        with patch('sound_outputs.mumble.Mumble'):
+            clients = [MumbleClient(self.output_settings, language) for language in ('de', 'en', 'de')]
+        for client in clients:
+            client._mumble = MagicMock()
+        release = threading.Event()
+
+        def waiting_stream():  # TTS still synthesizing the first bytes
+            stream = MagicMock(spec=StreamingBody)
+            stream.read.side_effect = lambda amt: release.wait(5) and b''
+            return stream
+
+        waiting_tasks = [asyncio.create_task(client.play(waiting_stream())) for client in clients[:2]]
+        await asyncio.sleep(0.05)  # The waiting reads occupy their threads first
+        ready = MagicMock(spec=StreamingBody)
+        ready.read.side_effect = [b'data', b'']
+        try:
+            # play() swallows its cancellation, so a timeout shows as audio that was not sent yet
+            await asyncio.wait_for(clients[2].play(ready), 1.0)
+            clients[2]._mumble.sound_output.add_sound.assert_called_once_with(b'data')
+        finally:
+            release.set()
+            await asyncio.gather(*waiting_tasks)
+
     async def test_play_sound_output_not_init(self):
         mock_output = MagicMock(spec=StreamingBody)
         mock_output.read.side_effect = [b'data1', b'']
@@ -61,6 +87,15 @@ class TestMumbleClient(unittest.IsolatedAsyncioTestCase):
         await self.client.play(mock_output)
         # Should not crash, just log warning
 
+    async def test_wait_until_played_waits_for_unsent_buffer(self):
+        self.mock_mumble.sound_output = MagicMock()
+        self.mock_mumble.sound_output.get_buffer_size.side_effect = [0.04, 0.02, 0.0]
+
+        with patch.object(MumbleClient, 'drain_poll_interval', 0):
+            await self.client.wait_until_played()
+
+        self.assertEqual(self.mock_mumble.sound_output.get_buffer_size.call_count, 3)
+
     def test_connect_with_single_channel(self):
         self.mock_mumble.connected = PYMUMBLE_CONN_STATE_CONNECTED
         self.client._channel_name = 'SingleChannel'
@@ -94,3 +129,58 @@ class TestMumbleClient(unittest.IsolatedAsyncioTestCase):
         self.client.stop_audio_stream()
 
         self.mock_mumble.stop.assert_called_once()
+
+    def test_connect_mirrors_the_audio_to_further_channels(self):
+        self.mumble_settings.mirror_channel_mapping = {'de': ['Lobby', 'Main/German-2']}
+        with patch('sound_outputs.mumble.Mumble') as mumble_class:
+            client = MumbleClient(self.output_settings, 'de')
+            mirrors = [MagicMock(connected=PYMUMBLE_CONN_STATE_CONNECTED) for _ in range(2)]
+            mumble_class.side_effect = mirrors
+            client._mumble.connected = PYMUMBLE_CONN_STATE_CONNECTED
+
+            client.connect()
+
+        self.assertEqual(
+            [c.kwargs['user'] for c in mumble_class.call_args_list[1:]], ['de_2_ai_translator', 'de_3_ai_translator']
+        )
+        mirrors[0].channels.find_by_name.assert_called_with('Lobby')
+        mirrors[1].channels.find_by_tree.assert_called_with(['Main', 'German-2'])
+        client._mumble.sound_output.add_destination.assert_any_call(mirrors[0])
+        client._mumble.sound_output.add_destination.assert_any_call(mirrors[1])
+        self.assertEqual(client.metrics()['mirror_connections'], 2)
+
+        client.stop_audio_stream()
+
+        for mirror in mirrors:
+            mirror.stop.assert_called_once()
+
+    def test_connect_skips_a_mirror_that_cannot_connect(self):
+        self.mumble_settings.mirror_channel_mapping = {'de': ['Lobby']}
+        with patch('sound_outputs.mumble.Mumble') as mumble_class:
+            client = MumbleClient(self.output_settings, 'de')
+            mirror = MagicMock(connected=PYMUMBLE_CONN_STATE_NOT_CONNECTED)
+            mumble_class.side_effect = [mirror]
+            client._mumble.connected = PYMUMBLE_CONN_STATE_CONNECTED
+
+            client.connect()
+
+        mirror.stop.assert_called_once()
+        client._mumble.sound_output.add_destination.assert_not_called()
+        client._mumble.channels.find_by_tree.return_value.move_in.assert_called_once()
+
+    def test_metrics_include_packet_pacing(self):
+        self.mock_mumble.sound_output = MagicMock()
+        self.mock_mumble.sound_output.get_buffer_size.return_value = 0.04
+        self.mock_mumble.sound_output.sender.stats = {'packets': 50, 'late': 2, 'max_drift': 0.008}
+
+        metrics = self.client.metrics()
+
+        self.assertEqual(metrics['sent_packets'], 50)
+        self.assertEqual(metrics['sent_late_packets'], 2)
+        self.assertEqual(metrics['max_packet_drift_seconds'], 0.008)
+        self.assertEqual(metrics['buffered_seconds'], 0.04)
+
+    def test_metrics_without_sound_output(self):
+        self.mock_mumble.sound_output = None
+
+        self.assertEqual(self.client.metrics(), {'buffered_seconds': 0.0, 'sent_bytes': 0})
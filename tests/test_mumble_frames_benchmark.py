@@ -0,0 +1,16 @@
+import unittest
+
+from benchmarks.mumble_frames import measure
+
+
+class TestMumbleFramesBenchmark(unittest.TestCase):
+    def test_sends_every_frame_of_the_burst(self):
+        result = measure(2.0, encoder='null')
+
+        self.assertEqual(result.frames, 100)  # 20 ms frames
+        self.assertGreater(result.frames_per_second, 0)
+
+    def test_partial_last_frame_is_sent(self):
+        result = measure(0.05, chunk_bytes=300, encoder='null')
+
+        self.assertEqual(result.frames, 3)
@@ -0,0 +1,15 @@
+import unittest
+
+from benchmarks.ocb2_crypto import check_test_vectors, measure
+
+
+class TestOcb2Benchmark(unittest.TestCase):
+    def test_implementation_matches_test_vectors(self):
+        check_test_vectors()
+
+    def test_measures_encrypt_and_decrypt_rates(self):
+        result = measure(128, 200)
+
+        self.assertEqual(result.packets, 200)
+        self.assertGreater(result.encrypt_per_second, 0)
+        self.assertGreater(result.decrypt_per_second, 0)
@@ -0,0 +1,34 @@
+import unittest
+
+from utils.pcm_ring_buffer import PcmRingBuffer
+
+
+class TestPcmRingBuffer(unittest.TestCase):
+    def test_reads_written_data_in_order(self):
+        ring_buffer = PcmRingBuffer(8)
+
+        ring_buffer.write(b'\x01\x02')
+        ring_buffer.write(memoryview(b'\x03\x04'))
+
+        self.assertEqual(ring_buffer.available, 4)
+        self.assertEqual(ring_buffer.read(3), b'\x01\x02\x03')
+        self.assertEqual(ring_buffer.read(10), b'\x04')
+        self.assertEqual(ring_buffer.available, 0)
+
+    def test_wraps_around_the_end_of_the_buffer(self):
+        ring_buffer = PcmRingBuffer(6)
+        ring_buffer.write(b'abcd')
+        ring_buffer.read(4)
+
+        self.assertTrue(ring_buffer.write(b'efghij'))
+
+        self.assertEqual(ring_buffer.read(6), b'efghij')
+
+    def test_drops_and_counts_writes_that_do_not_fit(self):
+        ring_buffer = PcmRingBuffer(4)
+
+        self.assertTrue(ring_buffer.write(b'abc'))
+        self.assertFalse(ring_buffer.write(b'de'))
+
+        self.assertEqual((ring_buffer.overruns, ring_buffer.overrun_bytes), (1, 2))
+        self.assertEqual(ring_buffer.read(4), b'abc')
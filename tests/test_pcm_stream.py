@@ -0,0 +1,65 @@
+import threading
+import unittest
+
+from utils.pcm_stream import PcmStream
+
+
+class TestPcmStream(unittest.TestCase):
+    def test_read_returns_fed_audio_and_eof_after_finish(self):
+        stream = PcmStream()
+        stream.feed(b'\x01\x02\x03\x04')
+        stream.finish()
+
+        self.assertEqual(stream.read(2), b'\x01\x02')
+        self.assertEqual(stream.read(10), b'\x03\x04')
+        self.assertEqual(stream.read(10), b'')
+
+    def test_read_blocks_until_chunk_is_complete(self):
+        stream = PcmStream()
+        result = {}
+
+        reader = threading.Thread(target=lambda: result.setdefault('data', stream.read(4)))
+        reader.start()
+        stream.feed(b'\x01\x02')
+        reader.join(timeout=0.05)
+        self.assertTrue(reader.is_alive())
+
+        stream.feed(b'\x03\x04\x05\x06')
+        reader.join(timeout=1)
+
+        self.assertEqual(result['data'], b'\x01\x02\x03\x04')
+
+    def test_read_without_amount_waits_for_finish(self):
+        stream = PcmStream()
+        stream.feed(b'\x01\x02')
+        stream.feed(b'\x03\x04')
+        stream.finish()
+
+        self.assertEqual(stream.read(), b'\x01\x02\x03\x04')
+
+    def test_records_latency_and_notifies_on_playback_start(self):
+        started = []
+        stream = PcmStream(on_playback_start=started.append)
+        self.assertIsNone(stream.time_to_first_byte)
+        self.assertIsNone(stream.time_to_playback)
+        self.assertIsNone(stream.first_byte_to_playback)
+
+        stream.feed(b'\x01\x02')
+        stream.finish()
+        stream.read(2)
+        stream.read(2)
+
+        self.assertEqual(started, [stream])
+        self.assertGreaterEqual(stream.time_to_first_byte, 0)
+        self.assertGreaterEqual(stream.time_to_playback, stream.time_to_first_byte)
+        self.assertAlmostEqual(
+            stream.first_byte_to_playback, stream.time_to_playback - stream.time_to_first_byte, places=6
+        )
+
+    def test_close_discards_buffer_and_ignores_further_audio(self):
+        stream = PcmStream()
+        stream.feed(b'\x01\x02')
+        stream.close()
+        stream.feed(b'\x03\x04')
+
+        self.assertEqual(stream.read(2), b'')
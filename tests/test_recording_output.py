@@ -0,0 +1,48 @@
+import tempfile
+import time
+import unittest
+import wave
+from pathlib import Path
+
+from config.model.config_models import MumbleSettings, OutputSettings, SpeakerSettings
+from sound_outputs.recording_output import RecordingOutput
+from utils.pcm_stream import PcmStream
+
+
+class TestRecordingOutput(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.output_settings = OutputSettings(None, 8000, 400, SpeakerSettings(None, None), MumbleSettings('', 0, {}))
+
+    @staticmethod
+    def _stream(audio):
+        pcm_stream = PcmStream()
+        pcm_stream.feed(audio)
+        pcm_stream.finish()
+        return pcm_stream
+
+    async def test_records_played_streams_to_wav(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / 'en-US.wav')
+            output = RecordingOutput(self.output_settings, path)
+
+            await output.play(self._stream(b'\x01\x00' * 1000))
+            await output.play(self._stream(b'\x02\x00' * 600))
+            output.stop_audio_stream()
+
+            with wave.open(path, 'rb') as wav:
+                self.assertEqual((wav.getnchannels(), wav.getsampwidth(), wav.getframerate()), (1, 2, 8000))
+                self.assertEqual(wav.readframes(2000), b'\x01\x00' * 1000 + b'\x02\x00' * 600)
+        self.assertEqual(output.metrics(), {'played_streams': 2, 'played_seconds': 0.2})
+
+    async def test_realtime_playback_takes_as_long_as_the_audio(self):
+        output = RecordingOutput(self.output_settings, realtime=True)
+        self.addCleanup(output.stop_audio_stream)
+
+        started_at = time.perf_counter()
+        await output.play(self._stream(b'\x00\x00' * 800))  # 100 ms
+
+        self.assertGreaterEqual(time.perf_counter() - started_at, 0.09)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.fake_providers import LatencyModel
+from benchmarks.replay import Percentiles, ReplayOptions, replay, write_synthetic_recording
+
+
+class TestReplayBenchmark(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.recording = str(Path(self.temp_dir.name) / 'synthetic.wav')
+        write_synthetic_recording(self.recording, 8.0)
+
+    async def _replay(self, provider):
+        options = ReplayOptions(self.recording, provider, ['en-US', 'fr-FR'], speed=0, realtime_playback=False)
+        return await replay(options)
+
+    async def test_replays_recording_through_aws_translator(self):
+        report = await self._replay('aws')
+
+        self.assertGreater(report.utterances, 0)
+        self.assertEqual(report.stages['end_to_end'].count, 2 * report.utterances)
+        self.assertEqual(report.sentences['fr-FR'], {'played': report.utterances})
+        self.assertAlmostEqual(report.audio_seconds, 8.0)
+
+    async def test_replays_recording_through_google_translator(self):
+        report = await self._replay('google')
+
+        self.assertGreater(report.utterances, 0)
+        self.assertEqual(report.stages['translate'].count, 2 * report.utterances)
+        self.assertEqual(report.sentences['en-US'], {'played': report.utterances})
+
+
+class TestLatencyModel(unittest.TestCase):
+    def test_samples_are_deterministic_per_seed(self):
+        first = LatencyModel.parse('0.2:0.5', seed=3)
+        second = LatencyModel.parse('0.2:0.5', seed=3)
+
+        self.assertEqual([first.sample() for _ in range(5)], [second.sample() for _ in range(5)])
+        self.assertEqual(LatencyModel.parse('0.2').sample(), 0.2)
+
+
+class TestPercentiles(unittest.TestCase):
+    def test_nearest_rank_percentiles(self):
+        percentiles = Percentiles.of([float(value) for value in range(1, 101)])
+
+        self.assertEqual(
+            (percentiles.p50, percentiles.p90, percentiles.p99, percentiles.max), (50.0, 90.0, 99.0, 100.0)
+        )
+        self.assertEqual(Percentiles.of([]).count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
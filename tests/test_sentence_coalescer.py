@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+
+from config.model.config_models import QueueSettings
+from translators.sentence_coalescer import SentenceCoalescer
+
+
+class TestSentenceCoalescer(unittest.IsolatedAsyncioTestCase):
+    def _build(self, window=0.02, max_chars=30):
+        self.forwarded = []
+        settings = QueueSettings(coalesce_window_seconds=window, coalesce_max_chars=max_chars)
+        return SentenceCoalescer(self.forwarded.append, settings, language_count=3)
+
+    async def test_forwards_immediately_when_disabled(self):
+        coalescer = self._build(window=0.0)
+
+        coalescer.submit('Ja.')
+        coalescer.submit('Okay.')
+
+        self.assertEqual(self.forwarded, ['Ja.', 'Okay.'])
+        self.assertEqual(coalescer.stats.calls_saved, 0)
+
+    async def test_merges_short_transcripts_within_the_window(self):
+        coalescer = self._build()
+
+        coalescer.submit('Ja.')
+        coalescer.submit('Okay.')
+        coalescer.submit('Also,')
+        self.assertEqual(self.forwarded, [])
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.forwarded, ['Ja. Okay. Also,'])
+        self.assertEqual((coalescer.stats.transcripts, coalescer.stats.requests), (3, 1))
+        self.assertEqual(coalescer.stats.calls_saved, 2 * 2 * 3)
+
+    async def test_flushes_when_the_character_budget_is_exceeded(self):
+        coalescer = self._build(max_chars=12)
+
+        coalescer.submit('Ja.')
+        coalescer.submit('Okay.')
+        coalescer.submit('Also gut.')
+
+        self.assertEqual(self.forwarded, ['Ja. Okay.'])
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.forwarded, ['Ja. Okay.', 'Also gut.'])
+
+    async def test_long_transcript_is_forwarded_after_held_back_text(self):
+        coalescer = self._build(max_chars=20)
+
+        coalescer.submit('Ja.')
+        coalescer.submit('Das ist ein sehr langer Satz.')
+
+        self.assertEqual(self.forwarded, ['Ja.', 'Das ist ein sehr langer Satz.'])
+
+    async def test_cancel_discards_held_back_text(self):
+        coalescer = self._build()
+
+        coalescer.submit('Ja.')
+        coalescer.cancel()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.forwarded, [])
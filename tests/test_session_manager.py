@@ -0,0 +1,70 @@
+import asyncio
+import time
+import unittest
+
+from controllers.session_manager import TranslationSessionManager
+from translation import Translation
+
+from .stubs import SoundInputStub, SoundOutputStub, TranslatorStub
+
+
+class RunningTranslatorStub(TranslatorStub):
+    def __init__(self):
+        super().__init__()
+        self.loop = None
+
+    async def start_translation(self, language_to_output, mic_stream, shutdown_event):
+        self.loop = asyncio.get_running_loop()
+        await shutdown_event.wait()
+
+    def metrics(self):
+        return {'queues': {}}
+
+
+class TestTranslationSessionManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = TranslationSessionManager()
+        self.addCleanup(self.manager.close)
+
+    def _start(self, session_id):
+        translator, sound_input, output = RunningTranslatorStub(), SoundInputStub(), SoundOutputStub()
+        translation = Translation(translator, sound_input, {'en-US': output}, stop_outputs=False)
+        self.manager.start_session(session_id, translation)
+        return translator, sound_input, output
+
+    def _wait_until_running(self, *translators):
+        for _ in range(100):
+            if all(translator.loop is not None for translator in translators):
+                return
+            time.sleep(0.01)
+        self.fail('Translation sessions did not start.')
+
+    def test_sessions_share_one_event_loop(self):
+        german, _, _ = self._start('de')
+        english, _, _ = self._start('en')
+        self._wait_until_running(german, english)
+
+        self.assertIs(german.loop, english.loop)
+        metrics = self.manager.metrics()
+        self.assertEqual(sorted(metrics), ['de', 'en'])
+        self.assertTrue(metrics['de'].running)
+        self.assertEqual(metrics['de'].translator, {'queues': {}})
+
+    def test_stop_session_keeps_other_sessions_and_shared_outputs_running(self):
+        german, german_input, german_output = self._start('de')
+        english, _, _ = self._start('en')
+        self._wait_until_running(german, english)
+
+        self.manager.stop_session('de')
+
+        self.assertTrue(german_input.stop_called)
+        self.assertFalse(german_output.stop_called)
+        self.assertEqual(self.manager.session_ids, ['en'])
+        self.assertTrue(self.manager.metrics()['en'].running)
+
+    def test_rejects_a_second_session_with_the_same_id(self):
+        translator, _, _ = self._start('de')
+        self._wait_until_running(translator)
+
+        with self.assertRaises(ValueError):
+            self._start('de')
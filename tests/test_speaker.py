@@ -87,6 +87,17 @@ class TestSpeaker(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(mock_stream.stop_stream.called)
         self.assertFalse(mock_stream.close.called)
 
+    async def test_wait_until_played_returns_after_queued_audio_was_played(self):
+        mock_output_stream = MagicMock(spec=StreamingBody)
+        mock_output_stream.read.side_effect = [b'data', b'']
+        self.mock_pa_instance.open.return_value = MagicMock()
+
+        await self.speaker.play(mock_output_stream)
+        await self.speaker.wait_until_played()
+
+        self.assertTrue(self.speaker._queue.empty())
+        self.assertEqual(mock_output_stream.read.call_count, 2)
+
     async def test_play_already_playing(self):
         self.speaker._is_playing = True
 
@@ -0,0 +1,54 @@
+import unittest
+
+from translators.speculation import ClauseSegmenter, SpeculationStats
+
+
+class TestClauseSegmenter(unittest.TestCase):
+    def setUp(self):
+        self.stats = SpeculationStats()
+        self.segmenter = ClauseSegmenter(self.stats)
+
+    def test_commits_clause_once_two_hypotheses_agree(self):
+        self.assertEqual(self.segmenter.update('Guten Morgen liebe Gäste, heute'), [])
+        self.assertEqual(
+            self.segmenter.update('Guten Morgen liebe Gäste, heute sprechen'), ['Guten Morgen liebe Gäste,']
+        )
+        self.assertEqual(self.segmenter.update('Guten Morgen liebe Gäste, heute sprechen wir'), [])
+        self.assertEqual(self.stats.dispatched, 1)
+
+    def test_high_stability_commits_without_agreement(self):
+        self.assertEqual(
+            self.segmenter.update('Guten Morgen liebe Gäste, heute', stability=0.95), ['Guten Morgen liebe Gäste,']
+        )
+
+    def test_does_not_commit_trailing_or_short_clauses(self):
+        self.segmenter.update('Ja, gut. Danke')
+        self.assertEqual(self.segmenter.update('Ja, gut. Danke'), [])
+        self.segmenter.update('Das war es schon.')
+        self.assertEqual(self.segmenter.update('Das war es schon.'), [])
+
+    def test_finalize_returns_only_the_unspoken_suffix(self):
+        self.segmenter.update('Guten Morgen liebe Gäste, heute')
+        self.segmenter.update('Guten Morgen liebe Gäste, heute sprechen')
+
+        suffix = self.segmenter.finalize('Guten Morgen, liebe Gäste, heute sprechen wir über Latenz.')
+
+        self.assertEqual(suffix, 'heute sprechen wir über Latenz.')
+        self.assertEqual(self.stats.reused, 1)
+        self.assertEqual(self.stats.final_suffixes, 1)
+
+    def test_finalize_counts_diverged_clauses_as_wasted(self):
+        self.segmenter.update('Guten Morgen liebe Gäste, heute')
+        self.segmenter.update('Guten Morgen liebe Gäste, heute sprechen')
+
+        suffix = self.segmenter.finalize('Guten Abend liebe Gäste, heute sprechen wir.')
+
+        self.assertEqual(suffix, 'Guten Abend liebe Gäste, heute sprechen wir.')
+        self.assertEqual(self.stats.wasted, 1)
+
+    def test_finalize_resets_state_for_next_utterance(self):
+        self.segmenter.update('Guten Morgen liebe Gäste, heute')
+        self.segmenter.update('Guten Morgen liebe Gäste, heute sprechen')
+        self.segmenter.finalize('Guten Morgen liebe Gäste, heute sprechen wir.')
+
+        self.assertEqual(self.segmenter.finalize('Neuer Satz.'), 'Neuer Satz.')
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from config.model.config_models import CacheSettings
+from translators.speech_cache import SpeechCache
+
+
+class TestSpeechCache(unittest.TestCase):
+    def test_key_depends_on_all_voice_parameters(self):
+        key = SpeechCache.make_key('aws', 'Joanna', 'neural', 16000, 'Thank you')
+
+        self.assertEqual(key, SpeechCache.make_key('aws', 'Joanna', 'neural', 16000, ' Thank you '))
+        self.assertNotEqual(key, SpeechCache.make_key('aws', 'Joanna', 'standard', 16000, 'Thank you'))
+        self.assertNotEqual(key, SpeechCache.make_key('aws', 'Joanna', 'neural', 22050, 'Thank you'))
+        self.assertNotEqual(key, SpeechCache.make_key('google', 'Joanna', 'neural', 16000, 'Thank you'))
+
+    def test_memory_tier_evicts_least_recently_used_audio(self):
+        cache = SpeechCache(max_memory_bytes=8)
+        cache.put('a', b'\x00' * 4)
+        cache.put('b', b'\x01' * 4)
+        cache.get('a')
+        cache.put('c', b'\x02' * 4)
+
+        self.assertEqual(cache.get('a'), b'\x00' * 4)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_disk_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SpeechCache(max_memory_bytes=1024, max_disk_bytes=1024, cache_dir=Path(tmp))
+            cache.put('thanks', b'\x01\x02\x03\x04')
+
+            restored = SpeechCache(max_memory_bytes=1024, max_disk_bytes=1024, cache_dir=Path(tmp))
+
+            self.assertEqual(restored.get('thanks'), b'\x01\x02\x03\x04')
+            self.assertEqual(len(restored), 1)
+
+    def test_disk_tier_evicts_oldest_files_beyond_size_limit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SpeechCache(max_memory_bytes=0, max_disk_bytes=8, cache_dir=Path(tmp))
+            cache.put('a', b'\x00' * 4)
+            cache.put('b', b'\x01' * 4)
+            cache.put('c', b'\x02' * 4)
+
+            self.assertEqual(sorted(os.listdir(tmp)), ['b.pcm', 'c.pcm'])
+            self.assertIsNone(cache.get('a'))
+            self.assertEqual(cache.get('b'), b'\x01' * 4)
+
+    def test_default_settings_keep_speech_in_memory_only(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SpeechCache.from_settings(CacheSettings(), Path(tmp))
+            cache.put('thanks', b'\x01\x02')
+
+            self.assertEqual(cache.get('thanks'), b'\x01\x02')
+            self.assertEqual(os.listdir(tmp), [])
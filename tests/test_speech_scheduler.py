@@ -0,0 +1,178 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from config.model.config_models import QueueSettings
+from translators.speech_scheduler import PreparedSpeech, SpeechScheduler
+from utils.pcm_stream import PcmStream
+from utils.utterance_trace import UtteranceTracer
+
+
+class TestSpeechScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_processes_sentences_in_order_per_language(self):
+        process = AsyncMock()
+        scheduler = SpeechScheduler(['en-US', 'fr-FR'], process, QueueSettings())
+        scheduler.start()
+
+        scheduler.submit('Erster Satz.')
+        scheduler.submit('Zweiter Satz.')
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        calls = [call.args for call in process.await_args_list]
+        self.assertEqual([text for text, language in calls if language == 'en-US'], ['Erster Satz.', 'Zweiter Satz.'])
+        self.assertEqual([text for text, language in calls if language == 'fr-FR'], ['Erster Satz.', 'Zweiter Satz.'])
+        self.assertEqual(scheduler.stats['en-US'].processed, 2)
+
+    async def test_drop_oldest_policy_keeps_the_newest_sentences(self):
+        process = AsyncMock()
+        scheduler = SpeechScheduler(['en-US'], process, QueueSettings(max_queue_size=2, overflow_policy='drop_oldest'))
+
+        for text in ('Eins.', 'Zwei.', 'Drei.'):
+            scheduler.submit(text)
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        self.assertEqual([call.args[0] for call in process.await_args_list], ['Zwei.', 'Drei.'])
+        self.assertEqual(scheduler.stats['en-US'].dropped, 1)
+        self.assertEqual(scheduler.stats['en-US'].max_queue_depth, 2)
+
+    async def test_merge_policy_appends_to_the_newest_waiting_sentence(self):
+        process = AsyncMock()
+        scheduler = SpeechScheduler(['en-US'], process, QueueSettings(max_queue_size=2, overflow_policy='merge'))
+
+        for text in ('Eins.', 'Zwei.', 'Drei.'):
+            scheduler.submit(text)
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        self.assertEqual([call.args[0] for call in process.await_args_list], ['Eins.', 'Zwei. Drei.'])
+        self.assertEqual(scheduler.stats['en-US'].merged, 1)
+
+    async def test_merge_policy_drops_oldest_sentence_beyond_merge_limit(self):
+        process = AsyncMock()
+        settings = QueueSettings(max_queue_size=1, overflow_policy='merge', max_merge_chars=12)
+        scheduler = SpeechScheduler(['en-US'], process, settings)
+
+        for text in ('Eins.', 'Zwei.', 'Drei.'):
+            scheduler.submit(text)
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        self.assertEqual([call.args[0] for call in process.await_args_list], ['Drei.'])
+        self.assertEqual((scheduler.stats['en-US'].merged, scheduler.stats['en-US'].dropped), (1, 1))
+
+    async def test_traces_played_and_dropped_sentences(self):
+        pcm_stream = PcmStream()
+        pcm_stream.feed(b'\x00\x00')
+        pcm_stream.finish()
+        pcm_stream.read(2)
+        process = AsyncMock(return_value=PreparedSpeech(pcm_stream))
+        tracer = UtteranceTracer()
+        settings = QueueSettings(max_queue_size=1, overflow_policy='drop_oldest')
+        scheduler = SpeechScheduler(['en-US'], process, settings, AsyncMock(), tracer=tracer)
+
+        scheduler.submit('Eins.')
+        scheduler.submit('Zwei.')
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        dropped, played = tracer.traces
+        self.assertEqual((dropped.text, dropped.languages['en-US'].status), ('Eins.', 'dropped'))
+        self.assertEqual((played.text, played.languages['en-US'].status), ('Zwei.', 'played'))
+        self.assertIsNotNone(played.languages['en-US'].playback_end)
+        self.assertIsNotNone(played.latency('en-US'))
+
+    async def test_waits_for_playback_before_preparing_beyond_the_pipeline_depth(self):
+        played = asyncio.Event()
+        process = AsyncMock()
+
+        async def play(_speech, _language):
+            await played.wait()
+
+        stats = {}
+        scheduler = SpeechScheduler(['en-US'], process, QueueSettings(pipeline_depth=2), play, stats)
+        scheduler.start()
+
+        for text in ('Eins.', 'Zwei.', 'Drei.'):
+            scheduler.submit(text)
+        await asyncio.sleep(0.01)
+        self.assertEqual(process.await_count, 2)
+        self.assertEqual((stats['en-US'].queue_depth, stats['en-US'].in_flight), (1, 2))
+
+        played.set()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        self.assertEqual(process.await_count, 3)
+        self.assertIs(stats['en-US'], scheduler.stats['en-US'])
+
+    async def test_plays_in_submission_order_when_a_later_sentence_is_prepared_first(self):
+        delays = {'Langsam.': 0.05, 'Schnell.': 0.0}
+        played = []
+
+        async def prepare(text, _language):
+            await asyncio.sleep(delays[text])
+            return text
+
+        async def play(speech, _language):
+            played.append(speech)
+
+        scheduler = SpeechScheduler(['en-US'], prepare, QueueSettings(), play)
+        scheduler.start()
+
+        scheduler.submit('Langsam.')
+        scheduler.submit('Schnell.')
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+
+        self.assertEqual(played, ['Langsam.', 'Schnell.'])
+
+    async def test_stop_cancels_speech_that_was_prepared_but_not_played(self):
+        speech = MagicMock()
+        never_played = asyncio.Event()
+
+        async def play(_speech, _language):
+            await never_played.wait()
+
+        scheduler = SpeechScheduler(['en-US'], AsyncMock(return_value=speech), QueueSettings(), play)
+        scheduler.start()
+
+        scheduler.submit('Eins.')
+        scheduler.submit('Zwei.')
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        self.assertEqual(speech.cancel.call_count, 2)
+
+    async def test_skip_lagging_policy_discards_stale_sentences(self):
+        process = AsyncMock()
+        settings = QueueSettings(max_queue_size=4, overflow_policy='skip_lagging', max_lag_seconds=5.0)
+        scheduler = SpeechScheduler(['en-US'], process, settings)
+
+        with patch('translators.speech_scheduler.time.monotonic', return_value=time.monotonic() - 10.0):
+            scheduler.submit('Veraltet.')
+        scheduler.submit('Aktuell.')
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        self.assertEqual([call.args[0] for call in process.await_args_list], ['Aktuell.'])
+        self.assertEqual(scheduler.stats['en-US'].skipped, 1)
+
+    async def test_failing_sentence_does_not_stop_the_worker(self):
+        process = AsyncMock(side_effect=[RuntimeError('TTS failed'), None])
+        scheduler = SpeechScheduler(['en-US'], process, QueueSettings())
+        scheduler.start()
+
+        scheduler.submit('Eins.')
+        scheduler.submit('Zwei.')
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        self.assertEqual(process.await_count, 2)
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -19,11 +20,37 @@ class TestTranslation(unittest.IsolatedAsyncioTestCase):
             target_language_mapping=self.target_mapping,
         )
 
+    def test_output_owns_its_playback_lock(self):
+        lock = self.stub_sound_output.playback_lock
+
+        self.assertIsInstance(lock, asyncio.Lock)
+        self.assertIs(self.stub_sound_output.playback_lock, lock)
+        self.assertIsNot(SoundOutputStub().playback_lock, lock)
+
     def test_init(self):
         self.assertEqual(self.translation._translator, self.mock_translator)
         self.assertEqual(self.translation._sound_input, self.stub_sound_input)
         self.assertEqual(self.translation._target_language_mapping, self.target_mapping)
 
+    def test_call_in_loop_runs_the_function_in_the_translation_loop(self):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        self.addCleanup(loop.close)
+        self.translation._loop = loop
+        try:
+            called_in = self.translation.call_in_loop(threading.current_thread, timeout=1.0)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(1.0)
+
+        self.assertIs(called_in, thread)
+
+    async def test_call_in_loop_from_the_loop_itself_calls_directly(self):
+        self.translation._loop = asyncio.get_running_loop()
+
+        self.assertEqual(self.translation.call_in_loop(lambda: 42, timeout=0.1), 42)
+
     @patch('asyncio.new_event_loop')
     @patch('asyncio.set_event_loop')
     def test_run_success(self, mock_set_loop, mock_new_loop):
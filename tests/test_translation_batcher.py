@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from translators.translation_batcher import TranslationBatcher
+
+
+class TestTranslationBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_sends_one_request_per_language_for_concurrent_texts(self):
+        translate_batch = AsyncMock(side_effect=lambda texts, language: [f'{language}:{text}' for text in texts])
+        batcher = TranslationBatcher(translate_batch, max_batch_size=10)
+
+        results = await asyncio.gather(
+            batcher.translate('Eins', 'en'),
+            batcher.translate('Zwei', 'en'),
+            batcher.translate('Eins', 'fr'),
+        )
+
+        self.assertEqual(results, ['en:Eins', 'en:Zwei', 'fr:Eins'])
+        self.assertCountEqual(
+            [call.args for call in translate_batch.await_args_list], [(['Eins', 'Zwei'], 'en'), (['Eins'], 'fr')]
+        )
+        self.assertEqual((batcher.stats.batches, batcher.stats.texts, batcher.stats.requests_saved), (2, 3, 1))
+
+    async def test_splits_batches_and_deduplicates_texts(self):
+        translate_batch = AsyncMock(side_effect=lambda texts, _language: [text.upper() for text in texts])
+        batcher = TranslationBatcher(translate_batch, max_batch_size=2)
+
+        results = await asyncio.gather(*(batcher.translate(text, 'en') for text in ('a', 'a', 'b')))
+
+        self.assertEqual(results, ['A', 'A', 'B'])
+        self.assertEqual([call.args[0] for call in translate_batch.await_args_list], [['a'], ['b']])
+
+    async def test_failed_request_raises_for_every_text_of_the_batch(self):
+        batcher = TranslationBatcher(AsyncMock(side_effect=RuntimeError('quota')), max_batch_size=10)
+
+        results = await asyncio.gather(
+            batcher.translate('Eins', 'en'), batcher.translate('Zwei', 'en'), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(batcher.stats.batches, 0)
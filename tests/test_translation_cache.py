@@ -0,0 +1,74 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from config.model.config_models import CacheSettings
+from translators.translation_cache import TranslationCache
+
+
+class TestTranslationCache(unittest.TestCase):
+    def test_get_returns_cached_translation_and_counts_hits(self):
+        cache = TranslationCache(max_entries=10, ttl_seconds=60)
+
+        self.assertIsNone(cache.get('de-DE', 'en-US', 'Danke'))
+        cache.put('de-DE', 'en-US', 'Danke', 'Thank you')
+
+        self.assertEqual(cache.get('de-DE', 'en-US', ' Danke '), 'Thank you')
+        self.assertIsNone(cache.get('de-DE', 'fr-FR', 'Danke'))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertAlmostEqual(cache.hit_rate, 1 / 3)
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = TranslationCache(max_entries=2, ttl_seconds=60)
+        cache.put('de', 'en', 'eins', 'one')
+        cache.put('de', 'en', 'zwei', 'two')
+        cache.get('de', 'en', 'eins')
+        cache.put('de', 'en', 'drei', 'three')
+
+        self.assertEqual(cache.get('de', 'en', 'eins'), 'one')
+        self.assertIsNone(cache.get('de', 'en', 'zwei'))
+        self.assertEqual(len(cache), 2)
+
+    def test_expired_entries_are_not_returned(self):
+        cache = TranslationCache(max_entries=10, ttl_seconds=60)
+        with patch('translators.translation_cache.time.time', return_value=1000.0):
+            cache.put('de', 'en', 'Danke', 'Thank you')
+        with patch('translators.translation_cache.time.time', return_value=1061.0):
+            self.assertIsNone(cache.get('de', 'en', 'Danke'))
+        self.assertEqual(len(cache), 0)
+
+    def test_persisted_cache_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = CacheSettings(persist_translation_cache=True)
+            cache = TranslationCache.from_settings(settings, Path(tmp), 'aws')
+            cache.put('de', 'en', 'Nächste Folie', 'Next slide')
+            cache.save()
+
+            restored = TranslationCache.from_settings(settings, Path(tmp), 'aws')
+
+            self.assertTrue((Path(tmp) / 'translations-aws.json').exists())
+            self.assertEqual(restored.get('de', 'en', 'Nächste Folie'), 'Next slide')
+
+    def test_cache_without_persistence_does_not_write_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = TranslationCache.from_settings(CacheSettings(), Path(tmp), 'google')
+            cache.put('de', 'en', 'Danke', 'Thank you')
+            cache.save()
+
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+
+    def test_malformed_persist_file_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = CacheSettings(persist_translation_cache=True)
+            persist_path = Path(tmp) / 'translations-aws.json'
+
+            persist_path.write_text('{"not": "a list"}', encoding='utf-8')
+            self.assertEqual(len(TranslationCache.from_settings(settings, Path(tmp), 'aws')), 0)
+
+            persist_path.write_text(
+                f'[["de", "en"], ["de", "en", "Danke", "Thank you", {time.time()}]]', encoding='utf-8'
+            )
+            cache = TranslationCache.from_settings(settings, Path(tmp), 'aws')
+            self.assertEqual(cache.get('de', 'en', 'Danke'), 'Thank you')
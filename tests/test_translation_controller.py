@@ -6,6 +6,7 @@ from config.model.config_models import (
     InputSettings,
     MumbleSettings,
     OutputSettings,
+    SessionSettings,
     SpeakerSettings,
     TranslatorSettings,
     UserConfig,
@@ -24,6 +25,7 @@ class TestTranslationController(unittest.TestCase):
         self.controller.status_label_signal = MagicMock()
         self.controller.start_button_enabled = MagicMock()
         self.controller.stop_button_enabled = MagicMock()
+        self.controller._sessions = MagicMock()
 
         # Dummy config
         self.config = UserConfig(
@@ -41,8 +43,7 @@ class TestTranslationController(unittest.TestCase):
     @patch('controllers.translation_controller.Speaker')
     @patch('controllers.translation_controller.Microphone')
     @patch('controllers.translation_controller.Translation')
-    @patch('controllers.translation_controller.threading.Thread')
-    def test_start_service_success_speaker(self, mock_thread, mock_translation, mock_mic, mock_speaker, mock_aws):
+    def test_start_service_success_speaker(self, mock_translation, mock_mic, mock_speaker, mock_aws):
         # Arrange
         translator_stub = TranslatorStub()
         speaker_stub = SoundOutputStub()
@@ -61,15 +62,42 @@ class TestTranslationController(unittest.TestCase):
         mock_aws.assert_called_once()
         mock_speaker.assert_called_once()
         mock_mic.assert_called_once()
-        mock_translation.assert_called_once_with(translator_stub, microphone_stub, {'de-DE': speaker_stub})
-
-        # Verify thread started
-        mock_thread.assert_called_once_with(
-            target=mock_translation_inst.run, daemon=True, name='TranslationServiceThread'
+        mock_translation.assert_called_once_with(
+            translator_stub, microphone_stub, {'de-DE': speaker_stub}, stop_outputs=False
         )
-        self.assertTrue(mock_thread.return_value.start.called)
+        self.controller._sessions.start_session.assert_called_once_with('main', mock_translation_inst)
         self.controller.status_label_signal.emit.assert_any_call('Status: Running')
 
+    @patch('controllers.translation_controller.AWSTranslator')
+    @patch('controllers.translation_controller.MumbleClient')
+    @patch('controllers.translation_controller.Microphone')
+    @patch('controllers.translation_controller.Translation')
+    def test_additional_sessions_share_outputs_of_common_languages(
+        self, mock_translation, mock_mic, mock_mumble, mock_aws
+    ):
+        self.config.output_settings.output_method = 'mumble'
+        self.config.translator_settings.aws_settings.target_languages = {'en-US': MagicMock(), 'fr-FR': MagicMock()}
+        self.config.additional_sessions = [SessionSettings('english', 'en-US', ['fr-FR'], input_device_index=3)]
+        mumble_clients = {'en-US': MagicMock(), 'fr-FR': MagicMock()}
+        mock_mumble.side_effect = lambda _settings, language: mumble_clients[language]
+
+        self.controller.start_service(self.config)
+
+        english_aws_settings = mock_aws.call_args_list[1].args[0]
+        self.assertEqual(english_aws_settings.source_language, 'en-US')
+        self.assertEqual(list(english_aws_settings.target_languages), ['fr-FR'])
+        self.assertEqual(mock_mic.call_args_list[1].args[0].input_device_index, 3)
+        self.assertEqual(mock_mumble.call_count, 2)
+        self.assertEqual(mock_translation.call_args_list[1].args[2], {'fr-FR': mumble_clients['fr-FR']})
+        started = [call.args[0] for call in self.controller._sessions.start_session.call_args_list]
+        self.assertEqual(started, ['main', 'english'])
+
+    def test_session_config_rejects_unconfigured_target_languages(self):
+        session = SessionSettings('english', 'en-US', ['ja-JP'])
+
+        with self.assertRaises(ValueError):
+            TranslationController._create_session_config(self.config, session)
+
     def test_start_service_unsupported_translator(self):
         self.config.translator_settings.translator = 'unsupported'
 
@@ -87,15 +115,19 @@ class TestTranslationController(unittest.TestCase):
         self.controller.status_label_signal.emit.assert_any_call('Status: Stopping...')
 
     def test_shutdown_and_join_logic(self):
-        mock_translation_inst = MagicMock()
-        mock_thread = MagicMock()
-        mock_thread.is_alive.return_value = True
-
-        self.controller._translation = mock_translation_inst
-        self.controller._translation_thread = mock_thread
+        output = SoundOutputStub()
+        self.controller._outputs = {'de-DE': output}
 
         self.controller._shutdown_and_join()
 
-        mock_translation_inst.stop.assert_called_once()
-        mock_thread.join.assert_called_once_with(timeout=10)
+        self.controller._sessions.stop_all.assert_called_once()
+        self.assertTrue(output.stop_called)
         self.controller.status_label_signal.emit.assert_any_call('Status: Stopped')
+
+    def test_caches_are_rebuilt_when_cache_settings_change(self):
+        first_cache = self.controller._get_translation_cache(self.config, 'aws')
+        self.assertIs(self.controller._get_translation_cache(self.config, 'aws'), first_cache)
+
+        self.config.translator_settings.cache_settings.translation_cache_size = 10
+
+        self.assertIsNot(self.controller._get_translation_cache(self.config, 'aws'), first_cache)
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from utils.pcm_stream import PcmStream
+from utils.utterance_trace import UtteranceTracer
+
+
+class TestUtteranceTracer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.trace_file = Path(self.temp_dir.name) / 'traces.jsonl'
+        self.tracer = UtteranceTracer('main', str(self.trace_file))
+
+    def _played_stream(self):
+        pcm_stream = PcmStream()
+        pcm_stream.feed(b'\x00\x00')
+        pcm_stream.finish()
+        pcm_stream.read(2)
+        return pcm_stream
+
+    def test_records_trace_once_every_language_is_complete(self):
+        trace = self.tracer.start('Hallo.', ['en-US', 'fr-FR'])
+
+        self.tracer.finish(trace, 'en-US', 'played', self._played_stream(), played_at=trace.final_transcript + 1)
+        self.assertEqual(self.tracer.traces, [])
+
+        self.tracer.finish(trace, 'fr-FR', 'dropped')
+
+        self.assertEqual(self.tracer.traces, [trace])
+        record = json.loads(self.trace_file.read_text(encoding='utf-8'))
+        self.assertEqual(record['text'], 'Hallo.')
+        self.assertEqual(record['languages']['fr-FR']['status'], 'dropped')
+        self.assertIsNotNone(record['languages']['en-US']['tts_first_byte'])
+
+    def test_audio_end_is_relative_to_the_stream_start(self):
+        self.tracer.mark_stream_start()
+        self.tracer.mark_audio_end(2.5)
+
+        trace = self.tracer.start('Hallo.', ['en-US'])
+        next_trace = self.tracer.start('Welt.', ['en-US'])
+
+        self.assertAlmostEqual(trace.final_transcript - trace.audio_captured, -2.5, delta=0.5)
+        self.assertIsNone(next_trace.audio_captured)
+
+    def test_latency_summary_uses_played_languages_only(self):
+        for _ in range(2):
+            trace = self.tracer.start('Hallo.', ['en-US', 'fr-FR'])
+            self.tracer.finish(trace, 'en-US', 'played', self._played_stream())
+            self.tracer.finish(trace, 'fr-FR', 'skipped')
+
+        summary = self.tracer.latency_summary()
+
+        self.assertEqual(list(summary), ['en-US'])
+        self.assertEqual(summary['en-US'].count, 2)
+        self.assertGreaterEqual(summary['en-US'].max, summary['en-US'].mean)
+
+
+class TestUtteranceTracerInEventLoop(unittest.IsolatedAsyncioTestCase):
+    async def test_trace_file_is_written_in_a_worker_thread_in_order(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_file = Path(temp_dir) / 'traces.jsonl'
+            tracer = UtteranceTracer('main', str(trace_file))
+
+            with unittest.mock.patch('asyncio.to_thread', wraps=asyncio.to_thread) as to_thread:
+                for text in ('Eins.', 'Zwei.', 'Drei.'):
+                    tracer.finish(tracer.start(text, ['en-US']), 'en-US', 'dropped')
+                await tracer.flush()
+
+            to_thread.assert_called()
+            records = [json.loads(line) for line in trace_file.read_text(encoding='utf-8').splitlines()]
+            self.assertEqual([record['text'] for record in records], ['Eins.', 'Zwei.', 'Drei.'])
@@ -0,0 +1,49 @@
+import asyncio
+import unittest
+
+from config.model.config_models import InputSettings, VadSettings
+from sound_inputs.voice_activity_gate import EnergyVoiceActivityDetector, VoiceActivityGate
+
+from .stubs import ChunkSoundInputStub
+
+SILENCE = b'\x00\x00' * 100
+SPEECH = b'\x00\x40' * 100  # Constant level of 16384, about -6 dBFS
+
+
+class TestVoiceActivityGate(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    def _build(chunks, **vad_overrides):
+        # 1000 samples per second, so a chunk of 100 samples is 100 ms long.
+        vad_settings = VadSettings(enabled=True, hangover_ms=100, pre_roll_ms=200, keepalive_seconds=100.0)
+        for name, value in vad_overrides.items():
+            setattr(vad_settings, name, value)
+        input_settings = InputSettings('mic', 0, 1000, 1, vad_settings=vad_settings)
+        return VoiceActivityGate(ChunkSoundInputStub(chunks), input_settings)
+
+    @staticmethod
+    async def _collect(gate):
+        return [chunk async for chunk in gate.get_audio_stream(asyncio.Event())]
+
+    def test_energy_detector_compares_rms_level_with_threshold(self):
+        detector = EnergyVoiceActivityDetector(threshold_dbfs=-45.0)
+
+        self.assertTrue(detector.is_speech(SPEECH))
+        self.assertFalse(detector.is_speech(SILENCE))
+        self.assertFalse(detector.is_speech(b''))
+
+    async def test_suppresses_silence_but_keeps_pre_roll_and_hangover(self):
+        marker = [bytes([i, 0]) * 100 for i in range(4)]  # Distinguishable silent chunks
+        gate = self._build([marker[0], marker[1], marker[2], SPEECH, marker[3], SILENCE, SILENCE])
+
+        forwarded = await self._collect(gate)
+
+        self.assertEqual(forwarded, [marker[1], marker[2], SPEECH, marker[3]])
+        self.assertEqual(gate.stats.suppressed_bytes, len(marker[0]))
+
+    async def test_forwards_keepalive_chunks_during_long_silence(self):
+        gate = self._build([SILENCE] * 10, keepalive_seconds=0.3, pre_roll_ms=0)
+
+        forwarded = await self._collect(gate)
+
+        self.assertEqual(len(forwarded), 3)
+        self.assertEqual(gate.stats.keepalives, 3)
@@ -0,0 +1,35 @@
+import asyncio
+import unittest
+
+from translators.warmup import WarmupStats, warm_up
+
+
+class TestWarmUp(unittest.IsolatedAsyncioTestCase):
+    async def test_primes_all_languages_in_parallel(self):
+        running = set()
+        overlapped = []
+
+        async def prime(language):
+            running.add(language)
+            await asyncio.sleep(0.01)
+            overlapped.append(len(running))
+            running.discard(language)
+
+        stats = WarmupStats()
+        await warm_up(['en-US', 'fr-FR', 'es-ES'], prime, stats)
+
+        self.assertEqual(max(overlapped), 3)
+        self.assertEqual(stats.languages, 3)
+        self.assertEqual(stats.failures, 0)
+        self.assertGreater(stats.seconds, 0.0)
+
+    async def test_counts_failures_without_raising(self):
+        async def prime(language):
+            if language == 'fr-FR':
+                raise RuntimeError('voice lookup failed')
+
+        stats = WarmupStats()
+        with self.assertLogs('translators.warmup', level='WARNING'):
+            await warm_up(['en-US', 'fr-FR'], prime, stats)
+
+        self.assertEqual(stats.failures, 1)